@@ -0,0 +1,91 @@
+import asyncio
+import random
+import unittest
+
+from turtle_demos.paint_collab import (MAX_MESSAGE_SIZE, MSG_COMMAND, MSG_SNAPSHOT, MSG_WELCOME, RelayServer,
+                                       join, pack_message, read_message, unpack_message)
+from turtle_demos.paint_journal import decode_journal, encode_stroke
+
+
+def random_stroke(rng, count):
+    """A random-walk stroke of `count` points as a journal record."""
+    x, y = rng.uniform(-300, 300), rng.uniform(-300, 300)
+    points = []
+    for _ in range(count):
+        x += rng.uniform(-40, 40)
+        y += rng.uniform(-40, 40)
+        points.append((x, y))
+    return encode_stroke(rng.randrange(5), 5, False, points)
+
+
+class LateJoinTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.relay = RelayServer()
+        self.server = await asyncio.start_server(self.relay.handle_client, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def paint(self, writer, reader, records):
+        """Sends finished strokes and waits until the server has echoed them all."""
+        for stroke_id, record in enumerate(records):
+            writer.write(pack_message(MSG_COMMAND, 0, stroke_id, 0, record))
+        await writer.drain()
+        for _ in records:
+            kind, *_ = unpack_message(await asyncio.wait_for(read_message(reader), 10))
+            self.assertEqual(kind, MSG_COMMAND)
+
+    async def test_join_after_more_than_the_message_cap(self):
+        rng = random.Random(0)
+        reader, writer, _, _, records = await join("127.0.0.1", self.port)
+        self.assertEqual(records, b"")
+        strokes = [random_stroke(rng, 1000) for _ in range(600)]
+        await self.paint(writer, reader, strokes)
+        expected = b"".join(strokes)
+        self.assertGreater(len(expected), MAX_MESSAGE_SIZE)
+
+        late_reader, late_writer, _, seq, records = await join("127.0.0.1", self.port)
+        self.assertEqual(seq, len(strokes))
+        self.assertEqual(records, expected)
+        self.assertEqual(len(decode_journal(records)[0]), len(strokes))
+        self.assertLess(self.relay.stored_size, len(expected)) # Kept compressed
+
+        # Strokes finished after the join reach the late joiner too
+        more = [random_stroke(rng, 100) for _ in range(3)]
+        await self.paint(writer, reader, more)
+        for record in more:
+            kind, _, _, _, payload = unpack_message(await asyncio.wait_for(read_message(late_reader), 10))
+            self.assertEqual((kind, payload), (MSG_COMMAND, record))
+        writer.close()
+        late_writer.close()
+
+    async def test_strokes_during_the_snapshot_follow_it(self):
+        rng = random.Random(1)
+        reader, writer, _, _, _ = await join("127.0.0.1", self.port)
+        strokes = [random_stroke(rng, 1000) for _ in range(600)]
+        await self.paint(writer, reader, strokes)
+
+        # A joiner that has read only its welcome so far
+        late_reader, late_writer = await asyncio.open_connection("127.0.0.1", self.port)
+        kind, *_ = unpack_message(await asyncio.wait_for(read_message(late_reader), 10))
+        self.assertEqual(kind, MSG_WELCOME)
+        more = [random_stroke(rng, 100) for _ in range(3)]
+        await self.paint(writer, reader, more)
+
+        received = []
+        while len(received) < len(more):
+            kind, _, _, _, payload = unpack_message(await asyncio.wait_for(read_message(late_reader), 10))
+            if kind == MSG_COMMAND:
+                received.append(payload)
+            else:
+                self.assertEqual(kind, MSG_SNAPSHOT)
+                self.assertFalse(received, "snapshot block after a relayed stroke")
+        self.assertEqual(received, more)
+        writer.close()
+        late_writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
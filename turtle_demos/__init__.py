@@ -0,0 +1,23 @@
+"""
+Python Turtle demos: fractals, small games and a paint program.
+
+Importing this package (or any demo module) opens no window; every demo
+creates its screen in main(). Start a demo with the launcher:
+
+    python -m turtle_demos koch --level 6 --headless
+    python -m turtle_demos paint
+"""
+
+# Demo name -> (module, description). Modules are imported only when their
+# demo is started, so the launcher never loads Tk or NumPy it does not need.
+DEMOS = {
+    "koch": ("turtle_demos.koch", "Koch snowflake fractal"),
+    "ccurve": ("turtle_demos.ccurve", "C-Curve fractal"),
+    "dragon": ("turtle_demos.dragon", "Dragon curve fractal"),
+    "keypress": ("turtle_demos.keypress", "Game: reach the target with arrow key presses"),
+    "keyhold": ("turtle_demos.keyhold", "Game: continuous movement while arrow keys are held"),
+    "mouseclick": ("turtle_demos.mouseclick", "Game: move to clicked points or with the arrow keys"),
+    "mousefollow": ("turtle_demos.mousefollow", "Game: the turtle follows the mouse cursor"),
+    "morph": ("turtle_demos.morph", "Fractals morphing smoothly between levels (needs NumPy)"),
+    "paint": ("turtle_demos.paint", "Paint program (needs NumPy)"),
+}
@@ -0,0 +1,209 @@
+import asyncio
+import math
+import select
+import selectors
+import tkinter
+
+from .launcher import TELEMETRY_HOST
+
+# NOTE: This module only uses Python's standard library.
+#
+# Lets a demo serve socket I/O (a leaderboard, a telemetry endpoint, a replay
+# feed) from the same process as its window. Tk's mainloop stays in charge, as
+# under turtle.done(): the game loop keeps running on ontimer(), and the
+# asyncio event loop (TkEventLoop) only runs when Tk sees one of its sockets
+# become ready, or when one of its timers or callbacks is due. An idle window
+# therefore costs what it costs under turtle.done(). The demos import this
+# module only when --asyncio is given (see launcher.add_async_arguments):
+#   python -m turtle_demos keyhold --asyncio --telemetry 8765
+#   nc 127.0.0.1 8765
+
+
+# --- Configuration ---
+POLL_MS = 16 # Socket poll period where Tcl cannot watch sockets (Windows)
+
+
+# --- Asyncio Inside Tk's Mainloop ---
+
+class TkSelector(selectors.BaseSelector):
+    """
+    The selector of a TkEventLoop. Sockets are watched by Tcl
+    (createfilehandler()), which calls `on_ready` when one is ready; select()
+    then only hands over what Tcl reported. Where Tcl cannot watch sockets
+    (Windows), or when the loop is run outside Tk (run_until_complete()),
+    select() polls the sockets itself.
+    """
+
+    def __init__(self, tk, on_ready):
+        """
+        Args:
+            tk: The Tcl interpreter of the window, e.g. screen.cv.tk.
+            on_ready (callable): Called from Tk when a socket is ready.
+        """
+        self.tk = tk
+        self.on_ready = on_ready
+        self.keys = {} # fd -> SelectorKey
+        self.ready = {} # fd -> events reported by Tcl since the last select()
+        self.watches = hasattr(tk, "createfilehandler") # Tcl's notifier watches the sockets
+
+    def register(self, fileobj, events, data=None):
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        if fd in self.keys:
+            raise KeyError(f"{fileobj!r} is already registered")
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        self.keys[fd] = key
+        if self.watches:
+            mask = ((tkinter.READABLE if events & selectors.EVENT_READ else 0)
+                    | (tkinter.WRITABLE if events & selectors.EVENT_WRITE else 0))
+            self.tk.createfilehandler(fd, mask, self._file_ready)
+        return key
+
+    def unregister(self, fileobj):
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        key = self.keys.pop(fd)
+        if self.watches:
+            self.tk.deletefilehandler(fd)
+        self.ready.pop(fd, None)
+        return key
+
+    def _file_ready(self, fd, mask):
+        """Tcl file handler: records a ready socket and runs the loop."""
+        events = ((selectors.EVENT_READ if mask & tkinter.READABLE else 0)
+                  | (selectors.EVENT_WRITE if mask & tkinter.WRITABLE else 0))
+        self.ready[fd] = self.ready.get(fd, 0) | events
+        self.on_ready()
+
+    def select(self, timeout=None):
+        ready, self.ready = self.ready, {}
+        if not self.watches or timeout != 0:
+            readers = [fd for fd, key in self.keys.items() if key.events & selectors.EVENT_READ]
+            writers = [fd for fd, key in self.keys.items() if key.events & selectors.EVENT_WRITE]
+            if readers or writers:
+                readable, writable, _ = select.select(readers, writers, [], 0 if ready else timeout)
+                for fd in readable:
+                    ready[fd] = ready.get(fd, 0) | selectors.EVENT_READ
+                for fd in writable:
+                    ready[fd] = ready.get(fd, 0) | selectors.EVENT_WRITE
+        return [(self.keys[fd], events & self.keys[fd].events)
+                for fd, events in ready.items() if fd in self.keys]
+
+    def get_map(self):
+        return self.keys
+
+    def close(self):
+        for fd in list(self.keys):
+            self.unregister(fd)
+
+
+class TkEventLoop(asyncio.SelectorEventLoop):
+    """
+    An asyncio event loop that runs inside Tk's mainloop instead of owning
+    the thread. Nothing here waits: each time Tcl reports a ready socket, a
+    loop timer comes due or a callback is scheduled, run_once() runs one pass
+    of the loop (stop() then run_forever(), as documented for asyncio) from a
+    Tk callback. Between those, Tk waits as it does under turtle.done().
+    """
+
+    def __init__(self, widget):
+        """
+        Args:
+            widget: Any Tk widget of the window (e.g. screen.cv), or a
+                tkinter.Tcl() interpreter.
+        """
+        self.tk = widget.tk
+        self.pass_pending = False # A run_once() is already scheduled
+        self.run_command = widget.register(self.run_once) # Tcl command for after()
+        self.selector = TkSelector(self.tk, self.run_once)
+        super().__init__(self.selector)
+        if not self.selector.watches:
+            self.poll_command = widget.register(self.poll)
+            self.tk.call("after", POLL_MS, self.poll_command)
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        if not self.pass_pending:
+            self.pass_pending = True
+            self.tk.call("after", 0, self.run_command)
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        # Rounded up, as Tk's timers count whole milliseconds
+        self.tk.call("after", max(math.ceil((when - self.time()) * 1000), 0), self.run_command)
+        return handle
+
+    def run_once(self, *args):
+        """Runs one pass of the loop: ready sockets, due timers and callbacks."""
+        if self.is_running() or self.is_closed():
+            return # Called back from inside a pass (e.g. a callback that updates Tk)
+        self.pass_pending = False
+        self.stop()
+        self.run_forever()
+
+    def poll(self):
+        """Where Tcl cannot watch sockets: runs a pass every POLL_MS."""
+        if not self.is_closed():
+            self.run_once()
+            self.tk.call("after", POLL_MS, self.poll_command)
+
+
+# --- Coroutines ---
+
+async def serve_telemetry(port, stats_text, host=TELEMETRY_HOST):
+    """
+    Answers every connection with one line of live stats. stats_text() runs
+    on the loop's thread, which is also the Tk thread, so it may read the
+    game's state directly.
+    """
+    async def answer(reader, writer):
+        writer.write((stats_text() + "\n").encode())
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    try:
+        server = await asyncio.start_server(answer, host, port)
+    except OSError as error:
+        print(f"Telemetry not started: {error}")
+        return
+    async with server:
+        await server.serve_forever()
+
+
+# --- Running a Demo ---
+
+def start_services(widget, services):
+    """
+    Creates a TkEventLoop for the window of `widget` and starts `services`
+    (coroutines) on it; they run while Tk's mainloop (or dooneevent()) runs.
+
+    Returns:
+        tuple: (loop, tasks).
+    """
+    loop = TkEventLoop(widget)
+    asyncio.set_event_loop(loop)
+    return loop, [loop.create_task(service) for service in services]
+
+def stop_services(loop, tasks):
+    """Cancels the services, lets them finish and closes the loop."""
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+def run_async(args, screen, stats_text=None):
+    """
+    Keeps the window open like turtle.done(), with the demo's local services
+    (--telemetry) running on an asyncio loop inside Tk's mainloop. The demo
+    starts its own ontimer() game loop first, as it does for turtle.done().
+    """
+    services = []
+    if getattr(args, "telemetry", None) is not None:
+        services.append(serve_telemetry(args.telemetry, stats_text))
+        print(f"Live stats on {TELEMETRY_HOST}:{args.telemetry} (e.g. nc {TELEMETRY_HOST} {args.telemetry}).")
+    loop, tasks = start_services(screen.cv, services)
+    try:
+        screen.mainloop() # What turtle.done() runs
+    finally:
+        stop_services(loop, tasks)
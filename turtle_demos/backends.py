@@ -0,0 +1,238 @@
+import importlib
+import time
+
+# NOTE: This module only uses Python's standard library. The Tk backend
+# imports 'turtle' only when it is chosen, and the raster backend lives in
+# raster_backend.py because it needs NumPy (pip install numpy).
+
+
+# --- Rendering Backends ---
+# A backend draws a few primitives in turtle coordinates (origin at the
+# center, y pointing up). Every drawing call names a layer; clear(layer)
+# removes what was drawn on it, and present() shows the finished frame.
+#
+#   polyline(points, color, width, layer)
+#   segments(lines, buckets, palette, width, layer)
+#                               (x0, y0, x1, y1) lines, line i in palette[buckets[i]]
+#   polygon(points, fill, outline, layer)
+#   text(x, y, text, color, font, layer)
+#   blit(pixels, x, y, layer)   pixels: NumPy (height, width, 3) uint8, top-left at (x, y)
+#   clear(layer=None)           None clears every layer
+#   present()
+#
+# Colors are "#rrggbb" strings, a few names ("white", "red", ...) or (r, g, b)
+# tuples of 0-255 values.
+#
+# Backends are chosen by name when a demo starts (see create_backend()).
+
+BACKENDS = {
+    "tk": "turtle_demos.backends.TkBackend",
+    "recorder": "turtle_demos.backends.RecorderBackend",
+    "raster": "turtle_demos.raster_backend.RasterBackend",
+}
+DEFAULT_LAYER = "drawing"
+
+
+class TkBackend:
+    """
+    Draws on a Tk canvas, such as turtle's `screen.cv`. Each call creates a
+    single canvas item tagged with its layer, however many points it has.
+    """
+
+    def __init__(self, canvas, present=None):
+        """
+        Args:
+            canvas (tkinter.Canvas): The canvas to draw on. Its origin must be
+                at the center, as it is on turtle's canvas.
+            present (callable): Called by present(); defaults to
+                canvas.update_idletasks. Pass screen.update with tracer(0).
+        """
+        self.canvas = canvas
+        self.present_frame = present or canvas.update_idletasks
+        self.layers = set() # Tags of the layers drawn on, so clear() leaves other items alone
+        self.images = {} # layer -> PhotoImages kept alive while they are shown
+
+    @staticmethod
+    def _color(color):
+        return color if isinstance(color, str) else "#%02x%02x%02x" % tuple(color)
+
+    @staticmethod
+    def _flat(points):
+        # Canvas y points down
+        return [value for x, y in points for value in (x, -y)]
+
+    def polyline(self, points, color, width=1, layer=DEFAULT_LAYER):
+        if len(points) < 2:
+            return None
+        self.layers.add(layer)
+        return self.canvas.create_line(*self._flat(points), fill=self._color(color), width=width,
+                                       capstyle="round", joinstyle="round", tags=(layer,))
+
+    def segments(self, lines, buckets, palette, width=1, layer=DEFAULT_LAYER):
+        """
+        A canvas line item is one connected path, so consecutive lines that
+        join up and share a bucket become one item. Coloring by position
+        along a curve gives one item per bucket; colorings that change at
+        every line are better drawn with the raster backend.
+        """
+        run = []
+        run_bucket = None
+        for (x0, y0, x1, y1), bucket in zip(lines, buckets):
+            if bucket != run_bucket or run[-1] != (x0, y0):
+                self.polyline(run, palette[run_bucket], width, layer) if run else None
+                run = [(x0, y0)]
+                run_bucket = bucket
+            run.append((x1, y1))
+        if run:
+            self.polyline(run, palette[run_bucket], width, layer)
+
+    def polygon(self, points, fill, outline="", layer=DEFAULT_LAYER):
+        self.layers.add(layer)
+        return self.canvas.create_polygon(*self._flat(points), fill=self._color(fill),
+                                          outline=self._color(outline), tags=(layer,))
+
+    def text(self, x, y, text, color, font=("Arial", 12, "normal"), layer=DEFAULT_LAYER):
+        self.layers.add(layer)
+        return self.canvas.create_text(x, -y, text=text, fill=self._color(color), font=font, anchor="sw", tags=(layer,))
+
+    def blit(self, pixels, x, y, layer=DEFAULT_LAYER):
+        import tkinter as tk
+
+        height, width = pixels.shape[:2]
+        photo = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        header = b"P6 %d %d 255\n" % (width, height)
+        photo.tk.call(photo.name, "put", header + pixels.tobytes(), "-format", "ppm")
+        self.images.setdefault(layer, []).append(photo)
+        self.layers.add(layer)
+        return self.canvas.create_image(x, -y, image=photo, anchor="nw", tags=(layer,))
+
+    def clear(self, layer=None):
+        for name in list(self.layers) if layer is None else [layer]:
+            self.canvas.delete(name)
+            self.layers.discard(name)
+            self.images.pop(name, None)
+
+    def present(self):
+        self.present_frame()
+
+
+class RecorderBackend:
+    """
+    Draws nothing. Counts the calls, points and pixels each layer received,
+    so headless runs measure only the demo's own work.
+    """
+
+    def __init__(self):
+        self.calls = {} # primitive name -> number of calls
+        self.points = 0 # Points sent through polyline() and polygon()
+        self.pixels = 0 # Pixels sent through blit()
+        self.items = {} # layer -> number of primitives currently on it
+        self.frames = 0
+
+    def _record(self, kind, layer):
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        self.items[layer] = self.items.get(layer, 0) + 1
+
+    def polyline(self, points, color, width=1, layer=DEFAULT_LAYER):
+        self._record("polyline", layer)
+        self.points += len(points)
+
+    def segments(self, lines, buckets, palette, width=1, layer=DEFAULT_LAYER):
+        # One item per color used, as a backend that batches by color would make
+        self.calls["segments"] = self.calls.get("segments", 0) + 1
+        self.items[layer] = self.items.get(layer, 0) + len(set(buckets))
+        self.points += 2 * len(lines)
+
+    def polygon(self, points, fill, outline="", layer=DEFAULT_LAYER):
+        self._record("polygon", layer)
+        self.points += len(points)
+
+    def text(self, x, y, text, color, font=None, layer=DEFAULT_LAYER):
+        self._record("text", layer)
+
+    def blit(self, pixels, x, y, layer=DEFAULT_LAYER):
+        self._record("blit", layer)
+        self.pixels += pixels.shape[0] * pixels.shape[1]
+
+    def clear(self, layer=None):
+        if layer is None:
+            self.items.clear()
+        else:
+            self.items.pop(layer, None)
+
+    def present(self):
+        self.frames += 1
+
+
+def create_backend(name, **options):
+    """
+    Creates a backend by name, importing only the module it lives in.
+
+    Args:
+        name (str): "tk", "recorder" or "raster".
+        **options: Passed to the backend, e.g. canvas= for "tk", or
+            width=, height= and background= for "raster".
+
+    Returns:
+        The backend object.
+    """
+    module_name, class_name = BACKENDS[name].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)(**options)
+
+
+# --- Command Line ---
+
+def add_backend_arguments(parser):
+    """Adds --backend (and its --headless shorthand) and --output to a fractal demo's options."""
+    parser.add_argument("--backend", choices=["turtle"] + list(BACKENDS), default="turtle",
+                        help="turtle: animated drawing (default); tk: one canvas item per path; "
+                             "recorder: no drawing; raster: NumPy image, see --output")
+    parser.add_argument("--headless", dest="backend", action="store_const", const="recorder",
+                        help="Same as --backend recorder")
+    parser.add_argument("--output", help="With --backend raster, save the image to this .ppm file")
+
+def open_backend(args, width, height, background, title):
+    """
+    Creates the backend chosen with --backend, opening the window for "tk".
+
+    Returns:
+        The backend, or None for "turtle" (the demo then uses its own turtle).
+    """
+    if args.backend == "turtle":
+        return None
+    if args.backend == "tk":
+        import turtle # Imported here so headless runs never load Tk
+
+        screen = turtle.Screen()
+        screen.setup(width=width, height=height)
+        screen.bgcolor(background)
+        screen.title(title)
+        screen.tracer(0) # Paths are drawn as whole items, shown by present()
+        return create_backend("tk", canvas=screen.getcanvas(), present=screen.update)
+    if args.backend == "raster":
+        return create_backend("raster", width=width, height=height, background=background)
+    return create_backend(args.backend)
+
+def finish_drawing(drawing_turtle, args, start_time):
+    """
+    Shows the finished drawing: keeps the window open for the windowed
+    backends, or reports the run (and saves the image) for the others.
+
+    Args:
+        drawing_turtle: The demo's turtle.Turtle, or for any other backend
+            a FastTurtle drawing through the backend.
+        args (argparse.Namespace): The demo's options.
+        start_time (float): time.perf_counter() when drawing started.
+    """
+    if args.backend != "turtle":
+        drawing_turtle.flush()
+        drawing_turtle.backend.present()
+    elapsed = time.perf_counter() - start_time
+    if args.backend in ("recorder", "raster"):
+        print(f"Headless ({args.backend}): {drawing_turtle.segment_count} segments in {elapsed:.3f}s.")
+        if args.output and args.backend == "raster":
+            drawing_turtle.backend.save(args.output)
+            print(f"Image saved to {args.output}.")
+    else:
+        import turtle
+        turtle.done() # Keep the window open
@@ -0,0 +1,205 @@
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import time
+
+from .export import BACKGROUND, FRACTALS, encode_png, polylines
+from .geometry import koch_snowflake
+from .raster_backend import RasterBackend
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+#
+# Render every combination of fractal settings as PNG images, in parallel:
+#   python -m turtle_demos.batch --curves koch dragon --levels 3 4 5 --palettes demo ink --output renders
+# or from a sweep file:
+#   python -m turtle_demos.batch --spec sweep.json --output renders
+# where sweep.json looks like:
+#   {"curves": ["koch"], "levels": [3, 4], "sizes": [200, 300], "palettes": ["demo", "#ffffff:#000000"]}
+#
+# Finished jobs are listed in <output>/manifest.jsonl with their timings.
+# Running the same sweep again skips them, so an interrupted sweep resumes.
+
+
+# --- Configuration ---
+MANIFEST_FILE = "manifest.jsonl"
+
+# Palette name -> (line color, background). "demo" uses each fractal's own color.
+PALETTES = {
+    "demo": (None, BACKGROUND),
+    "ink": ("#111827", "#ffffff"),
+    "neon": ("#22d3ee", "#0f172a"),
+    "ember": ("#f97316", "#1c1917"),
+}
+
+
+# --- Sweep ---
+
+def parse_palette(palette):
+    """
+    Returns (line color, background) for a palette name from PALETTES or a
+    "line:background" pair such as "#ffffff:#000000".
+    """
+    if palette in PALETTES:
+        return PALETTES[palette]
+    line, _, background = palette.partition(":")
+    return line, background or BACKGROUND
+
+def job_name(curve, level, size, palette):
+    """A file-name friendly name for one image of the sweep."""
+    palette = "".join(char if char.isalnum() else "-" for char in palette).strip("-")
+    return f"{curve}_L{level}_S{size:g}_{palette}"
+
+def plan_sweep(spec):
+    """
+    Expands a sweep spec (curves x levels x sizes x palettes) into groups of
+    jobs. Jobs in a group differ only in palette, so they share one geometry.
+
+    Args:
+        spec (dict): "curves", "levels", "sizes" and "palettes" lists. A
+            missing list means the demo's own value ("sizes") or "demo".
+
+    Returns:
+        list: (curve, level, size, [palette, ...]) tuples, most expensive first.
+    """
+    groups = []
+    for curve in spec["curves"]:
+        trace, default_level, default_size = FRACTALS[curve][:3]
+        levels = spec.get("levels") or [default_level]
+        sizes = spec.get("sizes") or [default_size]
+        for level, size in itertools.product(levels, sizes):
+            groups.append((curve, level, size, list(spec.get("palettes") or ["demo"])))
+    # Biggest geometry first (4^level Koch sides, 2^level Dragon and C-Curve
+    # segments), so a long job never starts last while the other workers idle
+    branching = {"koch": 4, "ccurve": 2, "dragon": 2}
+    groups.sort(key=lambda group: branching[group[0]] ** group[1] * len(group[3]), reverse=True)
+    return groups
+
+
+# --- Jobs ---
+
+def render_group(curve, level, size, palettes, output_dir):
+    """
+    Computes one geometry and renders it once per palette. Runs in a worker
+    process.
+
+    Returns:
+        list: One manifest record per image written.
+    """
+    trace, _, _, (width, height), default_color, pen_width = FRACTALS[curve]
+    start_time = time.perf_counter()
+    if curve == "koch":
+        # One side traced, three rotated copies (same start as export.trace_koch)
+        lines = list(koch_snowflake(level, size, (-size / 2, size / 3)).instances())
+    else:
+        lines = polylines(trace(level, size))
+    trace_seconds = time.perf_counter() - start_time
+
+    records = []
+    for palette in palettes:
+        color, background = parse_palette(palette)
+        start_time = time.perf_counter()
+        backend = RasterBackend(width, height, background)
+        for points in lines:
+            backend.polyline(points, color or default_color, pen_width)
+        backend.present()
+        render_seconds = time.perf_counter() - start_time
+
+        name = job_name(curve, level, size, palette)
+        start_time = time.perf_counter()
+        path = os.path.join(output_dir, name + ".png")
+        with open(path + ".part", "wb") as image_file:
+            image_file.write(encode_png(backend.frame))
+        os.replace(path + ".part", path) # A crash never leaves a half-written image
+        records.append({
+            "job": name, "curve": curve, "level": level, "size": size, "palette": palette,
+            "image": os.path.basename(path),
+            "trace_seconds": trace_seconds / len(palettes), # Shared by the group
+            "render_seconds": render_seconds,
+            "encode_seconds": time.perf_counter() - start_time,
+            "worker": os.getpid(),
+        })
+    return records
+
+def load_manifest(output_dir):
+    """Returns the names of the jobs already finished in an output directory."""
+    done = set()
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return done
+    with open(path) as manifest_file:
+        for line in manifest_file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue # A line cut short by an interrupted run
+            if os.path.exists(os.path.join(output_dir, record["image"])):
+                done.add(record["job"])
+    return done
+
+def run_sweep(spec, output_dir, workers=None):
+    """
+    Renders a sweep with a pool of worker processes. Each idle worker takes
+    the next geometry group from the shared queue, so fast workers keep
+    taking work while a slow one finishes a large group.
+
+    Returns:
+        tuple: (images rendered, images skipped because they were done).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    done = load_manifest(output_dir)
+    skipped = 0
+    pending = []
+    for curve, level, size, palettes in plan_sweep(spec):
+        todo = [palette for palette in palettes if job_name(curve, level, size, palette) not in done]
+        skipped += len(palettes) - len(todo)
+        if todo:
+            pending.append((curve, level, size, todo))
+
+    rendered = 0
+    with open(os.path.join(output_dir, MANIFEST_FILE), "a") as manifest_file, \
+            concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_group, *group, output_dir) for group in pending]
+        for future in concurrent.futures.as_completed(futures):
+            for record in future.result():
+                manifest_file.write(json.dumps(record) + "\n")
+                rendered += 1
+                print(f"{record['job']:40} {record['render_seconds'] * 1000:8.1f} ms")
+            manifest_file.flush() # Progress survives an interrupted sweep
+    return rendered, skipped
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.batch",
+                                     description="Render a sweep of fractal settings as PNG images.")
+    parser.add_argument("--spec", help="JSON sweep file with curves, levels, sizes and palettes lists")
+    parser.add_argument("--curves", nargs="+", choices=list(FRACTALS), help="Fractals to render")
+    parser.add_argument("--levels", nargs="+", type=int, help="Recursion levels (orders for dragon)")
+    parser.add_argument("--sizes", nargs="+", type=float, help="Side or segment lengths")
+    parser.add_argument("--palettes", nargs="+",
+                        help=f"Palette names ({', '.join(PALETTES)}) or 'line:background' colors")
+    parser.add_argument("--output", required=True, help="Directory for the images and the manifest")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.spec:
+        with open(args.spec) as spec_file:
+            spec = json.load(spec_file)
+    for key in ("curves", "levels", "sizes", "palettes"):
+        if getattr(args, key):
+            spec[key] = getattr(args, key) # Command line lists override the file
+    if not spec.get("curves"):
+        parser.error("no curves given (use --curves or a --spec file)")
+
+    start_time = time.perf_counter()
+    rendered, skipped = run_sweep(spec, args.output, args.workers)
+    print(f"Rendered {rendered} images ({skipped} already done) in "
+          f"{time.perf_counter() - start_time:.2f}s; manifest: {os.path.join(args.output, MANIFEST_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
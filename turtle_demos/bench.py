@@ -0,0 +1,727 @@
+import _tkinter
+import argparse
+import contextlib
+import gc
+import importlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tkinter
+import tracemalloc
+from types import SimpleNamespace
+
+from .headless import RecorderTurtle
+
+# NOTE: This module only uses Python's standard library, plus NumPy for the
+# paint benchmarks (pip install numpy). Everything runs headless on the
+# recorders from headless.py, so no display (or Xvfb) is needed, except the
+# tk_canvas cases against the stock turtle, which are skipped without one.
+#
+# Run the suite and store the results:
+#   python -m turtle_demos.bench run --output bench_results.json
+# Compare two result files (exits with status 1 if anything regressed):
+#   python -m turtle_demos.bench compare bench_baseline.json bench_results.json
+
+
+# --- Configuration ---
+DEFAULT_REPEAT = 5 # Timed runs per case; the fastest one is reported
+DEFAULT_THRESHOLD = 0.15 # Relative slowdown (or memory growth) flagged as a regression
+
+tk_root = None # The window of the tk_canvas cases (see tk_screen())
+
+
+# --- Benchmark Cases ---
+# A case is a function that takes the case parameters, does all of its setup
+# and returns a `run` callable. Only `run()` is timed; it returns a dict of
+# counters (segments drawn, canvas items, ...) that are stored with the time.
+
+class SkipCase(Exception):
+    """Raised by a case's setup when it cannot run here (e.g. without a display)."""
+
+def quiet():
+    """Silences the demos' print() calls while a case runs."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+def fresh_module(name):
+    """Imports (or re-imports) a demo module so its global state starts clean."""
+    return importlib.reload(importlib.import_module(f"turtle_demos.{name}"))
+
+def bench_koch(level):
+    koch = fresh_module("koch")
+    def run():
+        recorder = RecorderTurtle()
+        koch.draw_koch_snowflake(recorder, level, koch.SIDE_LENGTH)
+        return {"segments": len(recorder.segments)}
+    return run
+
+def bench_ccurve(level):
+    ccurve = fresh_module("ccurve")
+    def run():
+        recorder = RecorderTurtle()
+        ccurve.c_curve(recorder, level, ccurve.SIDE_LENGTH)
+        return {"segments": len(recorder.segments)}
+    return run
+
+def draw_curve(module, curve, t, level, sequence):
+    """Draws a fractal of the koch, ccurve or dragon module with turtle `t`."""
+    if curve == "koch":
+        module.draw_koch_snowflake(t, level, module.SIDE_LENGTH)
+    elif curve == "ccurve":
+        module.c_curve(t, level, module.SIDE_LENGTH)
+    else:
+        module.draw_dragon_curve(t, sequence, module.LENGTH)
+
+def bench_fast_turtle(curve, level):
+    """A fractal traced by FastTurtle; compare with the stock_navigator and koch/ccurve/dragon_draw cases."""
+    from .fast_turtle import FastTurtle
+
+    module = fresh_module(curve)
+    sequence = module.generate_dragon_sequence(level) if curve == "dragon" else None
+    def run():
+        fast = FastTurtle()
+        draw_curve(module, curve, fast, level, sequence)
+        return {"segments": fast.segment_count}
+    return run
+
+def bench_stock_navigator(curve, level):
+    """
+    A fractal traced by turtle.TNavigator, the movement code of the stock
+    turtle (float heading, cos/sin and Vec2D on every step) without any of
+    its Tk work: what turtle.Turtle costs at least, with no display needed.
+    """
+    import turtle
+
+    from .fast_turtle import FastTurtle
+
+    module = fresh_module(curve)
+    sequence = module.generate_dragon_sequence(level) if curve == "dragon" else None
+    counter = FastTurtle() # Counts the segments, which TNavigator does not
+    draw_curve(module, curve, counter, level, sequence)
+    def run():
+        draw_curve(module, curve, turtle.TNavigator(), level, sequence)
+        return {"segments": counter.segment_count}
+    return run
+
+def tk_screen(width=600, height=600):
+    """
+    A turtle screen on a new Tk window, shown before the timing starts. The
+    window of the previous call is closed first.
+
+    Raises:
+        SkipCase: There is no display.
+    """
+    import turtle # Imported here so the headless cases never load it
+
+    global tk_root
+    if tk_root is not None:
+        tk_root.destroy()
+        tk_root = None
+    try:
+        tk_root = tkinter.Tk()
+    except tkinter.TclError as error:
+        raise SkipCase(f"no display: {error}")
+    canvas = tkinter.Canvas(tk_root, width=width, height=height)
+    canvas.pack()
+    screen = turtle.TurtleScreen(canvas)
+    screen.bgcolor("#1f2937")
+    tk_root.update()
+    return screen
+
+def bench_tk_canvas(drawing, level=4):
+    """
+    The Koch snowflake on a real Tk canvas: the stock turtle.RawTurtle as
+    koch.py animates it (speed 0, every move shown), against FastTurtle
+    through the tk backend (one polyline, shown once). Needs a display.
+    """
+    import turtle
+
+    from .backends import create_backend
+    from .fast_turtle import FastTurtle
+
+    koch = fresh_module("koch")
+    screen = tk_screen()
+    def run():
+        if drawing == "raw_turtle":
+            drawing_turtle = turtle.RawTurtle(screen)
+            drawing_turtle.speed(0)
+            drawing_turtle.hideturtle()
+            drawing_turtle.pensize(2)
+            koch.draw_koch_snowflake(drawing_turtle, level, koch.SIDE_LENGTH)
+            segments = 3 * 4 ** level
+        else:
+            screen.tracer(0)
+            drawing_turtle = FastTurtle(create_backend("tk", canvas=screen.getcanvas(), present=screen.update),
+                                        color="#60a5fa", width=2)
+            koch.draw_koch_snowflake(drawing_turtle, level, koch.SIDE_LENGTH)
+            drawing_turtle.flush()
+            drawing_turtle.backend.present()
+            segments = drawing_turtle.segment_count
+        screen.getcanvas().update() # Until the canvas has drawn the result
+        return {"segments": segments}
+    return run
+
+def bench_dragon_gradient(backend, mode, order=16):
+    """The Dragon curve with a quantized gradient, through a backend."""
+    from .backends import create_backend
+    from .fast_turtle import FastTurtle
+
+    dragon = fresh_module("dragon")
+    sequence = dragon.generate_dragon_sequence(order)
+    options = {"width": dragon.SCREEN_WIDTH, "height": dragon.SCREEN_HEIGHT} if backend == "raster" else {}
+    def run():
+        fast = FastTurtle(create_backend(backend, **options))
+        dragon.draw_dragon_gradient(fast, sequence, dragon.LENGTH, mode)
+        fast.backend.present()
+        counters = {"segments": fast.segment_count}
+        if backend == "recorder":
+            counters["items"] = sum(fast.backend.items.values())
+        return counters
+    return run
+
+def bench_dragon_sequence(order):
+    dragon = fresh_module("dragon")
+    def run():
+        return {"turns": len(dragon.generate_dragon_sequence(order))}
+    return run
+
+def bench_dragon_draw(order):
+    dragon = fresh_module("dragon")
+    sequence = dragon.generate_dragon_sequence(order)
+    def run():
+        recorder = RecorderTurtle()
+        dragon.draw_dragon_curve(recorder, sequence, dragon.LENGTH)
+        return {"segments": len(recorder.segments)}
+    return run
+
+def bench_koch_backend(backend, level):
+    """The Koch snowflake through a rendering backend, including present()."""
+    from .backends import create_backend
+    from .fast_turtle import FastTurtle
+
+    koch = fresh_module("koch")
+    options = {"width": 600, "height": 600, "background": "#1f2937"} if backend == "raster" else {}
+    def run():
+        drawing_turtle = FastTurtle(create_backend(backend, **options), color="#60a5fa", width=2)
+        koch.draw_koch_snowflake(drawing_turtle, level, koch.SIDE_LENGTH)
+        drawing_turtle.flush()
+        drawing_turtle.backend.present()
+        return {"segments": drawing_turtle.segment_count}
+    return run
+
+def bench_export(frames, order=13):
+    """A Dragon construction GIF exported through the encoder thread."""
+    export = fresh_module("export")
+    output_dir = tempfile.TemporaryDirectory(prefix="turtle_bench_")
+    def run():
+        written, segments = export.export_animation("dragon", os.path.join(output_dir.name, "dragon.gif"),
+                                                    level=order, frames=frames)
+        size = os.path.getsize(os.path.join(output_dir.name, "dragon.gif"))
+        output_dir.cleanup()
+        return {"frames": written, "segments": segments, "gif_bytes": size}
+    return run
+
+def bench_koch_instanced(level):
+    """The Koch snowflake as one side plus three transformed copies."""
+    from .geometry import koch_snowflake
+
+    def run():
+        snowflake = koch_snowflake(level, 300)
+        points = sum(len(points) for points in snowflake.instances())
+        return {"segments": snowflake.segment_count, "points": points}
+    return run
+
+def bench_ifs(name, points):
+    """Chaos game density of a fractal's IFS at 800x600."""
+    ifs = fresh_module("ifs")
+    def run():
+        counts = ifs.density(name, points, 800, 600)
+        ifs.render_density(counts, ifs.SYSTEMS[name][2])
+        return {"pixels_hit": int((counts > 0).sum())}
+    return run
+
+def bench_morph(curve, frames=60):
+    """Morph frames between the two highest levels of a curve (arrays cached in setup)."""
+    morph = fresh_module("morph")
+    morph.create_screen(headless=True)
+    morph.curve = curve
+    morph.level = morph.CURVES[curve][3] - 1
+    morph.morph_arrays(curve, morph.level)
+    def run():
+        for frame in range(frames):
+            morph.morph_frame(frame / (frames - 1))
+        return {"frames": frames, "vertices": len(morph.vertices(curve, morph.level + 1))}
+    return run
+
+def bench_levels(count):
+    """Poisson-disk target layout on the game screen, around a keep-out circle."""
+    levels = fresh_module("levels")
+    if count >= levels.LARGE_LAYOUT:
+        import numpy # noqa: F401 (loaded in setup, not timed)
+    def run():
+        points = levels.generate_layout(count, (-350, -300, 350, 300), seed=0, keep_out=(0, 0, 150))
+        return {"points": len(points)}
+    return run
+
+def bench_vector_env(games, steps=100):
+    """Batch reach-the-target games stepped together with the seek policy."""
+    vector_env = fresh_module("vector_env")
+    env = vector_env.VectorEnv(games, seed=0)
+    def run():
+        for _ in range(steps):
+            env.step(vector_env.seek_keys(env))
+        return {"game_steps": games * steps, "wins": int(env.wins.sum())}
+    return run
+
+def bench_threaded_game(load_ms, frames=30):
+    """
+    Script 5 with the simulation in a worker thread (threaded_game.py): redraws
+    at the frame rate while the simulation has `load_ms` of extra work per step.
+    """
+    game = fresh_module("keyhold")
+    threaded_game = fresh_module("threaded_game")
+    def run():
+        thread, renderer = threaded_game.start(game, seed=0, load_ms=load_ms, clicks_walk=False, headless=True)
+        game.screen.timers.clear() # The benchmark drives the frames
+        thread.send("press", 1) # Forward
+        longest_gap = 0.0
+        last = time.perf_counter()
+        for _ in range(frames):
+            renderer.render()
+            now = time.perf_counter()
+            longest_gap = max(longest_gap, now - last)
+            last = now
+            time.sleep(threaded_game.FRAME_MS / 1000)
+        thread.stop()
+        return {"sim_ticks": thread.snapshots.latest().tick, "overruns": thread.overruns,
+                "max_frame_ms": round(renderer.max_frame_ms, 3), "max_frame_gap_ms": round(longest_gap * 1000, 1)}
+    return run
+
+def window_tcl():
+    """
+    A Tcl interpreter (tkinter.Tcl(), which needs no display) standing in
+    for a turtle window in the async_runner cases. A window's Tcl always
+    watches its display connection, so a pipe that never becomes ready is
+    watched here in its place. Without it, only the "asyncio" mode would
+    make Tcl watch files at all (in its notifier thread), and the cases
+    would measure that instead of async_runner.
+
+    Returns:
+        tuple: (interpreter, close) where close() releases the pipe.
+    """
+    tcl = tkinter.Tcl()
+    if not hasattr(tcl.tk, "createfilehandler"): # Windows: no file handlers
+        return tcl, lambda: None
+    read_end, write_end = os.pipe()
+    tcl.tk.createfilehandler(read_end, tkinter.READABLE, lambda *args: None)
+    def close():
+        tcl.tk.deletefilehandler(read_end)
+        os.close(read_end)
+        os.close(write_end)
+    return tcl, close
+
+def tcl_services(mode, tcl, stats_text):
+    """
+    For the "asyncio" mode of the async_runner cases: starts async_runner's
+    loop inside a Tcl interpreter (tkinter.Tcl(), which needs no display),
+    serving telemetry on a free port as --telemetry does, and runs its
+    startup before the timing starts.
+
+    Returns:
+        callable: Stops the services; None in "ontimer" mode.
+    """
+    if mode != "asyncio":
+        return None
+    async_runner = fresh_module("async_runner")
+    services = async_runner.start_services(tcl, [async_runner.serve_telemetry(0, stats_text)])
+    while tcl.dooneevent(_tkinter.DONT_WAIT):
+        pass
+    return lambda: async_runner.stop_services(*services)
+
+def bench_async_runner(mode, ticks=100):
+    """
+    Script 5's game loop with Forward held, paced in real time by Tk's
+    after() in a Tcl interpreter (which needs no display), as under
+    turtle.done(); in "asyncio" mode with async_runner's loop and a
+    telemetry server running inside it. Reports the CPU time per tick and
+    how evenly the ticks are spaced.
+    """
+    game = start_game("keyhold")
+    tcl, close_tcl = window_tcl()
+    def run():
+        game.setup_game()
+        game.press_forward()
+        stop_services = tcl_services(mode, tcl, game.stats_text)
+        times = []
+        def game_loop():
+            game.update_game()
+            times.append(time.perf_counter())
+            if len(times) < ticks:
+                tcl.after(game.GAME_TICK, game_loop)
+        cpu_started = time.process_time()
+        tcl.after(game.GAME_TICK, game_loop)
+        while len(times) < ticks:
+            tcl.dooneevent() # One step of mainloop()
+        cpu_ms = (time.process_time() - cpu_started) * 1000
+        if stop_services is not None:
+            stop_services()
+        close_tcl()
+        game.release_forward()
+        periods = [(later - earlier) * 1000 for earlier, later in zip(times, times[1:])]
+        mean = sum(periods) / len(periods)
+        return {
+            "cpu_ms_per_tick": round(cpu_ms / ticks, 3),
+            "mean_period_ms": round(mean, 2),
+            "jitter_ms": round(math.sqrt(sum((p - mean) ** 2 for p in periods) / len(periods)), 3),
+        }
+    return run
+
+def bench_async_idle(mode, seconds=2.0):
+    """
+    An idle window without a game loop (scripts 4 and 8 between inputs),
+    whose only Tk timer is the HUD refresh, under turtle.done()'s blocking
+    wait; in "asyncio" mode with async_runner's loop and a telemetry server
+    running inside it. Reports the CPU time per second and how late the
+    refreshes ran.
+    """
+    hud = fresh_module("hud")
+    refresh_ms = int(hud.REFRESH_SECONDS * 1000)
+    tcl, close_tcl = window_tcl()
+    def run():
+        stop_services = tcl_services(mode, tcl, lambda: "idle")
+        lateness = []
+        def refresh(due):
+            lateness.append((time.perf_counter() - due) * 1000)
+            tcl.after(refresh_ms, refresh, time.perf_counter() + refresh_ms / 1000)
+        tcl.after(refresh_ms, refresh, time.perf_counter() + refresh_ms / 1000)
+        started, cpu_started = time.perf_counter(), time.process_time()
+        while time.perf_counter() - started < seconds:
+            tcl.dooneevent() # One step of mainloop(): blocks until an event is due
+        elapsed = time.perf_counter() - started
+        cpu_ms = (time.process_time() - cpu_started) * 1000
+        tcl.call("after", "cancel", tcl.call("after", "info")) # Stop the refresh timer
+        if stop_services is not None:
+            stop_services()
+        close_tcl()
+        return {
+            "cpu_ms_per_s": round(cpu_ms / elapsed, 3),
+            "refreshes": len(lateness),
+            "max_refresh_late_ms": round(max(lateness), 2),
+        }
+    return run
+
+def start_game(name):
+    """Creates a headless game with a reproducible target."""
+    random.seed(0)
+    game = fresh_module(name)
+    game.create_screen(headless=True)
+    game.setup_game()
+    return game
+
+def game_counters(game, wins):
+    return {
+        "wins": wins,
+        "segments": len(game.sketch_turtle.segments),
+        "screen_updates": game.screen.updates,
+        "canvas_items": len(game.screen.cv.items),
+    }
+
+def bench_keypress(events):
+    """Script 4: discrete key presses, one handler call per event."""
+    game = start_game("keypress")
+    # Input trace: mostly forward, with a turn every few steps
+    trace = [game.turn_left if i % 7 == 3 else game.turn_right if i % 11 == 5 else game.move_forward
+             for i in range(events)]
+    def run():
+        wins = 0
+        for handler in trace:
+            handler()
+            if game.is_game_over:
+                wins += 1
+                game.setup_game()
+        return game_counters(game, wins)
+    return run
+
+def bench_keyhold(ticks):
+    """Script 5: game_loop ticks with arrow keys held in a repeating pattern."""
+    game = start_game("keyhold")
+    def run():
+        wins = 0
+        for tick in range(ticks):
+            if tick % 60 == 0:
+                game.press_forward()
+                game.release_left() if tick % 120 else game.press_left()
+            game.game_loop()
+            game.screen.timers.clear() # The loop reschedules itself; the benchmark drives it
+            if game.is_game_over:
+                wins += 1
+                game.setup_game()
+        return game_counters(game, wins)
+    return run
+
+def bench_mouseclick(ticks):
+    """Script 6: game_loop ticks, walking to a new clicked point every 40 ticks."""
+    game = start_game("mouseclick")
+    rng = random.Random(1)
+    clicks = [(rng.uniform(-350, 350), rng.uniform(-300, 300)) for _ in range(ticks // 40 + 1)]
+    def run():
+        wins = 0
+        for tick in range(ticks):
+            if tick % 40 == 0:
+                game.handle_click(*clicks[tick // 40])
+            game.game_loop()
+            game.screen.timers.clear()
+            if game.is_game_over:
+                wins += 1
+                game.setup_game()
+        return game_counters(game, wins)
+    return run
+
+def bench_mousefollow(ticks):
+    """Script 7: game_loop ticks following a cursor that circles the screen."""
+    game = start_game("mousefollow")
+    def run():
+        wins = 0
+        game.is_mouse_visible = True
+        for tick in range(ticks):
+            angle = tick / 50
+            game.cursor_x, game.cursor_y = 250 * math.cos(angle), 200 * math.sin(angle)
+            game.game_loop()
+            game.screen.timers.clear()
+            if game.is_game_over:
+                wins += 1
+                game.setup_game()
+                game.is_mouse_visible = True
+        return game_counters(game, wins)
+    return run
+
+def start_paint():
+    """
+    Creates a headless paint app whose journal goes to a temporary directory.
+
+    Returns:
+        tuple: (paint module, TemporaryDirectory). The case removes the
+        directory once its run is over.
+    """
+    paint = fresh_module("paint")
+    journal_dir = tempfile.TemporaryDirectory(prefix="turtle_bench_")
+    paint.JOURNAL_FILE = os.path.join(journal_dir.name, "bench.tpj")
+    paint.create_screen(headless=True)
+    return paint, journal_dir
+
+def draw_trace(paint, strokes, samples, seed=0):
+    """
+    Feeds a synthetic input trace to the paint event handlers: `strokes`
+    drags of `samples` motion events each, with a frame every 4 events.
+    """
+    rng = random.Random(seed)
+    for _ in range(strokes):
+        x, y = rng.uniform(100, 700), rng.uniform(100, 600)
+        paint.handle_mouse_down_tk(SimpleNamespace(x=x, y=y))
+        for sample in range(samples):
+            x += rng.uniform(-2, 5)
+            y += rng.uniform(-4, 4)
+            paint.handle_mouse_drag_tk(SimpleNamespace(x=x, y=y))
+            if sample % 4 == 3:
+                paint.screen.run_timers()
+        paint.handle_mouse_up_tk(SimpleNamespace(x=x, y=y))
+        paint.screen.run_timers()
+
+def paint_counters(paint):
+    images = [photo for photo, _ in paint.raster_layer.images.values()]
+    return {
+        "canvas_items": len(paint.screen.cv.items),
+        "tiles": len(paint.raster_layer.tiles),
+        "image_puts": sum(photo.puts for photo in images),
+        "image_bytes": sum(photo.bytes_put for photo in images),
+    }
+
+def bench_paint_strokes(strokes, samples=100):
+    """Script 8: mouse down/drag/up handlers plus the frames they schedule."""
+    paint, journal_dir = start_paint()
+    def run():
+        draw_trace(paint, strokes, samples)
+        paint.journal.close()
+        journal_dir.cleanup()
+        return paint_counters(paint)
+    return run
+
+def bench_paint_undo(strokes, undos):
+    """Script 8: undo steps after a painting of `strokes` strokes."""
+    paint, journal_dir = start_paint()
+    with quiet():
+        draw_trace(paint, strokes, 60)
+    def run():
+        for _ in range(undos):
+            paint.undo()
+        paint.screen.run_timers()
+        paint.journal.close()
+        journal_dir.cleanup()
+        return paint_counters(paint)
+    return run
+
+# Case name -> (function, list of parameter dicts)
+CASES = {
+    "koch": (bench_koch, [{"level": level} for level in (3, 4, 5, 6)]),
+    "koch_backend": (bench_koch_backend, [{"backend": backend, "level": 6} for backend in ("recorder", "raster")]),
+    "koch_instanced": (bench_koch_instanced, [{"level": level} for level in (3, 4, 5, 6)]),
+    "ccurve": (bench_ccurve, [{"level": level} for level in (8, 10, 12)]),
+    "fast_turtle": (bench_fast_turtle, [{"curve": "koch", "level": 6}, {"curve": "ccurve", "level": 12},
+                                        {"curve": "dragon", "level": 16}]),
+    "stock_navigator": (bench_stock_navigator, [{"curve": "koch", "level": 6}, {"curve": "ccurve", "level": 12},
+                                                {"curve": "dragon", "level": 16}]),
+    "tk_canvas": (bench_tk_canvas, [{"drawing": drawing} for drawing in ("raw_turtle", "fast_turtle")]),
+    "dragon_gradient": (bench_dragon_gradient, [{"backend": backend, "mode": mode} for backend in ("recorder", "raster")
+                                                for mode in ("index", "distance")]),
+    "dragon_sequence": (bench_dragon_sequence, [{"order": order} for order in (10, 13, 16)]),
+    "dragon_draw": (bench_dragon_draw, [{"order": order} for order in (10, 13, 16)]),
+    "ifs": (bench_ifs, [{"name": name, "points": 1_000_000} for name in ("koch", "ccurve", "dragon")]),
+    "morph": (bench_morph, [{"curve": curve} for curve in ("koch", "ccurve", "dragon")]),
+    "export": (bench_export, [{"frames": 1000}]),
+    "levels": (bench_levels, [{"count": count} for count in (1, 100, 1000, 100_000)]),
+    "keypress": (bench_keypress, [{"events": events} for events in (1000, 10000)]),
+    "keyhold": (bench_keyhold, [{"ticks": ticks} for ticks in (1000, 10000)]),
+    "mouseclick": (bench_mouseclick, [{"ticks": ticks} for ticks in (1000, 10000)]),
+    "async_runner": (bench_async_runner, [{"mode": mode} for mode in ("ontimer", "asyncio")]),
+    "async_idle": (bench_async_idle, [{"mode": mode} for mode in ("ontimer", "asyncio")]),
+    "threaded_game": (bench_threaded_game, [{"load_ms": load_ms} for load_ms in (0, 80)]),
+    "vector_env": (bench_vector_env, [{"games": games} for games in (100, 10_000)]),
+    "mousefollow": (bench_mousefollow, [{"ticks": ticks} for ticks in (1000, 10000)]),
+    "paint_strokes": (bench_paint_strokes, [{"strokes": strokes} for strokes in (10, 100)]),
+    "paint_undo": (bench_paint_undo, [{"strokes": 100, "undos": 20}]),
+}
+
+
+# --- Running ---
+
+def case_name(name, params):
+    return f"{name}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+def measure(function, params, repeat):
+    """
+    Times a case `repeat` times (fresh setup each time), then runs it once
+    more under tracemalloc for its peak memory.
+
+    Returns:
+        dict: time_min/time_median in seconds, peak_kib, and the counters.
+    """
+    times = []
+    for _ in range(repeat):
+        with quiet():
+            run = function(**params)
+            gc.collect()
+            start_time = time.perf_counter()
+            counters = run()
+            times.append(time.perf_counter() - start_time)
+    with quiet():
+        run = function(**params)
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    times.sort()
+    return {"time_min": times[0], "time_median": times[len(times) // 2],
+            "peak_kib": round(peak / 1024, 1), **counters}
+
+def run_suite(selected, repeat):
+    """Runs the cases whose names contain one of `selected` (all if empty)."""
+    results = {}
+    for name, (function, param_list) in CASES.items():
+        if selected and not any(word in name for word in selected):
+            continue
+        for params in param_list:
+            label = case_name(name, params)
+            try:
+                results[label] = measure(function, params, repeat)
+            except SkipCase as reason:
+                print(f"{label:40} skipped ({reason})")
+                continue
+            result = results[label]
+            print(f"{label:40} {result['time_min'] * 1000:10.2f} ms {result['peak_kib']:10.1f} KiB")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+# --- Comparing ---
+
+def compare(baseline, current, threshold):
+    """
+    Prints every case found in both result sets and flags regressions: the
+    fastest time or the peak memory grew by more than `threshold`, or a
+    canvas item count grew at all (when both result sets have one).
+
+    Returns:
+        int: Number of regressed cases.
+    """
+    regressions = 0
+    for label, result in current["results"].items():
+        old = baseline["results"].get(label)
+        if old is None:
+            print(f"{label:40} (new)")
+            continue
+        ratio = result["time_min"] / old["time_min"] if old["time_min"] else 1.0
+        problems = []
+        if ratio > 1 + threshold:
+            problems.append(f"time x{ratio:.2f}")
+        if old["peak_kib"] and result["peak_kib"] / old["peak_kib"] > 1 + threshold:
+            problems.append(f"memory x{result['peak_kib'] / old['peak_kib']:.2f}")
+        # Only the game and paint cases count canvas items; skipped when either side has none
+        old_items, items = old.get("canvas_items"), result.get("canvas_items")
+        if old_items is not None and items is not None and items > old_items:
+            problems.append(f"canvas items {old_items} -> {items}")
+        status = "REGRESSION: " + ", ".join(problems) if problems else "ok"
+        regressions += bool(problems)
+        print(f"{label:40} {old['time_min'] * 1000:10.2f} -> {result['time_min'] * 1000:10.2f} ms"
+              f"  x{ratio:.2f}  {status}")
+    print(f"{regressions} regression(s).")
+    return regressions
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.bench",
+                                     description="Headless benchmarks for the turtle demos.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write JSON results")
+    run_parser.add_argument("cases", nargs="*", help="Only run cases whose name contains one of these")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.add_argument("--baseline", help="Compare against this result file afterwards")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run_suite(args.cases, args.repeat)
+        with open(args.output, "w") as output_file:
+            json.dump(current, output_file, indent=2)
+        print(f"Results written to {args.output}")
+        if not args.baseline:
+            return
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    else:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        with open(args.current) as current_file:
+            current = json.load(current_file)
+    if compare(baseline, current, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# NOTE: This module only uses Python's standard library (turtle/tkinter).
+
+
+# --- Canvas Coordinate Mapping ---
+
+class CanvasMapper:
+    """
+    Converts Tk event pixels to turtle coordinates without asking Tk for the
+    window geometry on every event.
+
+    The canvas size, scroll offsets and scroll region are cached. They are
+    re-read only when the canvas is resized (a <Configure> event) or when the
+    view is scrolled through this object, so mapping a mouse event costs a few
+    arithmetic operations instead of several Tk round trips.
+
+    Turtle coordinates have (0, 0) at the canvas origin and y pointing up,
+    one unit per canvas pixel.
+    """
+
+    def __init__(self, canvas, width, height):
+        """
+        Args:
+            canvas: The turtle screen's canvas (screen.cv) or a Tk canvas.
+            width (int): Expected canvas width, used until the window is shown.
+            height (int): Expected canvas height, used until the window is shown.
+        """
+        # turtle's ScrolledCanvas is a frame around the real Tk canvas; its
+        # own size includes the scrollbars, so the inner canvas is measured
+        self.canvas = getattr(canvas, "_canvas", canvas)
+        self.width = width
+        self.height = height
+        # Canvas coordinates of the window's top-left pixel (turtle centers the view)
+        self.view_left = -width / 2
+        self.view_top = -height / 2
+        self.scroll_region = None # (left, top, right, bottom), or None if unlimited
+        self.refresh_pending = False
+        self.refresh()
+        self.canvas.bind("<Configure>", self.handle_configure, add="+")
+
+    def refresh(self):
+        """Re-reads the geometry from Tk. Called after resizing and scrolling."""
+        self.refresh_pending = False
+        canvas = self.canvas
+        if canvas.winfo_width() <= 1:
+            return # Not shown yet; keep the expected geometry
+        self.width = canvas.winfo_width()
+        self.height = canvas.winfo_height()
+        self.view_left = canvas.canvasx(0)
+        self.view_top = canvas.canvasy(0)
+        region = canvas.cget("scrollregion")
+        self.scroll_region = tuple(float(value) for value in region.split()) if region else None
+
+    def handle_configure(self, event):
+        """<Configure> handler: the canvas was resized."""
+        self.width, self.height = event.width, event.height
+        # turtle re-centers the view after a resize, so the scroll offsets
+        # are read once that has happened
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.canvas.after_idle(self.refresh)
+
+    # --- Mapping ---
+
+    def to_turtle(self, event_x, event_y):
+        """Converts event pixel coordinates to turtle coordinates."""
+        return self.view_left + event_x, -(self.view_top + event_y)
+
+    def visible_box(self, clip=False):
+        """
+        Returns the visible part of the canvas as (left, top, right, bottom)
+        canvas coordinates.
+
+        Args:
+            clip (bool): Clip the box to the scroll region. A window larger
+                than the scroll region shows more than the region.
+        """
+        left, top = self.view_left, self.view_top
+        right, bottom = left + self.width, top + self.height
+        if clip and self.scroll_region is not None:
+            region_left, region_top, region_right, region_bottom = self.scroll_region
+            left, top = max(left, region_left), max(top, region_top)
+            right, bottom = min(right, region_right), min(bottom, region_bottom)
+        return left, top, right, bottom
+
+    # --- Scrolling ---
+    # Scrolling does not produce a <Configure> event, so views must be moved
+    # through these methods for the cached offsets to stay correct.
+
+    def scroll(self, dx, dy):
+        """Scrolls the view by dx, dy scroll units."""
+        if dx:
+            self.canvas.xview_scroll(dx, "units")
+        if dy:
+            self.canvas.yview_scroll(dy, "units")
+        self.refresh()
+
+    def xview(self, *args):
+        """Horizontal scrollbar command."""
+        self.canvas.xview(*args)
+        self.refresh()
+
+    def yview(self, *args):
+        """Vertical scrollbar command."""
+        self.canvas.yview(*args)
+        self.refresh()
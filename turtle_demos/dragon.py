@@ -0,0 +1,191 @@
+import math
+import time
+
+from .backends import add_backend_arguments, finish_drawing, open_backend
+from .fast_turtle import FastTurtle
+
+# NOTE: The 'turtle' module is part of Python's standard library 
+# and does not require 'pip install'.
+# If you were installing an external library, the command would be: 
+# pip install <library-name>
+# For this script, no installation is needed.
+
+# --- Configuration for Dragon Curve ---
+ORDER = 13       # Recursion depth (higher = more detail, slightly slower)
+LENGTH = 5       # Length of each line segment (in pixels)
+START_DIRECTION = 45 # Initial direction (e.g., 0=East, 90=North)
+
+# --- Setup the Drawing Environment ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+
+# --- Gradient ---
+GRADIENT_START = (125, 211, 252) # Light blue, the curve's usual color
+GRADIENT_END = (244, 114, 182) # Pink
+GRADIENT_BUCKETS = 16 # Colors in the gradient; each one is drawn as a single batch
+
+
+# --- Dragon Curve Logic ---
+
+def generate_dragon_sequence(order):
+    """
+    Generates the sequence of 'R' (Right) and 'L' (Left) turns 
+    for the specified Dragon Curve order.
+    
+    Args:
+        order (int): The order of the fractal.
+        
+    Returns:
+        str: A string of R's and L's representing the turns.
+    """
+    sequence = ""
+    for i in range(1, order + 1):
+        # Create the reverse of the current sequence
+        reversed_sequence = sequence[::-1]
+        
+        # Swap R's and L's in the reversed sequence
+        new_turns = reversed_sequence.replace('R', 'x').replace('L', 'R').replace('x', 'L')
+        
+        # Append 'R' and the new turns to the current sequence
+        sequence = sequence + "R" + new_turns
+    
+    return sequence
+
+def draw_dragon_curve(t, sequence, length):
+    """
+    Draws the fractal based on the generated instruction sequence.
+    """
+    t.forward(length) # Initial segment
+    
+    # Iterate through the sequence of turns
+    for move in sequence:
+        if move == 'R':
+            t.right(90)
+        elif move == 'L':
+            t.left(90)
+        
+        # Draw the next segment after turning
+        t.forward(length)
+
+# --- Gradient Drawing ---
+
+def gradient_palette(buckets):
+    """
+    Returns `buckets` (r, g, b) colors (0-255) evenly spaced from
+    GRADIENT_START to GRADIENT_END.
+    """
+    steps = max(buckets - 1, 1)
+    return [tuple(round(start + (end - start) * i / steps) for start, end in zip(GRADIENT_START, GRADIENT_END))
+            for i in range(buckets)]
+
+def segment_buckets(lines, mode, buckets):
+    """
+    Quantizes a gradient value of every segment into a bucket number.
+
+    Args:
+        lines (list): (x0, y0, x1, y1) segments in drawing order.
+        mode (str): "index" (position along the curve), "heading"
+            (direction of the segment) or "distance" (of its midpoint from
+            the origin).
+        buckets (int): Number of buckets.
+
+    Returns:
+        list: A bucket number in range(buckets) for every segment.
+    """
+    if mode == "index":
+        values = [i / len(lines) for i in range(len(lines))]
+    elif mode == "heading":
+        values = [(math.degrees(math.atan2(y1 - y0, x1 - x0)) % 360) / 360 for x0, y0, x1, y1 in lines]
+    else:
+        distances = [math.hypot((x0 + x1) / 2, (y0 + y1) / 2) for x0, y0, x1, y1 in lines]
+        farthest = max(distances) or 1.0
+        values = [distance / farthest for distance in distances]
+    return [min(int(value * buckets), buckets - 1) for value in values]
+
+def draw_dragon_gradient(t, sequence, length, mode, buckets=GRADIENT_BUCKETS):
+    """
+    Draws the Dragon curve colored by a gradient quantized into `buckets`
+    colors. The curve is traced first (heading and distance need the
+    segments), then drawn: through a backend, all segments go out in one
+    batch of `buckets` colors; a turtle.Turtle changes its pen color only
+    when the bucket changes.
+    """
+    tracer = FastTurtle()
+    tracer.penup()
+    tracer.goto(t.position())
+    tracer.setheading(t.heading())
+    tracer.pendown()
+    draw_dragon_curve(tracer, sequence, length)
+    xs, ys = tracer.xs, tracer.ys
+    lines = list(zip(xs, ys, xs[1:], ys[1:]))
+    bucket_of = segment_buckets(lines, mode, buckets)
+    palette = gradient_palette(buckets)
+
+    if isinstance(t, FastTurtle):
+        t.draw_segments(lines, bucket_of, palette)
+        return
+    current = None
+    for (x0, y0, x1, y1), bucket in zip(lines, bucket_of):
+        if bucket != current:
+            t.pencolor(palette[bucket]) # Needs screen.colormode(255)
+            current = bucket
+        t.goto(x1, y1)
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    parser.add_argument("--level", "--order", dest="level", type=int, default=ORDER,
+                        help="Order of the curve")
+    parser.add_argument("--gradient", choices=["index", "heading", "distance"],
+                        help="Color the curve by segment index, heading or distance from the origin")
+    parser.add_argument("--buckets", type=int, default=GRADIENT_BUCKETS, help="Number of gradient colors")
+    add_backend_arguments(parser)
+
+def create_turtle(order):
+    """Opens the window and returns the drawing turtle."""
+    import turtle # Imported here so headless runs never load Tk
+
+    screen = turtle.Screen()
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.bgcolor("#1f2937") # Dark background
+    screen.title(f"Python Turtle - Dragon Curve Fractal (Order {order})")
+    screen.colormode(255) # Use 0-255 color range
+
+    # --- Initialize the Turtle ---
+    dragon_turtle = turtle.Turtle()
+    dragon_turtle.speed(0)      # Fastest drawing speed
+    dragon_turtle.hideturtle()  # Hide the turtle icon
+    dragon_turtle.pensize(1)
+    dragon_turtle.color("#7dd3fc") # Light blue color
+    return dragon_turtle
+
+def main(args):
+    """Draws the fractal with the turtle, or through the backend chosen with --backend."""
+    backend = open_backend(args, SCREEN_WIDTH, SCREEN_HEIGHT, "#1f2937", f"Python Turtle - Dragon Curve Fractal (Order {args.level})")
+    if backend is None:
+        dragon_turtle = create_turtle(args.level)
+    else:
+        dragon_turtle = FastTurtle(backend, color="#7dd3fc", width=1)
+
+    # --- Positioning the Turtle (to start drawing from the center-left) ---
+    dragon_turtle.penup()
+    dragon_turtle.goto(-100, 0)
+    dragon_turtle.setheading(START_DIRECTION)
+    dragon_turtle.pendown()
+
+    # --- Execute Drawing ---
+    start_time = time.perf_counter()
+    print(f"Generating Dragon Curve sequence at order {args.level}...")
+    sequence = generate_dragon_sequence(args.level)
+    print(f"Sequence length: {len(sequence)}")
+
+    print("Drawing Dragon Curve...")
+    if args.gradient:
+        draw_dragon_gradient(dragon_turtle, sequence, LENGTH, args.gradient, args.buckets)
+    else:
+        draw_dragon_curve(dragon_turtle, sequence, LENGTH)
+
+    print("Drawing complete.")
+
+    finish_drawing(dragon_turtle, args, start_time)
@@ -0,0 +1,296 @@
+import argparse
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from . import ccurve, dragon, koch
+from .headless import RecorderTurtle
+from .raster_backend import RasterBackend
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+# The GIF and PNG encoders below only use the standard library.
+#
+# Export the construction of a fractal as an animation:
+#   python -m turtle_demos.export dragon --level 13 --frames 1000 --output dragon.gif
+#   python -m turtle_demos.export koch --level 5 --output frames/koch.png   (koch_0000.png, ...)
+
+
+# --- Configuration ---
+BACKGROUND = "#1f2937" # Same dark background as the demos
+QUEUE_FRAMES = 8 # Frames waiting for the encoder thread before rendering pauses
+HOLD_SECONDS = 2.0 # How long a GIF shows the finished drawing before it loops
+
+
+# --- Fractal Traces ---
+# Each fractal is drawn once with a RecorderTurtle, from the same start as
+# its demo, and its segments are then split into animation frames.
+
+def trace_koch(level, size):
+    t = RecorderTurtle()
+    t.penup()
+    t.goto(-size / 2, size / 3)
+    t.pendown()
+    koch.draw_koch_snowflake(t, level, size)
+    return t.segments
+
+def trace_ccurve(level, size):
+    t = RecorderTurtle()
+    ccurve.c_curve(t, level, size)
+    return t.segments
+
+def trace_dragon(level, size):
+    t = RecorderTurtle()
+    t.penup()
+    t.goto(-100, 0)
+    t.setheading(dragon.START_DIRECTION)
+    t.pendown()
+    dragon.draw_dragon_curve(t, dragon.generate_dragon_sequence(level), size)
+    return t.segments
+
+# Name -> (trace function, default level, default size, (width, height), color, pen width)
+FRACTALS = {
+    "koch": (trace_koch, koch.RECURSION_LEVEL, koch.SIDE_LENGTH, (600, 600), "#60a5fa", 2),
+    "ccurve": (trace_ccurve, ccurve.RECURSION_LEVEL, ccurve.SIDE_LENGTH, (800, 600), "#fca5a5", 1),
+    "dragon": (trace_dragon, dragon.ORDER, dragon.LENGTH, (dragon.SCREEN_WIDTH, dragon.SCREEN_HEIGHT), "#7dd3fc", 1),
+}
+
+def polylines(segments):
+    """Joins consecutive (x0, y0, x1, y1) segments into point lists, splitting at pen-up gaps."""
+    lines = []
+    for x0, y0, x1, y1 in segments:
+        if not lines or lines[-1][-1] != (x0, y0):
+            lines.append([(x0, y0)])
+        lines[-1].append((x1, y1))
+    return lines
+
+
+# --- Frame Encoders ---
+# Both writers take changed rectangles: write_frame(pixels, left, top), where
+# `pixels` is a (height, width, 3) uint8 array. Only the GIF stores them as
+# delta frames; PNG files stand alone, so the PNG writer keeps one full frame.
+
+def lzw_encode(indices, min_code_size):
+    """GIF's variable-width LZW compression of a sequence of palette indices."""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    output = bytearray()
+    bit_buffer = 0
+    bit_count = 0
+
+    def emit(code, width):
+        nonlocal bit_buffer, bit_count
+        bit_buffer |= code << bit_count
+        bit_count += width
+        while bit_count >= 8:
+            output.append(bit_buffer & 0xFF)
+            bit_buffer >>= 8
+            bit_count -= 8
+
+    code_width = min_code_size + 1
+    table = {}
+    next_code = end_code + 1
+    emit(clear_code, code_width)
+    prefix = indices[0]
+    for index in indices[1:]:
+        key = (prefix, index)
+        if key in table:
+            prefix = table[key]
+            continue
+        emit(prefix, code_width)
+        if next_code < 4096:
+            table[key] = next_code
+            if next_code == 1 << code_width:
+                code_width += 1
+            next_code += 1
+        else:
+            # Table full: start over
+            emit(clear_code, code_width)
+            table = {}
+            code_width = min_code_size + 1
+            next_code = end_code + 1
+        prefix = index
+    emit(prefix, code_width)
+    emit(end_code, code_width)
+    if bit_count:
+        output.append(bit_buffer & 0xFF)
+    return bytes(output)
+
+class GifWriter:
+    """Writes an animated GIF frame by frame, each frame its changed rectangle only."""
+
+    def __init__(self, path, width, height, delay, loop=0):
+        """
+        Args:
+            path (str): Output file.
+            width (int), height (int): Size of the animation.
+            delay (float): Seconds between frames (GIF stores hundredths).
+            loop (int): Number of loops, 0 = forever.
+        """
+        self.file = open(path, "wb")
+        self.delay = max(int(round(delay * 100)), 1)
+        self.file.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+        # Netscape extension: loop the animation
+        self.file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def write_frame(self, pixels, left, top, delay=None):
+        height, width = pixels.shape[:2]
+        # Palette of this frame only (a local color table), at most 256 colors
+        keys = (pixels[:, :, 0].astype(np.uint32) << 16) | (pixels[:, :, 1].astype(np.uint32) << 8) | pixels[:, :, 2]
+        colors, indices = np.unique(keys.ravel(), return_inverse=True)
+        if len(colors) > 256:
+            raise ValueError(f"A GIF frame can have at most 256 colors, this one has {len(colors)}")
+        table_bits = max(int(len(colors) - 1).bit_length(), 1)
+        palette = np.zeros((1 << table_bits, 3), dtype=np.uint8)
+        palette[:len(colors)] = np.stack([colors >> 16, (colors >> 8) & 0xFF, colors & 0xFF], axis=1)
+
+        delay = self.delay if delay is None else max(int(round(delay * 100)), 1)
+        # Graphic control extension: keep the previous frame under this one (disposal 1)
+        self.file.write(b"\x21\xf9\x04\x04" + struct.pack("<H", delay) + b"\x00\x00")
+        self.file.write(b"\x2c" + struct.pack("<HHHHB", left, top, width, height, 0x80 | (table_bits - 1)))
+        self.file.write(palette.tobytes())
+        min_code_size = max(table_bits, 2)
+        data = lzw_encode(indices.tolist(), min_code_size)
+        self.file.write(bytes([min_code_size]))
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            self.file.write(bytes([len(block)]) + block)
+        self.file.write(b"\x00")
+
+    def close(self):
+        self.file.write(b"\x3b")
+        self.file.close()
+
+class PngSequenceWriter:
+    """Writes every frame as its own numbered PNG file: name_0000.png, name_0001.png, ..."""
+
+    def __init__(self, path, width, height, background):
+        self.pattern = path[:-len(".png")] + "_%04d.png" if path.endswith(".png") else path + "_%04d.png"
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+        self.frame[:] = background
+        self.count = 0
+
+    def write_frame(self, pixels, left, top, delay=None):
+        height, width = pixels.shape[:2]
+        self.frame[top:top + height, left:left + width] = pixels
+        with open(self.pattern % self.count, "wb") as file:
+            file.write(encode_png(self.frame))
+        self.count += 1
+
+    def close(self):
+        pass
+
+def encode_png(pixels):
+    """Encodes a (height, width, 3) uint8 array as an RGB PNG file."""
+    height, width = pixels.shape[:2]
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8) # A 0 (no filter) byte starts each row
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+            + chunk(b"IEND", b""))
+
+
+# --- Exporter ---
+
+def export_animation(name, output, level=None, size=None, frames=200, fps=30, color=None):
+    """
+    Renders the construction of a fractal into an animated GIF or a PNG
+    sequence. Frames are rendered with the raster backend and only their
+    changed rectangle is handed to an encoder thread, so rendering the next
+    frame overlaps encoding the previous ones and memory holds one frame.
+
+    Args:
+        name (str): "koch", "ccurve" or "dragon".
+        output (str): A .gif file, or a .png name for numbered PNG files.
+        level (int), size (float): Recursion level and segment size
+            (default: the demo's own).
+        frames (int): Number of drawing frames (plus the empty first one).
+        fps (int): Frames per second of the GIF.
+        color (str): Line color (default: the demo's own).
+
+    Returns:
+        tuple: (frames written, segments drawn).
+    """
+    trace, default_level, default_size, (width, height), default_color, pen_width = FRACTALS[name]
+    segments = trace(default_level if level is None else level, default_size if size is None else size)
+    color = color or default_color
+
+    backend = RasterBackend(width, height, BACKGROUND)
+    if output.endswith(".gif"):
+        writer = GifWriter(output, width, height, 1 / fps)
+    else:
+        writer = PngSequenceWriter(output, width, height, backend.background)
+
+    pending = queue.Queue(maxsize=QUEUE_FRAMES)
+    errors = []
+    def encode():
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            if not errors:
+                try:
+                    writer.write_frame(*item)
+                except Exception as error: # Reported on the main thread
+                    errors.append(error)
+    worker = threading.Thread(target=encode, daemon=True)
+    worker.start()
+
+    written = 0
+    try:
+        pending.put((backend.frame.copy(), 0, 0, None)) # The empty background
+        written += 1
+        # Frame i draws segments bounds[i]:bounds[i + 1], so exactly `frames`
+        # frames are written whatever the segment count
+        frames = max(frames, 1)
+        bounds = [round(i * len(segments) / frames) for i in range(frames + 1)]
+        for i, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            if errors:
+                break
+            for points in polylines(segments[start:end]):
+                backend.polyline(points, color, pen_width)
+            # Nothing visible changed (the curve is off screen, or the frame
+            # has no segments): a 1-pixel frame keeps the timing
+            left, top, right, bottom = backend.present() or (0, 0, 1, 1)
+            delay = HOLD_SECONDS if i == frames - 1 else None
+            # Copied, because the next frame draws into backend.frame while this one is encoded
+            pending.put((backend.frame[top:bottom, left:right].copy(), left, top, delay))
+            written += 1
+    finally:
+        pending.put(None)
+        worker.join()
+        writer.close()
+    if errors:
+        raise errors[0]
+    return written, len(segments)
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.export",
+                                     description="Export the construction of a fractal as an animation.")
+    parser.add_argument("fractal", choices=list(FRACTALS))
+    parser.add_argument("--level", "--order", dest="level", type=int, help="Recursion level (order for dragon)")
+    parser.add_argument("--size", type=float, help="Side or segment length")
+    parser.add_argument("--frames", type=int, default=200, help="Number of frames")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second (GIF only)")
+    parser.add_argument("--color", help="Line color, e.g. '#ffffff'")
+    parser.add_argument("--output", required=True, help="A .gif file, or a .png name for numbered PNG frames")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    written, segment_count = export_animation(args.fractal, args.output, args.level, args.size,
+                                              args.frames, args.fps, args.color)
+    print(f"Exported {written} frames ({segment_count} segments) to {args.output} "
+          f"in {time.perf_counter() - start_time:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import math
+
+from .backends import DEFAULT_LAYER
+
+# NOTE: This module only uses Python's standard library.
+
+
+# --- Configuration ---
+HEADING_STEP = 15 # Degrees per heading step: multiples of 60 (Koch), 45 (C-Curve) and 90 (Dragon)
+
+
+# --- Discrete-Heading Turtle ---
+
+class FastTurtle:
+    """
+    A turtle for the fractal drawing functions, whose turns are always
+    multiples of HEADING_STEP degrees. The heading is an integer index into a
+    table of precomputed unit vectors, so forward() is two multiply-adds, and
+    a heading of 90 degrees is exactly (0, 1) with no drift from cos/sin.
+    A turn is one lookup in a table of the headings it leads to.
+
+    Positions are appended to two lists (through bound append methods, so
+    forward() looks up nothing else) and nothing is drawn until flush(),
+    which sends every pen-down run to the backend as one polyline.
+    """
+
+    __slots__ = ("backend", "pen_color", "pen_width", "layer", "x", "y", "index", "is_down",
+                 "step", "directions", "left_turns", "right_turns", "unit_x", "unit_y", "xs", "ys", "append_x", "append_y", "run_starts", "flushed")
+
+    def __init__(self, backend=None, color="black", width=1, layer=DEFAULT_LAYER, step=HEADING_STEP):
+        self.backend = backend
+        self.pen_color = color
+        self.pen_width = width
+        self.layer = layer
+        self.x = 0.0
+        self.y = 0.0
+        self.index = 0 # Heading = index * step degrees, 0 = East, counterclockwise
+        self.is_down = True
+        self.step = step
+        directions = self.directions = 360 // step
+        # Angle -> the heading index each index turns to, for the few angles a fractal uses
+        self.left_turns = {}
+        self.right_turns = {}
+        # Rounded so that axis-aligned headings are exact
+        self.unit_x = [round(math.cos(math.radians(i * step)), 15) for i in range(directions)]
+        self.unit_y = [round(math.sin(math.radians(i * step)), 15) for i in range(directions)]
+        self.xs = [0.0] # Stored points; the start point is always stored
+        self.ys = [0.0]
+        self.append_x = self.xs.append
+        self.append_y = self.ys.append
+        self.run_starts = [0] # Index of the first point of every pen-down run
+        self.flushed = 0 # Segments already sent to the backend
+
+    # --- Movement ---
+
+    def forward(self, distance):
+        index = self.index
+        x = self.x = self.x + distance * self.unit_x[index]
+        y = self.y = self.y + distance * self.unit_y[index]
+        if self.is_down:
+            self.append_x(x)
+            self.append_y(y)
+        else:
+            self._move_pen_up(x, y)
+
+    def backward(self, distance):
+        self.forward(-distance)
+
+    def _steps(self, angle):
+        steps, remainder = divmod(angle, self.step)
+        if remainder:
+            raise ValueError(f"FastTurtle only turns by multiples of {self.step} degrees, not {angle}")
+        return int(steps)
+
+    def _add_turn(self, angle):
+        """Builds the turn tables of an angle the first time it is used."""
+        steps = self._steps(angle)
+        self.left_turns[angle] = [(index + steps) % self.directions for index in range(self.directions)]
+        self.right_turns[angle] = [(index - steps) % self.directions for index in range(self.directions)]
+
+    def left(self, angle):
+        try:
+            self.index = self.left_turns[angle][self.index]
+        except KeyError:
+            self._add_turn(angle)
+            self.index = self.left_turns[angle][self.index]
+
+    def right(self, angle):
+        try:
+            self.index = self.right_turns[angle][self.index]
+        except KeyError:
+            self._add_turn(angle)
+            self.index = self.right_turns[angle][self.index]
+
+    def setheading(self, angle):
+        self.index = self._steps(angle) % self.directions
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self.x, self.y = x, y
+        if self.is_down:
+            self.append_x(x)
+            self.append_y(y)
+        else:
+            self._move_pen_up(x, y)
+
+    def _move_pen_up(self, x, y):
+        # The next run starts here, replacing a start point no segment used
+        if self.run_starts[-1] == len(self.xs) - 1:
+            self.xs.pop()
+            self.ys.pop()
+            self.run_starts.pop()
+        self.run_starts.append(len(self.xs))
+        self.append_x(x)
+        self.append_y(y)
+
+    # --- Pen ---
+
+    def penup(self):
+        self.is_down = False
+
+    def pendown(self):
+        self.is_down = True
+
+    def isdown(self):
+        return self.is_down
+
+    def color(self, color, fill=None):
+        self.flush()
+        self.pen_color = color
+
+    pencolor = color
+
+    def pensize(self, width):
+        self.flush()
+        self.pen_width = width
+
+    width = pensize
+
+    def hideturtle(self):
+        pass
+
+    def speed(self, speed=None):
+        pass
+
+    # --- State ---
+
+    def position(self):
+        return self.x, self.y
+
+    pos = position
+
+    def heading(self):
+        return self.index * self.step
+
+    @property
+    def segment_count(self):
+        """Segments drawn so far, flushed or not."""
+        return self.flushed + len(self.xs) - len(self.run_starts)
+
+    # --- Output ---
+
+    def runs(self):
+        """Yields the point list of every pen-down run that has at least one segment."""
+        ends = self.run_starts[1:] + [len(self.xs)]
+        for start, end in zip(self.run_starts, ends):
+            if end - start > 1:
+                yield list(zip(self.xs[start:end], self.ys[start:end]))
+
+    def flush(self):
+        """Sends the stored runs to the backend and keeps only the current position."""
+        if self.backend is not None:
+            for points in self.runs():
+                self.backend.polyline(points, self.pen_color, self.pen_width, self.layer)
+        self.flushed = self.segment_count
+        # Emptied in place, as append_x and append_y are bound to these lists
+        self.xs[:] = [self.x]
+        self.ys[:] = [self.y]
+        self.run_starts = [0]
+
+    def draw_segments(self, lines, buckets, palette):
+        """
+        Draws (x0, y0, x1, y1) lines, line i in palette[buckets[i]], as one
+        batch through the backend's segments(). The turtle itself does not move.
+        """
+        self.flush()
+        self.backend.segments(lines, buckets, palette, self.pen_width, self.layer)
+        self.flushed += len(lines)
+
+    def draw_geometry(self, geometry):
+        """
+        Draws an InstancedGeometry (see geometry.py) with this turtle's pen.
+        The turtle itself does not move.
+        """
+        self.flush()
+        geometry.draw(self.backend, self.pen_color, self.pen_width, self.layer)
+        self.flushed += geometry.segment_count
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+from . import dragon, koch
+from .fast_turtle import FastTurtle
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+
+
+# --- Affine Transforms ---
+# 3x3 matrices acting on (x, y, 1) columns, combined with the @ operator:
+# translation(x, y) @ rotation(a) rotates first, then moves.
+
+def rotation(degrees):
+    """Counterclockwise rotation about the origin, like turtle.left()."""
+    radians = math.radians(degrees)
+    cos, sin = math.cos(radians), math.sin(radians)
+    return np.array([[cos, -sin, 0.0], [sin, cos, 0.0], [0.0, 0.0, 1.0]])
+
+def translation(x, y):
+    return np.array([[1.0, 0.0, x], [0.0, 1.0, y], [0.0, 0.0, 1.0]])
+
+def scaling(factor):
+    return np.array([[factor, 0.0, 0.0], [0.0, factor, 0.0], [0.0, 0.0, 1.0]])
+
+
+# --- Instanced Geometry ---
+
+class InstancedGeometry:
+    """
+    A polyline computed once (the base) and drawn under several affine
+    transforms. Each instance costs one (n, 2) x (2, 2) matrix multiply
+    instead of re-running the turtle that made the base.
+    """
+
+    def __init__(self, base, transforms):
+        """
+        Args:
+            base: Points of the base polyline, a sequence of (x, y).
+            transforms (list): 3x3 matrices, one per instance.
+        """
+        self.base = np.asarray(base, dtype=np.float64).reshape(-1, 2)
+        self.transforms = [np.asarray(matrix, dtype=np.float64) for matrix in transforms]
+
+    @property
+    def segment_count(self):
+        return (len(self.base) - 1) * len(self.transforms)
+
+    def instances(self):
+        """Yields the (n, 2) point array of every instance."""
+        for matrix in self.transforms:
+            yield self.base @ matrix[:2, :2].T + matrix[:2, 2]
+
+    def draw(self, backend, color, width=1, layer="drawing"):
+        """Sends every instance to a backend as one polyline."""
+        for points in self.instances():
+            backend.polyline(points, color, width, layer)
+
+def trace_polyline(draw, *args):
+    """
+    Runs a turtle drawing function that keeps its pen down on a FastTurtle
+    that starts at the origin heading East, and returns the points it
+    visited as an array.
+    """
+    t = FastTurtle()
+    draw(t, *args)
+    return np.column_stack([t.xs, t.ys])
+
+
+# --- Fractal Layouts ---
+
+def koch_snowflake(order, size, start=(0.0, 0.0)):
+    """
+    The Koch snowflake as one side instanced three times. It matches
+    draw_koch_snowflake() with the turtle at `start` heading East: each side
+    turns 120 degrees right and starts where the previous one ended.
+    """
+    side = trace_polyline(koch.koch_curve, order, size)
+    transforms = []
+    x, y = start
+    for index in range(3):
+        heading = -120 * index
+        transforms.append(translation(x, y) @ rotation(heading))
+        x += size * math.cos(math.radians(heading))
+        y += size * math.sin(math.radians(heading))
+    return InstancedGeometry(side, transforms)
+
+def dragon_tiling(order, length, copies=4, center=(0.0, 0.0)):
+    """
+    `copies` Dragon curves of the same order sharing one end point, each
+    turned 360/copies degrees from the previous. Four copies fill the plane
+    around `center` without overlapping.
+    """
+    curve = trace_polyline(dragon.draw_dragon_curve, dragon.generate_dragon_sequence(order), length)
+    return InstancedGeometry(curve, [translation(*center) @ rotation(360 * index / copies)
+                                     for index in range(copies)])
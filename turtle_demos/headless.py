@@ -0,0 +1,249 @@
+import math
+
+# NOTE: This module only uses Python's standard library. It does not import
+# 'turtle' or 'tkinter', so headless runs start fast and need no display.
+# The recorders are used by the games' headless screens and by the benchmarks
+# (bench.py); the fractals draw headless through backends.py.
+
+
+# --- Recording Turtle ---
+
+class RecorderTurtle:
+    """
+    A stand-in for turtle.Turtle that draws nothing and records the line
+    segments the real turtle would draw.
+
+    Only the movement and pen methods the demos use are implemented; styling
+    calls (speed, color, shape, ...) are accepted and ignored.
+    """
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.angle = 0.0 # Heading in degrees, 0 = East, counterclockwise
+        self.is_down = True
+        self.segments = [] # (x0, y0, x1, y1) for every line drawn
+
+    # --- Movement ---
+
+    def forward(self, distance):
+        radians = math.radians(self.angle)
+        self.goto(self.x + distance * math.cos(radians), self.y + distance * math.sin(radians))
+
+    def backward(self, distance):
+        self.forward(-distance)
+
+    def left(self, angle):
+        self.angle = (self.angle + angle) % 360
+
+    def right(self, angle):
+        self.angle = (self.angle - angle) % 360
+
+    def setheading(self, angle):
+        self.angle = angle % 360
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        if self.is_down:
+            self.segments.append((self.x, self.y, x, y))
+        self.x, self.y = x, y
+
+    # --- Pen ---
+
+    def penup(self):
+        self.is_down = False
+
+    def pendown(self):
+        self.is_down = True
+
+    def isdown(self):
+        return self.is_down
+
+    def clear(self):
+        self.segments.clear()
+
+    # --- State ---
+
+    def position(self):
+        return self.x, self.y
+
+    pos = position
+
+    def heading(self):
+        return self.angle
+
+    def distance(self, x, y=None):
+        if y is None:
+            x, y = x.position() if isinstance(x, RecorderTurtle) else x
+        return math.hypot(x - self.x, y - self.y)
+
+    def towards(self, x, y=None):
+        if y is None:
+            x, y = x.position() if isinstance(x, RecorderTurtle) else x
+        return math.degrees(math.atan2(y - self.y, x - self.x)) % 360
+
+    def __getattr__(self, name):
+        # Styling methods (speed, color, pensize, hideturtle, ...) do nothing
+        if name.startswith("_"):
+            raise AttributeError(name) # Private and special names are not stubbed
+        return lambda *args, **kwargs: None
+
+# --- Recording Screen and Canvas ---
+# Enough of turtle's screen and Tk canvas for the games and the paint app to
+# run without a display: timers and key bindings are stored so a caller can
+# fire them, and canvas items are kept in a dict so they can be counted.
+
+COLOR_NAMES = {
+    "white": "#ffffff", "black": "#000000", "red": "#ff0000", "blue": "#0000ff",
+    "green": "#008000", "orange": "#ffa500", "purple": "#800080",
+}
+
+class RecorderCanvas:
+    """A stand-in for a Tk canvas that stores items instead of drawing them."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.items = {} # item id -> [kind, coords, options]
+        self.next_item = 1
+        self.bindings = {} # event sequence -> handler
+        self.scroll_region = ""
+
+    def _create(self, kind, coords, options):
+        item = self.next_item
+        self.next_item += 1
+        self.items[item] = [kind, list(coords), options]
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", coords, options)
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item][1] = list(coords)
+        return self.items[item][1]
+
+    def itemconfig(self, item, **options):
+        self.items[item][2].update(options)
+
+    def delete(self, *items):
+        for item in items:
+            self.items.pop(item, None)
+
+    def bind(self, sequence, handler, add=None):
+        self.bindings[sequence] = handler
+
+    def winfo_rgb(self, color):
+        """Returns 16-bit (r, g, b) like Tk, for "#rrggbb" and a few color names."""
+        color = COLOR_NAMES.get(color, color)
+        return tuple(int(color[i:i + 2], 16) * 257 for i in (1, 3, 5))
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def canvasx(self, x):
+        return x - self.width / 2 # The view is centered on the origin, like turtle's
+
+    def canvasy(self, y):
+        return y - self.height / 2
+
+    def cget(self, option):
+        return self.scroll_region if option == "scrollregion" else ""
+
+    def after_idle(self, callback):
+        callback()
+
+    def __getattr__(self, name):
+        # Stacking and scrolling (tag_raise, xview, ...) do nothing
+        if name.startswith("_"):
+            raise AttributeError(name) # Private and special names are not stubbed
+        return lambda *args, **kwargs: None
+
+class RecorderImage:
+    """
+    A stand-in for tkinter.PhotoImage that counts the pixel data put into it
+    through `image.tk.call(image.name, "put", data, ...)`.
+    """
+
+    def __init__(self, master=None, width=0, height=0):
+        self.width = width
+        self.height = height
+        self.name = "recorder"
+        self.tk = self # PhotoImage commands go through image.tk.call()
+        self.puts = 0
+        self.bytes_put = 0
+
+    def call(self, name, command, data=b"", *options):
+        if command == "put":
+            self.puts += 1
+            self.bytes_put += len(data)
+
+class RecorderScreen:
+    """
+    A stand-in for turtle.Screen(). Timers and key handlers are stored so the
+    caller decides when they run (see run_timers()).
+    """
+
+    def __init__(self, width, height):
+        self.cv = RecorderCanvas(width, height)
+        self.timers = [] # Callbacks registered with ontimer(), in order
+        self.keys = {} # (event, key) -> handler, event is "press" or "release"
+        self.click_handler = None
+        self.updates = 0 # Number of screen.update() calls
+
+    def ontimer(self, callback, delay=0):
+        self.timers.append(callback)
+
+    def run_timers(self):
+        """Runs the callbacks queued so far (not those they queue). Returns how many ran."""
+        timers, self.timers = self.timers, []
+        for callback in timers:
+            callback()
+        return len(timers)
+
+    def onkey(self, handler, key):
+        self.keys[("release", key)] = handler
+
+    def onkeypress(self, handler, key):
+        self.keys[("press", key)] = handler
+
+    def onkeyrelease(self, handler, key):
+        self.keys[("release", key)] = handler
+
+    def onclick(self, handler):
+        self.click_handler = handler
+
+    def update(self):
+        self.updates += 1
+
+    def window_width(self):
+        return self.cv.width
+
+    def window_height(self):
+        return self.cv.height
+
+    def screensize(self, width=None, height=None):
+        if width is not None:
+            self.cv.scroll_region = f"{-width // 2} {-height // 2} {width // 2} {height // 2}"
+
+    def __getattr__(self, name):
+        # Window setup (setup, title, bgcolor, tracer, listen, ...) does nothing
+        if name.startswith("_"):
+            raise AttributeError(name) # Private and special names are not stubbed
+        return lambda *args, **kwargs: None
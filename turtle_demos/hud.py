@@ -0,0 +1,121 @@
+import time
+
+# NOTE: This module only uses Python's standard library.
+
+
+# --- Configuration ---
+DEFAULT_FONT = ("Inter", 16, "normal")
+REFRESH_SECONDS = 0.25 # Live fields are recomputed at most this often
+
+# turtle.write() alignment -> canvas text anchor (text sits on the y coordinate)
+ANCHORS = {"left": "sw", "center": "s", "right": "se"}
+
+
+# --- Heads-Up Display ---
+
+class Hud:
+    """
+    Status text kept as persistent canvas text items. set() changes an item
+    with itemconfig only when its text or font actually changed, instead of
+    deleting and re-creating the text like turtle.clear() + turtle.write().
+
+    Live fields are items whose text comes from a function; tick() (once
+    per frame) or run() (on a timer) recompute them at most every
+    `refresh_seconds`, and tick() also measures the frame rate for them.
+    """
+
+    def __init__(self, canvas, color="white", refresh_seconds=REFRESH_SECONDS):
+        self.canvas = canvas
+        self.color = color
+        self.refresh_seconds = refresh_seconds
+        self.items = {} # name -> [item, text, font]
+        self.fields = {} # name -> function returning the field's text
+        self.center = (0, 0) # Canvas point the items are placed around (see follow_view)
+        self.fps = 0.0
+        self.frames = 0 # Frames since the last refresh
+        self.last_refresh = time.perf_counter()
+        self.clock_start = self.last_refresh
+        self.clock_stop = None
+
+    # --- Text Items ---
+
+    def add_text(self, name, x, y, text="", font=DEFAULT_FONT, align="center"):
+        """Creates a text item at turtle position (x, y) relative to the view center."""
+        item = self.canvas.create_text(self.center[0] + x, self.center[1] - y, text=text, font=font,
+                                       fill=self.color, anchor=ANCHORS[align], tags=("hud",))
+        self.items[name] = [item, text, font]
+
+    def set(self, name, text, font=None):
+        """
+        Shows `text` (and optionally a new font) in a text item. Does nothing
+        if neither changed.
+
+        Returns:
+            bool: Whether the item was changed.
+        """
+        entry = self.items[name]
+        options = {}
+        if text != entry[1]:
+            options["text"] = entry[1] = text
+        if font is not None and font != entry[2]:
+            options["font"] = entry[2] = font
+        if options:
+            self.canvas.itemconfig(entry[0], **options)
+        return bool(options)
+
+    def add_field(self, name, x, y, source, font=DEFAULT_FONT, align="center"):
+        """Creates a live field: a text item showing source(), refreshed by tick() or run()."""
+        self.add_text(name, x, y, source(), font, align)
+        self.fields[name] = source
+
+    # --- Refreshing ---
+
+    def tick(self):
+        """Counts a frame; refreshes the live fields if they are due."""
+        self.frames += 1
+        now = time.perf_counter()
+        if now - self.last_refresh >= self.refresh_seconds:
+            self.fps = self.frames / (now - self.last_refresh)
+            self.frames = 0
+            self.last_refresh = now
+            self.refresh()
+
+    def refresh(self):
+        """Recomputes every live field now."""
+        for name, source in self.fields.items():
+            self.set(name, source())
+
+    def run(self, ontimer):
+        """
+        Keeps the live fields current on a timer, for screens without a game
+        loop, e.g. hud.run(screen.ontimer).
+        """
+        self.refresh()
+        ontimer(lambda: self.run(ontimer), int(self.refresh_seconds * 1000))
+
+    # --- Clock ---
+
+    def reset_clock(self):
+        self.clock_start = time.perf_counter()
+        self.clock_stop = None
+
+    def stop_clock(self):
+        if self.clock_stop is None:
+            self.clock_stop = time.perf_counter()
+
+    def elapsed(self):
+        """Seconds since reset_clock(), frozen by stop_clock()."""
+        return (self.clock_stop or time.perf_counter()) - self.clock_start
+
+    # --- Scrolled Canvases ---
+
+    def follow_view(self, center_x, center_y):
+        """
+        Keeps the items in place on screen when the canvas is scrolled: moves
+        them with the view center (in canvas coordinates).
+        """
+        dx, dy = center_x - self.center[0], center_y - self.center[1]
+        if dx or dy:
+            self.canvas.move("hud", dx, dy)
+            self.center = (center_x, center_y)
+        self.canvas.tag_raise("hud") # Above anything drawn since
@@ -0,0 +1,179 @@
+import argparse
+import math
+import time
+
+import numpy as np
+
+from .export import BACKGROUND, encode_png
+from .geometry import rotation, scaling, translation
+from .raster_backend import parse_color
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+#
+# Render a fractal as the density of a chaos game instead of drawing it:
+#   python -m turtle_demos.ifs dragon --points 5000000 --output dragon_density.png
+#
+# The Koch curve, the Levy C-Curve and the Heighway Dragon are attractors of
+# small iterated function systems (IFS): sets of shrinking affine maps. The
+# chaos game moves a point by a randomly chosen map over and over; after a few
+# steps it lies (to pixel precision) on the attractor, so counting where many
+# points land gives the curve at unlimited depth in a fixed amount of work.
+
+
+# --- Configuration ---
+DEFAULT_POINTS = 2_000_000 # Points accumulated into the histogram
+CHAINS = 65536 # Points moved together in one NumPy step
+BURN_IN = 24 # Steps before a point counts; each one shrinks the error by the map's scale
+GAMMA = 0.6 # < 1 brightens faint parts of the density image
+
+
+# --- Iterated Function Systems ---
+# Every system maps the segment from (0, 0) to (1, 0) onto the pieces its
+# demo's recursion replaces that segment with.
+
+def koch_maps():
+    """The Koch curve: four copies at 1/3 scale, the middle two turned +60 and -60 degrees."""
+    third = scaling(1 / 3)
+    return [
+        third,
+        translation(1 / 3, 0) @ rotation(60) @ third,
+        translation(1 / 2, math.sqrt(3) / 6) @ rotation(-60) @ third,
+        translation(2 / 3, 0) @ third,
+    ]
+
+def ccurve_maps():
+    """The Levy C-Curve, as c_curve() draws it: right 45, then left 90, at 1/sqrt(2) scale."""
+    half = scaling(1 / math.sqrt(2))
+    return [rotation(-45) @ half, translation(0.5, -0.5) @ rotation(45) @ half]
+
+def dragon_maps():
+    """The Heighway Dragon: two copies at 1/sqrt(2) scale, turned 45 and 135 degrees."""
+    half = scaling(1 / math.sqrt(2))
+    return [rotation(45) @ half, translation(1, 0) @ rotation(135) @ half]
+
+def koch_snowflake_placements():
+    """The snowflake is three Koch curves, each turned 120 degrees right of the previous one."""
+    placements = []
+    x = y = 0.0
+    for index in range(3):
+        heading = -120 * index
+        placements.append(translation(x, y) @ rotation(heading))
+        x += math.cos(math.radians(heading))
+        y += math.sin(math.radians(heading))
+    return placements
+
+# Name -> (maps, placements of the attractor, line color)
+SYSTEMS = {
+    "koch": (koch_maps, koch_snowflake_placements, "#60a5fa"),
+    "ccurve": (ccurve_maps, None, "#fca5a5"),
+    "dragon": (dragon_maps, None, "#7dd3fc"),
+}
+
+
+# --- Chaos Game ---
+
+def chaos_game(maps, points, placements=None, chains=CHAINS, burn_in=BURN_IN, seed=0):
+    """
+    Runs the chaos game on `chains` points at once and yields their
+    positions after every step past the burn-in, until `points` positions
+    have been produced.
+
+    Args:
+        maps (list): 3x3 affine matrices; all are chosen with equal chance.
+        points (int): Number of positions to produce.
+        placements (list): Optional 3x3 matrices; each position is placed
+            with one of them, chosen at random (e.g. the snowflake's sides).
+        seed (int): Seed for the random choices.
+
+    Yields:
+        numpy.ndarray: (n, 2) positions; n is `chains` except for the last chunk.
+    """
+    rng = np.random.default_rng(seed)
+    maps = np.array(maps)[:, :2, :] # (m, 2, 3)
+    placements = None if placements is None else np.array(placements)[:, :2, :]
+    xs = rng.random(chains)
+    ys = rng.random(chains)
+    produced = -burn_in * chains
+    while produced < points:
+        chosen = maps[rng.integers(len(maps), size=chains)]
+        xs, ys = (chosen[:, 0, 0] * xs + chosen[:, 0, 1] * ys + chosen[:, 0, 2],
+                  chosen[:, 1, 0] * xs + chosen[:, 1, 1] * ys + chosen[:, 1, 2])
+        produced += chains
+        if produced <= 0:
+            continue
+        count = min(chains, chains - (produced - points)) if produced > points else chains
+        out_x, out_y = xs[:count], ys[:count]
+        if placements is not None:
+            placed = placements[rng.integers(len(placements), size=count)]
+            out_x, out_y = (placed[:, 0, 0] * out_x + placed[:, 0, 1] * out_y + placed[:, 0, 2],
+                            placed[:, 1, 0] * out_x + placed[:, 1, 1] * out_y + placed[:, 1, 2])
+        yield np.column_stack([out_x, out_y])
+
+
+# --- Density Image ---
+
+def density(name, points, width, height, margin=0.05, seed=0):
+    """
+    Accumulates chaos game positions into a hit count per pixel. The view
+    is fitted to the first chunk of positions, keeping the aspect ratio.
+
+    Returns:
+        numpy.ndarray: (height, width) int64 hit counts.
+    """
+    maps, placements, _ = SYSTEMS[name]
+    counts = np.zeros(height * width, dtype=np.int64)
+    view = None
+    for chunk in chaos_game(maps(), points, placements() if placements else None, seed=seed):
+        if view is None:
+            low, high = chunk.min(axis=0), chunk.max(axis=0)
+            scale = (1 - 2 * margin) * min(width / max(high[0] - low[0], 1e-12),
+                                           height / max(high[1] - low[1], 1e-12))
+            center = (low + high) / 2
+            view = (center, scale)
+        center, scale = view
+        columns = np.floor((chunk[:, 0] - center[0]) * scale + width / 2).astype(np.int64)
+        rows = np.floor(height / 2 - (chunk[:, 1] - center[1]) * scale).astype(np.int64)
+        inside = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        counts += np.bincount(rows[inside] * width + columns[inside], minlength=height * width)
+    return counts.reshape(height, width)
+
+def render_density(counts, color, background=BACKGROUND, gamma=GAMMA):
+    """
+    Maps hit counts to colors on a log scale: 0 hits is the background and
+    the most hit pixel is the full line color.
+
+    Returns:
+        numpy.ndarray: (height, width, 3) uint8 image.
+    """
+    level = np.log1p(counts) / max(np.log1p(counts.max()), 1e-12)
+    level = (level ** gamma)[:, :, None]
+    background = parse_color(background).astype(np.float64)
+    color = parse_color(color).astype(np.float64)
+    return np.rint(background + (color - background) * level).astype(np.uint8)
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.ifs",
+                                     description="Render a fractal as the log-density of a chaos game.")
+    parser.add_argument("fractal", choices=list(SYSTEMS))
+    parser.add_argument("--points", type=int, default=DEFAULT_POINTS, help="Points to accumulate")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--color", help="Color of the densest pixels (default: the demo's line color)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="PNG file to write")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    counts = density(args.fractal, args.points, args.width, args.height, seed=args.seed)
+    image = render_density(counts, args.color or SYSTEMS[args.fractal][2])
+    with open(args.output, "wb") as image_file:
+        image_file.write(encode_png(image))
+    print(f"{args.points} points, {np.count_nonzero(counts)} pixels hit, written to {args.output} "
+          f"in {time.perf_counter() - start_time:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
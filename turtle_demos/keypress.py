@@ -0,0 +1,205 @@
+import turtle
+
+from .headless import RecorderScreen, RecorderTurtle
+from .hud import Hud
+from .launcher import add_async_arguments, wants_asyncio
+from .levels import LevelGenerator
+
+# NOTE: The 'turtle' module is part of Python's standard library 
+# and does not require 'pip install'.
+
+# --- Configuration for Turtle Game ---
+MOVE_DISTANCE = 10  # Pixels to move with each key press
+TURN_ANGLE = 30     # Degrees to turn with each key press
+WIN_DISTANCE = 20   # How close the player needs to be to win
+SPAWN_KEEP_OUT = 150 # No target spawns closer than this to the player's start
+
+# --- Setup the Drawing Environment ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 700
+is_game_over = False
+score = 0 # Targets reached this session
+
+# Screen and turtles, created by create_screen() when the game starts
+screen = None
+sketch_turtle = None
+target_turtle = None
+hud = None # Status text and live stats, see hud.py
+levels = None # Target positions, see levels.py
+
+
+def create_screen(headless=False, seed=None):
+    """
+    Opens the window and creates the player and target turtles and the HUD. With
+    `headless`, recorders that need no display are used instead (see headless.py).
+    `seed` makes the target positions reproducible.
+    """
+    global screen, sketch_turtle, target_turtle, hud, levels
+    screen = RecorderScreen(SCREEN_WIDTH, SCREEN_HEIGHT) if headless else turtle.Screen()
+    make_turtle = RecorderTurtle if headless else turtle.Turtle
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.bgcolor("#111827") # Dark background
+    screen.title("Python Turtle Game: Reach the Target!")
+    screen.tracer(0) # Turn off screen updates for smoother movement
+
+    # --- Initialize Player Turtle ---
+    sketch_turtle = make_turtle()
+    sketch_turtle.speed(0)      # Fastest animation speed
+    sketch_turtle.shape("turtle") # Use the default turtle shape
+    sketch_turtle.turtlesize(1.5)
+    sketch_turtle.pensize(3)
+    sketch_turtle.color("#38bdf8") # Bright blue color for drawing
+
+    # --- Initialize Target Turtle ---
+    target_turtle = make_turtle()
+    target_turtle.shape("circle")
+    target_turtle.color("#dc2626") # Red target
+    target_turtle.penup()
+    target_turtle.speed(0)
+    target_turtle.turtlesize(1.5)
+
+    # --- Initialize Level Generator ---
+    # Poisson-disk target positions; the next one is computed in the background
+    margin = 50
+    levels = LevelGenerator(1, (-SCREEN_WIDTH/2 + margin, -SCREEN_HEIGHT/2 + margin,
+                                SCREEN_WIDTH/2 - margin, SCREEN_HEIGHT/2 - margin),
+                            keep_out=(0, 0, SPAWN_KEEP_OUT), seed=seed)
+
+    # --- Initialize Heads-Up Display ---
+    # Persistent text items, changed in place instead of cleared and rewritten
+    hud = Hud(screen.cv)
+    hud.add_text("status", 0, SCREEN_HEIGHT/2 - 40)
+    hud.add_field("stats", 0, -SCREEN_HEIGHT/2 + 20, stats_text, font=("Inter", 12, "normal"))
+
+
+# --- Game Logic Functions ---
+
+def stats_text():
+    """The HUD's live line: elapsed time, score, distance to the target."""
+    return (f"Time {hud.elapsed():.1f}s | Score {score} | "
+            f"Distance {sketch_turtle.distance(target_turtle):.0f}")
+
+def check_win():
+    """Checks if the player turtle has reached the target."""
+    global is_game_over, score
+    if is_game_over:
+        return
+
+    # Check distance between the two turtles
+    distance = sketch_turtle.distance(target_turtle)
+    
+    if distance < WIN_DISTANCE:
+        is_game_over = True
+        score += 1
+        hud.stop_clock()
+        hud.set("status", "GOAL! Press [C] or Click to play again.", font=("Inter", 24, "bold"))
+        hud.refresh()
+        print("WIN: Target Reached!")
+        
+        # Stop drawing and hide the target
+        sketch_turtle.penup() 
+        target_turtle.hideturtle()
+        screen.update()
+
+def setup_game():
+    """Sets up the player and target for a new game."""
+    global is_game_over
+    is_game_over = False
+    
+    # 1. Reset Player Turtle
+    sketch_turtle.penup() 
+    sketch_turtle.clear()
+    sketch_turtle.goto(0, 0)
+    sketch_turtle.setheading(90) # Start pointing up
+    sketch_turtle.pendown()
+    
+    # 2. Position Target Turtle: the next level's spawn point
+    x, y = levels.next_level()[0]
+
+    target_turtle.goto(x, y)
+    target_turtle.showturtle()
+
+    # 3. Show the instructions and restart the clock
+    hud.set("status", "Use Arrows to move. Reach the red circle! (C to restart)", font=("Inter", 16, "normal"))
+    hud.reset_clock()
+
+    screen.update()
+
+
+# --- Player Control Functions ---
+
+def move_forward():
+    if not is_game_over:
+        sketch_turtle.forward(MOVE_DISTANCE)
+        screen.update()
+        check_win()
+
+def move_backward():
+    if not is_game_over:
+        sketch_turtle.backward(MOVE_DISTANCE)
+        screen.update()
+        check_win()
+
+def turn_left():
+    if not is_game_over:
+        sketch_turtle.left(TURN_ANGLE)
+        screen.update()
+
+def turn_right():
+    if not is_game_over:
+        sketch_turtle.right(TURN_ANGLE)
+        screen.update()
+
+def toggle_pen():
+    """Toggles the pen up (stop drawing) or pen down (start drawing)."""
+    if not is_game_over:
+        if sketch_turtle.isdown():
+            sketch_turtle.penup()
+        else:
+            sketch_turtle.pendown()
+
+def handle_click(x, y):
+    """Handles mouse click event: starts a new game."""
+    print(f"Mouse clicked at ({x}, {y}). Starting new game.")
+    setup_game()
+
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    parser.add_argument("--seed", type=int, help="Seed for reproducible target positions")
+    add_async_arguments(parser)
+
+def main(args):
+    """Opens the window and runs the game."""
+    create_screen(seed=args.seed)
+
+    # Initial setup: Start the first game
+    setup_game()
+
+    # Set up keyboard bindings
+    screen.onkey(move_forward, "Up")
+    screen.onkey(move_backward, "Down")
+    screen.onkey(turn_left, "Left")
+    screen.onkey(turn_right, "Right")
+    screen.onkey(toggle_pen, "space")
+
+    # Bind 'C' key to start new game
+    screen.onkey(setup_game, "c")
+    screen.onkey(setup_game, "C")
+
+    # Set up mouse click binding
+    screen.onclick(handle_click)
+
+    # Start listening for events (IMPORTANT!)
+    screen.listen()
+    hud.run(screen.ontimer) # Keeps the live stats current between key presses
+    print("Game started. Use arrow keys to control the blue turtle.")
+
+    # Keep the window open
+    if wants_asyncio(args):
+        from .async_runner import run_async # Imported here so the plain demo never loads asyncio
+        run_async(args, screen, stats_text=stats_text)
+        return
+    turtle.done()
@@ -0,0 +1,116 @@
+import time
+
+from .backends import add_backend_arguments, finish_drawing, open_backend
+from .fast_turtle import FastTurtle
+
+# NOTE: The 'turtle' module is part of Python's standard library 
+# and does not require 'pip install'.
+# If you were installing an external library, the command would be: 
+# pip install <library-name>
+# For this script, no installation is needed.
+
+# --- Configuration ---
+# Set the desired recursion depth (level of detail)
+# Warning: Higher levels (4+) take significantly longer to draw!
+RECURSION_LEVEL = 4
+SIDE_LENGTH = 300 # The length of the initial triangle side
+
+
+# --- Koch Curve Function (Recursive) ---
+def koch_curve(t, order, size):
+    """
+    Draws a Koch curve of a given order and size.
+    This is the fundamental recursive function.
+    
+    Args:
+        t (turtle.Turtle): The turtle object used for drawing.
+        order (int): The current recursion depth.
+        size (int): The length of the current line segment.
+    """
+    if order == 0:
+        # Base case: Draw a straight line segment
+        t.forward(size)
+    else:
+        # Recursive step: Break the line into 4 segments, 
+        # rotating and calling the function on each new segment.
+        
+        # 1. First third (straight)
+        koch_curve(t, order - 1, size / 3)
+        
+        # 2. Left turn (outward bump)
+        t.left(60)
+        koch_curve(t, order - 1, size / 3)
+        
+        # 3. Right turn (inward angle)
+        t.right(120)
+        koch_curve(t, order - 1, size / 3)
+        
+        # 4. Left turn (back to original direction)
+        t.left(60)
+        koch_curve(t, order - 1, size / 3)
+
+# --- Koch Snowflake Function ---
+def draw_koch_snowflake(t, order, size):
+    """
+    Draws the complete Koch Snowflake by drawing three Koch curves
+    and rotating 120 degrees after each one.
+    """
+    for i in range(3):
+        koch_curve(t, order, size)
+        t.right(120)
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    parser.add_argument("--level", type=int, default=RECURSION_LEVEL, help="Recursion level")
+    add_backend_arguments(parser)
+
+def create_turtle(level):
+    """Opens the window and returns the drawing turtle."""
+    import turtle # Imported here so headless runs never load Tk
+
+    # --- Setup the Drawing Environment ---
+    screen = turtle.Screen()
+    screen.setup(width=600, height=600)
+    screen.bgcolor("#1f2937") # Dark background for contrast
+    screen.title(f"Python Turtle - Koch Snowflake (Level {level})")
+
+    # --- Initialize the Turtle ---
+    snowflake_turtle = turtle.Turtle()
+    snowflake_turtle.speed(0) # Fastest drawing speed (0)
+    snowflake_turtle.hideturtle() # Hide the turtle icon
+    snowflake_turtle.pensize(2) 
+    snowflake_turtle.color("#60a5fa") # Bright blue line color
+    return snowflake_turtle
+
+def main(args):
+    """Draws the fractal with the turtle, or through the backend chosen with --backend."""
+    backend = open_backend(args, 600, 600, "#1f2937", f"Python Turtle - Koch Snowflake (Level {args.level})")
+    if backend is None:
+        snowflake_turtle = create_turtle(args.level)
+    else:
+        snowflake_turtle = FastTurtle(backend, color="#60a5fa", width=2)
+    # The instanced snowflake needs NumPy, which the recorder (--headless) must not load
+    instanced = args.backend in ("tk", "raster")
+    if instanced:
+        from .geometry import koch_snowflake # Imported before the timing starts
+
+    # --- Positioning the Turtle (to center the snowflake) ---
+    # Start drawing near the top-left of the screen 
+    # This ensures the entire shape is visible.
+    snowflake_turtle.penup()
+    snowflake_turtle.goto(-SIDE_LENGTH / 2, SIDE_LENGTH / 3)
+    snowflake_turtle.pendown()
+
+    # --- Execute Drawing ---
+    print(f"Drawing Koch Snowflake at level {args.level}...")
+    start_time = time.perf_counter()
+    if instanced:
+        # One side is computed once and drawn three times, rotated
+        snowflake_turtle.draw_geometry(koch_snowflake(args.level, SIDE_LENGTH, snowflake_turtle.position()))
+    else:
+        draw_koch_snowflake(snowflake_turtle, args.level, SIDE_LENGTH)
+    print("Drawing complete.")
+
+    finish_drawing(snowflake_turtle, args, start_time)
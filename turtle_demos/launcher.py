@@ -0,0 +1,64 @@
+import argparse
+import importlib
+import sys
+
+from . import DEMOS
+
+# NOTE: This module only uses Python's standard library.
+
+
+# --- Configuration ---
+TELEMETRY_HOST = "127.0.0.1" # Local connections only
+
+
+# --- Launcher ---
+
+def build_parser():
+    """Returns the top-level parser, which lists the demos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m turtle_demos",
+        description="Start one of the turtle demos. Use '<demo> --help' for its options.",
+    )
+    parser.add_argument("demo", choices=list(DEMOS), metavar="demo",
+                        help="; ".join(f"{name}: {description}" for name, (_, description) in DEMOS.items()))
+    return parser
+
+def main(argv=None):
+    """
+    Starts a demo, e.g. main(["koch", "--level", "6", "--headless"]).
+
+    Only the chosen demo's module is imported, and it is imported before its
+    options are parsed, because each module adds its own options.
+
+    Args:
+        argv (list): Command line arguments without the program name
+            (defaults to sys.argv[1:]).
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in DEMOS:
+        build_parser().parse_args(argv[:1] or ["--help"]) # Prints usage and exits
+    name = argv[0]
+    module_name, description = DEMOS[name]
+    module = importlib.import_module(module_name)
+
+    parser = argparse.ArgumentParser(prog=f"python -m turtle_demos {name}", description=description)
+    module.add_arguments(parser)
+    module.main(parser.parse_args(argv[1:]))
+
+
+# --- Shared Options ---
+# Options several demos accept. They live here, not in async_runner.py, so
+# adding them does not import asyncio; a demo imports run_async() from
+# async_runner.py only when wants_asyncio() says it is needed.
+
+def add_async_arguments(parser, telemetry=True):
+    """Adds the --asyncio (and --telemetry) options to a demo's argument parser."""
+    parser.add_argument("--asyncio", action="store_true",
+                        help="Run an asyncio event loop inside Tk's mainloop, for local services")
+    if telemetry:
+        parser.add_argument("--telemetry", type=int, metavar="PORT",
+                            help=f"Serve the live stats on {TELEMETRY_HOST}:PORT (implies --asyncio)")
+
+def wants_asyncio(args):
+    """Whether the options ask for async_runner.run_async() instead of turtle.done()."""
+    return args.asyncio or getattr(args, "telemetry", None) is not None
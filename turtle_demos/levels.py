@@ -0,0 +1,298 @@
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# NOTE: Game-sized levels only need Python's standard library. Large layouts
+# use NumPy (pip install numpy), which is imported only when one is made.
+#
+# Well-spaced random layouts (targets, obstacles) from Bridson's Poisson-disk
+# sampling: every point is at least `radius` from every other point, and a
+# background grid with cells of radius / sqrt(2) holds at most one point per
+# cell, so checking a candidate looks at a fixed 5x5 block of cells and the
+# whole sampling is O(n):
+#   python -m turtle_demos.levels 100000 --seed 1
+
+
+# --- Configuration ---
+CANDIDATES = 30 # Bridson's k: tries around an active point before it is retired
+LARGE_LAYOUT = 1000 # From this many points on, the NumPy sampler is used
+# A finished sampling holds at least about density / radius^2 points per unit area
+DENSITY = 0.6
+RING_DENSITY = 0.55 # The NumPy sampler, with fewer candidates, packs points a little looser
+PHASES = 3 # Cells in the same (row % 3, column % 3) phase are at least radius apart
+RING_CANDIDATES = 10 # Directions every point of the NumPy sampler tries, all at once
+SEED_SPACING = 40 # The NumPy sampler starts from random points about this many radii apart
+
+
+# --- Bounds ---
+
+def is_allowed(x, y, bounds, keep_out):
+    """True if (x, y) is inside bounds = (left, bottom, right, top) and outside the keep-out circle."""
+    left, bottom, right, top = bounds
+    if not (left <= x < right and bottom <= y < top):
+        return False
+    if keep_out is not None:
+        center_x, center_y, keep_radius = keep_out
+        return (x - center_x) ** 2 + (y - center_y) ** 2 >= keep_radius ** 2
+    return True
+
+def first_point(bounds, keep_out, uniform, tries=1000):
+    """Bridson's initial point: uniform in the bounds, outside the keep-out circle (None if none was found)."""
+    left, bottom, right, top = bounds
+    for _ in range(tries):
+        x, y = uniform(left, right), uniform(bottom, top)
+        if is_allowed(x, y, bounds, keep_out):
+            return x, y
+    return None
+
+
+# --- Bridson's Algorithm ---
+
+def poisson_disk(bounds, radius, seed=None, keep_out=None, candidates=CANDIDATES):
+    """
+    Bridson's Poisson-disk sampling, one active point at a time.
+
+    Args:
+        bounds (tuple): (left, bottom, right, top) in turtle coordinates.
+        radius (float): Smallest distance between two points.
+        seed: Seed for the random choices; the same seed gives the same points.
+        keep_out (tuple): Optional (x, y, radius) circle with no points in it,
+            e.g. around the player's spawn point.
+        candidates (int): Tries around an active point before it is retired.
+
+    Returns:
+        list: (x, y) points.
+    """
+    rng = random.Random(seed)
+    left, bottom, right, top = bounds
+    cell = radius / math.sqrt(2)
+    columns = max(1, math.ceil((right - left) / cell))
+    rows = max(1, math.ceil((top - bottom) / cell))
+    grid = [None] * (columns * rows) # Cell -> the point in it
+    points = []
+    active = []
+
+    def fits(x, y):
+        column, row = int((x - left) / cell), int((y - bottom) / cell)
+        if grid[row * columns + column] is not None:
+            return False
+        for near_row in range(max(row - 2, 0), min(row + 3, rows)):
+            for near_column in range(max(column - 2, 0), min(column + 3, columns)):
+                other = grid[near_row * columns + near_column]
+                if other is not None and (other[0] - x) ** 2 + (other[1] - y) ** 2 < radius * radius:
+                    return False
+        return True
+
+    def add(x, y):
+        point = (x, y)
+        grid[int((y - bottom) / cell) * columns + int((x - left) / cell)] = point
+        points.append(point)
+        active.append(point)
+
+    start = first_point(bounds, keep_out, rng.uniform)
+    if start is None:
+        return points
+    add(*start)
+    while active:
+        index = rng.randrange(len(active))
+        x, y = active[index]
+        for _ in range(candidates):
+            # Uniform over the area of the annulus between radius and 2 * radius
+            distance = math.sqrt(rng.uniform(radius * radius, 4 * radius * radius))
+            angle = rng.uniform(0, 2 * math.pi)
+            new_x, new_y = x + distance * math.cos(angle), y + distance * math.sin(angle)
+            if is_allowed(new_x, new_y, bounds, keep_out) and fits(new_x, new_y):
+                add(new_x, new_y)
+                break
+        else:
+            active[index] = active[-1] # No room left around this point
+            active.pop()
+    return points
+
+def poisson_disk_array(bounds, radius, seed=None, keep_out=None, candidates=RING_CANDIDATES):
+    """
+    Poisson-disk sampling with NumPy, for large layouts. It runs a common
+    refinement of Bridson's algorithm in which all active points step
+    together, so a round is a few array operations however many points are
+    active:
+
+    1. Every active point tries `candidates` evenly spaced directions, with
+       a random offset, each at a random distance between `radius` and
+       2 * radius as in Bridson's algorithm, then is retired. Candidates that
+       are out of bounds or in the keep-out circle are dropped.
+    2. Candidates are placed in PHASES x PHASES groups of cells. Within a
+       group cells are at least `radius` apart, so candidates of a group can
+       only clash with points already placed, which the grid check covers.
+       One candidate per cell is kept.
+    3. The points placed in this round are the next round's active points.
+
+    The sampling starts from random points about SEED_SPACING radii apart
+    rather than from one, so it takes tens of rounds instead of hundreds.
+
+    Takes the same arguments as poisson_disk().
+
+    Returns:
+        numpy.ndarray: (n, 2) points.
+    """
+    import numpy as np # Imported here so the games never need NumPy
+
+    rng = np.random.default_rng(seed)
+    left, bottom, right, top = bounds
+    cell = radius / math.sqrt(2)
+    columns = max(1, math.ceil((right - left) / cell))
+    rows = max(1, math.ceil((top - bottom) / cell))
+    # Cell -> index of its point, or -1. Two empty cells around the grid keep
+    # the 5x5 neighborhood lookups in range.
+    stride = columns + 4
+    grid = np.full((rows + 4) * stride, -1, dtype=np.int32)
+    # Point coordinates (at most one point per cell). Index -1, the entry of
+    # empty cells, is a point too far away to ever be in the way.
+    point_xs = np.full(rows * columns + 1, np.inf)
+    point_ys = np.full(rows * columns + 1, np.inf)
+    count = 0
+    # Grid offsets of the 5x5 neighborhood, without the corner cells (always farther than radius)
+    near = np.array([d_row * stride + d_column for d_row in range(-2, 3) for d_column in range(-2, 3)
+                     if abs(d_row) + abs(d_column) < 4])
+
+    def place(xs, ys):
+        """Adds the candidates that keep `radius` from every point; returns their indices."""
+        nonlocal count
+        keep = (xs >= left) & (xs < right) & (ys >= bottom) & (ys < top)
+        if keep_out is not None:
+            center_x, center_y, keep_radius = keep_out
+            keep &= (xs - center_x) ** 2 + (ys - center_y) ** 2 >= keep_radius ** 2
+        xs, ys = xs[keep], ys[keep]
+        cell_rows = ((ys - bottom) / cell).astype(np.int64)
+        cell_columns = ((xs - left) / cell).astype(np.int64)
+        flat = (cell_rows + 2) * stride + cell_columns + 2
+        phase = (cell_rows % PHASES) * PHASES + cell_columns % PHASES
+        first_new = count
+        for group in range(PHASES * PHASES):
+            chosen = np.flatnonzero(phase == group)
+            chosen = chosen[grid[flat[chosen]] < 0] # Empty cells only
+            neighbors = grid[flat[chosen, None] + near]
+            dx = point_xs[neighbors] - xs[chosen, None]
+            dy = point_ys[neighbors] - ys[chosen, None]
+            chosen = chosen[((dx * dx + dy * dy) >= radius * radius).all(axis=1)]
+            # One candidate per cell: the first one
+            _, first = np.unique(flat[chosen], return_index=True)
+            chosen = chosen[first]
+            new = np.arange(count, count + len(chosen))
+            point_xs[new], point_ys[new] = xs[chosen], ys[chosen]
+            grid[flat[chosen]] = new
+            count += len(chosen)
+        return np.arange(first_new, count)
+
+    seeds = max(1, round((right - left) * (top - bottom) / (SEED_SPACING * radius) ** 2))
+    active = place(rng.uniform(left, right, seeds), rng.uniform(bottom, top, seeds))
+    if not len(active):
+        start = first_point(bounds, keep_out, rng.uniform)
+        if start is not None:
+            active = place(np.array([start[0]]), np.array([start[1]]))
+    steps = 2 * np.pi * np.arange(candidates) / candidates
+    while len(active):
+        angle = (rng.uniform(0, 2 * np.pi, len(active))[:, None] + steps).ravel()
+        # Uniform over the area of the annulus between radius and 2 * radius, as in poisson_disk()
+        distance = radius * np.sqrt(rng.uniform(1, 4, len(angle)))
+        owners = np.repeat(active, candidates)
+        active = place(point_xs[owners] + distance * np.cos(angle), point_ys[owners] + distance * np.sin(angle))
+    return np.column_stack([point_xs[:count], point_ys[:count]])
+
+
+# --- Levels ---
+
+def spacing_for(count, bounds, keep_out=None, density=DENSITY):
+    """The Poisson-disk radius at which a sampling of the free area holds about `count` points or more."""
+    left, bottom, right, top = bounds
+    area = (right - left) * (top - bottom)
+    if keep_out is not None:
+        area -= math.pi * keep_out[2] ** 2 # Overestimates the area when the circle is not fully inside
+    return math.sqrt(density * max(area, 1.0) / count)
+
+def generate_layout(count, bounds, seed=None, keep_out=None):
+    """
+    Places `count` well-spaced points: a Poisson-disk sampling at
+    spacing_for(count), from which `count` points are picked at random. If
+    the sampling comes out short, the spacing shrinks by 10% and it runs
+    again. From LARGE_LAYOUT points on, poisson_disk_array() samples.
+
+    Returns:
+        list: (x, y) points; an empty list if no point fits.
+    """
+    rng = random.Random(seed)
+    radius = spacing_for(count, bounds, keep_out, RING_DENSITY if count >= LARGE_LAYOUT else DENSITY)
+    for _ in range(20):
+        sample_seed = rng.getrandbits(64)
+        if count >= LARGE_LAYOUT:
+            points = poisson_disk_array(bounds, radius, sample_seed, keep_out)
+            if len(points) >= count:
+                import numpy as np
+
+                chosen = np.random.default_rng(sample_seed).choice(len(points), count, replace=False)
+                return [tuple(point) for point in points[chosen].tolist()]
+        else:
+            points = poisson_disk(bounds, radius, sample_seed, keep_out)
+            if len(points) >= count:
+                return rng.sample(points, count)
+        if not len(points):
+            return []
+        radius *= 0.9
+    return [tuple(map(float, point)) for point in points] # NumPy rows become (x, y) float tuples
+
+class LevelGenerator:
+    """
+    Hands out the layouts of levels 0, 1, 2, ... in order. Level n is seeded
+    from the generator's seed and n, so a seed replays the same levels, and
+    the next level is computed in a background thread while the current one
+    is played.
+    """
+
+    def __init__(self, count, bounds, keep_out=None, seed=None):
+        """
+        Args:
+            count (int): Points per level (targets, obstacles, ...).
+            bounds (tuple): (left, bottom, right, top) in turtle coordinates.
+            keep_out (tuple): Optional (x, y, radius) circle left empty.
+            seed (int): Seed for all levels; None picks one from `random`.
+        """
+        self.count = count
+        self.bounds = bounds
+        self.keep_out = keep_out
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.number = 0 # Level handed out next
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = self.executor.submit(self.layout, 0)
+
+    def layout(self, number):
+        return generate_layout(self.count, self.bounds, (self.seed << 32) + number, self.keep_out)
+
+    def next_level(self):
+        """Returns the next level's points and starts computing the one after it."""
+        points = self.pending.result()
+        self.number += 1
+        self.pending = self.executor.submit(self.layout, self.number)
+        return points
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.levels",
+                                     description="Time a Poisson-disk layout on the game screen.")
+    parser.add_argument("count", type=int, help="Points to place")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=700)
+    parser.add_argument("--keep-out", type=float, default=150, help="Empty radius around the center")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    bounds = (-args.width / 2, -args.height / 2, args.width / 2, args.height / 2)
+    start_time = time.perf_counter()
+    points = generate_layout(args.count, bounds, args.seed, (0, 0, args.keep_out))
+    print(f"{len(points)} points placed in {time.perf_counter() - start_time:.3f}s.")
+
+
+if __name__ == "__main__":
+    main()
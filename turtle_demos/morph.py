@@ -0,0 +1,228 @@
+import math
+import time
+
+import numpy as np
+
+from . import ccurve, dragon, koch
+from .fast_turtle import FastTurtle
+from .headless import RecorderScreen
+from .hud import Hud
+
+# NOTE: The 'turtle' module is part of Python's standard library, but NumPy
+# is NOT: install it with: pip install numpy
+
+
+# --- Configuration ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 700
+MORPH_SECONDS = 0.6 # Duration of the animation from one level to the next
+FRAME_MS = 16 # Delay between animation frames (about 60 FPS)
+
+# Curve -> (start point, size, line color, highest level). The highest levels
+# keep every curve at or below about 100k vertices.
+CURVES = {
+    "koch": ((-150, 100), koch.SIDE_LENGTH, "#60a5fa", 7),
+    "ccurve": ((-150, 130), 300, "#fca5a5", 16),
+    "dragon": ((-175, -75), 400, "#7dd3fc", 16),
+}
+
+# --- Global State ---
+curve = "koch"
+level = 0 # Level currently shown (the lower one while morphing)
+target_level = 0 # Level the Up/Down keys asked for
+morph = None # (from level, to level, start time) while a morph is running
+frame_times = [] # Seconds spent building each morph frame, for the FPS readout
+cache = {} # (curve, level) -> vertex array, (curve, level, "morph") -> morph arrays
+
+# Screen, HUD and the canvas line item, created by create_screen()
+screen = None
+hud = None
+line_item = None
+
+
+# --- Cached Geometry ---
+
+def vertices(name, n):
+    """
+    Returns the (count, 2) vertex array of a curve at level n, computing it
+    once. Level n + 1 refines level n: every segment is replaced by 4 (Koch)
+    or 2 (C-Curve, Dragon) segments between the same end points.
+    """
+    key = (name, n)
+    if key not in cache:
+        start, size, _, _ = CURVES[name]
+        t = FastTurtle()
+        t.penup()
+        t.goto(start)
+        if name == "dragon":
+            # Each order is the previous one turned 45 degrees, at 1/sqrt(2) the segment length
+            t.setheading(45 * n)
+            t.pendown()
+            dragon.draw_dragon_curve(t, dragon.generate_dragon_sequence(n), size / math.sqrt(2) ** n)
+        elif name == "ccurve":
+            t.pendown()
+            ccurve.c_curve(t, n, size)
+        else:
+            t.pendown()
+            koch.draw_koch_snowflake(t, n, size)
+        cache[key] = np.column_stack([t.xs, t.ys])
+    return cache[key]
+
+def morph_arrays(name, n):
+    """
+    Returns (start, change) for the morph from level n to n + 1, as flat
+    canvas coordinate arrays: a frame at progress s is start + s * change.
+
+    At s = 0 every level n + 1 vertex sits at its projection onto the level n
+    segment it refines, so the picture is exactly level n; the Koch bumps and
+    the C-Curve and Dragon corners then grow out of the segments' middles.
+    """
+    key = (name, n, "morph")
+    if key not in cache:
+        parent = vertices(name, n)
+        child = vertices(name, n + 1)
+        per_segment = (len(child) - 1) // (len(parent) - 1)
+        segment = np.minimum(np.arange(len(child)) // per_segment, len(parent) - 2)
+        a, b = parent[segment], parent[segment + 1]
+        direction = b - a
+        along = np.einsum("ij,ij->i", child - a, direction) / np.einsum("ij,ij->i", direction, direction)
+        start = a + np.clip(along, 0.0, 1.0)[:, None] * direction
+        flip = np.array([1.0, -1.0]) # Canvas y points down
+        cache[key] = ((start * flip).ravel(), ((child - start) * flip).ravel())
+    return cache[key]
+
+def static_coords(name, n):
+    return (vertices(name, n) * np.array([1.0, -1.0])).ravel().tolist()
+
+
+# --- Screen ---
+
+def create_screen(headless=False):
+    """
+    Opens the window and creates the HUD and the curve's canvas line.
+    With `headless`, a recorder screen that needs no display is used instead.
+    """
+    global screen, hud, line_item
+    if headless:
+        screen = RecorderScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+    else:
+        import turtle # Imported here so headless runs never load Tk
+
+        screen = turtle.Screen()
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.bgcolor("#1f2937")
+    screen.title("Python Turtle - Fractal Level Morphing")
+    screen.tracer(0) # Frames are shown by screen.update()
+
+    hud = Hud(screen.cv)
+    hud.add_text("status", 0, SCREEN_HEIGHT / 2 - 40, font=("Arial", 14, "normal"))
+
+    # The whole curve is one canvas line; frames only change its coordinates
+    line_item = screen.cv.create_line(0, 0, 0, 0, fill=CURVES[curve][2], width=1)
+
+
+# --- Drawing ---
+
+def write_status():
+    fps = ""
+    if frame_times:
+        fps = f" | {len(frame_times) / max(sum(frame_times), 1e-9):.0f} FPS max"
+    hud.set("status", f"{curve} level {level} ({len(vertices(curve, level))} vertices){fps} "
+                      f"| Up/Down: level, 1/2/3: curve")
+
+def show_level():
+    """Draws the current level without morphing."""
+    screen.cv.coords(line_item, static_coords(curve, level))
+    write_status()
+    screen.update()
+
+def morph_frame(progress):
+    """
+    Draws the morph between `level` and `level + 1` at `progress` (0 to 1):
+    one vectorized interpolation and one coords update of the line.
+    """
+    started = time.perf_counter()
+    start, change = morph_arrays(curve, level)
+    eased = progress * progress * (3 - 2 * progress) # Smoothstep: slow in, slow out
+    screen.cv.coords(line_item, (start + eased * change).tolist())
+    frame_times.append(time.perf_counter() - started)
+    screen.update()
+
+def animate():
+    """Runs one animation frame and schedules the next while a morph is running."""
+    global morph, level
+    if morph is None:
+        return
+    from_level, to_level, started = morph
+    progress = min((time.perf_counter() - started) / MORPH_SECONDS, 1.0)
+    if to_level < from_level:
+        progress = 1.0 - progress # Going down plays the morph backwards
+    morph_frame(progress)
+    if (time.perf_counter() - started) < MORPH_SECONDS:
+        screen.ontimer(animate, FRAME_MS)
+        return
+    morph = None
+    level = to_level
+    show_level()
+    step_toward_target()
+
+def step_toward_target():
+    """Starts the morph to the next level in the direction of target_level."""
+    global morph, level
+    if morph is not None or target_level == level:
+        return
+    if target_level > level:
+        morph = (level, level + 1, time.perf_counter())
+    else:
+        level -= 1 # Morphs always run between `level` and `level + 1`
+        morph = (level + 1, level, time.perf_counter())
+    del frame_times[:]
+    animate()
+
+
+# --- Key Handlers ---
+
+def level_up():
+    global target_level
+    target_level = min(target_level + 1, CURVES[curve][3])
+    step_toward_target()
+
+def level_down():
+    global target_level
+    target_level = max(target_level - 1, 0)
+    step_toward_target()
+
+def select_curve(name):
+    """Switches to another curve, keeping the level where it can."""
+    global curve, level, target_level, morph
+    curve = name
+    level = target_level = min(target_level, CURVES[name][3])
+    morph = None
+    screen.cv.itemconfig(line_item, fill=CURVES[name][2])
+    show_level()
+
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    parser.add_argument("--curve", choices=list(CURVES), default=curve, help="Curve to start with")
+    parser.add_argument("--level", type=int, default=2, help="Level to start at")
+
+def main(args):
+    """Opens the window; Up/Down morph between levels, 1/2/3 switch curves."""
+    global curve, level, target_level
+    curve = args.curve
+    level = target_level = max(0, min(args.level, CURVES[curve][3]))
+    create_screen()
+    show_level()
+
+    screen.onkey(level_up, "Up")
+    screen.onkey(level_down, "Down")
+    for key, name in zip("123", CURVES):
+        screen.onkey(lambda name=name: select_curve(name), key)
+    screen.listen()
+
+    print("Use Up/Down to change the level and 1/2/3 to switch curves.")
+    import turtle
+    turtle.done()
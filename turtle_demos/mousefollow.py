@@ -0,0 +1,249 @@
+import turtle
+
+from .canvas_mapper import CanvasMapper
+from .headless import RecorderScreen, RecorderTurtle
+from .hud import Hud
+from .launcher import add_async_arguments, wants_asyncio
+from .levels import LevelGenerator
+
+# NOTE: The 'turtle' module is part of Python's standard library 
+# and does not require 'pip install'.
+
+# --- Configuration for Turtle Game ---
+MOVE_DISTANCE = 5   # Speed of the turtle when following the mouse
+WIN_DISTANCE = 20   # How close the player needs to be to win
+GAME_TICK = 30      # Milliseconds delay for game loop (approx. 30 FPS)
+SPAWN_KEEP_OUT = 150 # No target spawns closer than this to the player's start
+
+# --- Global Game State ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 700
+is_game_over = False
+score = 0 # Targets reached this session
+
+# New global state for continuous mouse tracking (Fix for AttributeError)
+cursor_x = 0
+cursor_y = 0
+is_mouse_visible = False # True if the mouse is currently over the canvas
+
+# Screen and turtles, created by create_screen() when the game starts
+screen = None
+sketch_turtle = None
+target_turtle = None
+hud = None # Status text and live stats, see hud.py
+levels = None # Target positions, see levels.py
+level_seed = None
+mapper = None
+
+
+def create_screen(headless=False, seed=None):
+    """
+    Opens the window and creates the player and target turtles and the HUD. With
+    `headless`, recorders that need no display are used instead (see headless.py).
+    `seed` makes the target positions reproducible.
+    """
+    global screen, sketch_turtle, target_turtle, hud, mapper, level_seed
+    screen = RecorderScreen(SCREEN_WIDTH, SCREEN_HEIGHT) if headless else turtle.Screen()
+    make_turtle = RecorderTurtle if headless else turtle.Turtle
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.bgcolor("#111827") # Dark background
+    screen.title("Python Turtle Game: Cursor Follower (Fixed)")
+    screen.tracer(0) # Turn off screen updates for manual control in the game loop
+
+    # Maps mouse pixels to turtle coordinates; follows window resizes via <Configure>
+    mapper = CanvasMapper(screen.cv, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    # --- Initialize Player Turtle ---
+    sketch_turtle = make_turtle()
+    sketch_turtle.speed(0)      # Fastest animation speed
+    sketch_turtle.shape("turtle") # Use the default turtle shape
+    sketch_turtle.turtlesize(1.5)
+    sketch_turtle.pensize(3)
+    sketch_turtle.color("#38bdf8") # Bright blue color for drawing
+    sketch_turtle.penup() # Pen up by default for chase movement
+
+    # --- Initialize Target Turtle ---
+    target_turtle = make_turtle()
+    target_turtle.shape("circle")
+    target_turtle.color("#dc2626") # Red target
+    target_turtle.penup()
+    target_turtle.speed(0)
+    target_turtle.turtlesize(1.5)
+
+    level_seed = seed # Target positions come from levels.py, see setup_game()
+
+    # --- Initialize Heads-Up Display ---
+    # Persistent text items, changed in place instead of cleared and rewritten
+    hud = Hud(screen.cv)
+    hud.add_text("status", 0, SCREEN_HEIGHT/2 - 40)
+    hud.add_field("stats", 0, -SCREEN_HEIGHT/2 + 20, stats_text, font=("Inter", 12, "normal"))
+
+
+# --- Mouse Handler Functions (FIX: New functions to track mouse motion) ---
+
+def handle_mouse_motion(event):
+    """Updates global cursor coordinates using Tkinter event data (continuous tracking)."""
+    global cursor_x, cursor_y, is_mouse_visible
+    # Convert Tkinter pixel coordinates (event.x, event.y) to Turtle coordinates (relative to center)
+    cursor_x, cursor_y = mapper.to_turtle(event.x, event.y)
+    is_mouse_visible = True
+
+def handle_mouse_leave(event):
+    """Called when the mouse leaves the drawing window, stopping the follow movement."""
+    global is_mouse_visible
+    is_mouse_visible = False
+
+
+# --- Game Logic Functions ---
+
+def stats_text():
+    """The HUD's live line: elapsed time, score, distance to the target and frame rate."""
+    return (f"Time {hud.elapsed():.1f}s | Score {score} | "
+            f"Distance {sketch_turtle.distance(target_turtle):.0f} | {hud.fps:.0f} FPS")
+
+def check_win():
+    """Checks if the player turtle has reached the target."""
+    global is_game_over, score
+    if is_game_over:
+        return
+
+    distance = sketch_turtle.distance(target_turtle)
+    
+    if distance < WIN_DISTANCE:
+        is_game_over = True
+        score += 1
+        hud.stop_clock()
+        hud.set("status", "GOAL! Press [C] or Click to play again.", font=("Inter", 24, "bold"))
+        hud.refresh()
+        print("WIN: Target Reached!")
+        
+        sketch_turtle.penup() 
+        target_turtle.hideturtle()
+        screen.update()
+
+def setup_game():
+    """Sets up the player and target for a new game."""
+    global is_game_over, levels
+    is_game_over = False
+    
+    # 1. Reset Player Turtle
+    sketch_turtle.penup() 
+    sketch_turtle.clear()
+    sketch_turtle.goto(0, 0)
+    sketch_turtle.setheading(90) # Start pointing up
+    
+    # 2. Position Target Turtle inside the visible area, away from the start.
+    # The generator computes the next position in the background; it is
+    # replaced when the window size changes.
+    left, top, right, bottom = mapper.visible_box()
+    # Margin from the window edges, less in a small window so the bounds never turn inside out
+    margin = min(50, (right - left) / 4, (bottom - top) / 4)
+    bounds = (left + margin, -bottom + margin, right - margin, -top - margin)
+    # Keep-out radius around the start (less if the window is too small for it)
+    keep_out = max(0, min(SPAWN_KEEP_OUT, (right - left) / 2 - 60, (bottom - top) / 2 - 60))
+    if levels is None or levels.bounds != bounds:
+        levels = LevelGenerator(1, bounds, keep_out=(0, 0, keep_out),
+                                seed=level_seed)
+    x, y = levels.next_level()[0]
+
+    target_turtle.goto(x, y)
+    target_turtle.showturtle()
+
+    # 3. Show the instructions and restart the clock
+    hud.set("status", "Move mouse over the screen to guide the turtle! Click/C to restart after GOAL.", font=("Inter", 16, "normal"))
+    hud.reset_clock()
+
+    screen.update()
+
+def handle_click(x, y):
+    """Handles simple mouse click event: Only starts a new game if the current one is over."""
+    global is_game_over
+    if is_game_over:
+        setup_game()
+        return
+    
+    # If the game is active, clicks have no effect (movement is automatic)
+
+
+# --- Continuous Game Loop ---
+
+def update_game():
+    """
+    One tick of the game loop: checks the state and moves the turtle.
+    This loop now uses the event-updated global mouse position.
+    """
+    if not is_game_over:
+        moved = False
+        
+        # 1. Get the current mouse coordinates from global variables
+        global cursor_x, cursor_y, is_mouse_visible
+        
+        # 2. Check if the cursor is actually inside the window area
+        if is_mouse_visible:
+            
+            distance_to_cursor = sketch_turtle.distance(cursor_x, cursor_y)
+            
+            # Only move if we are far enough from the cursor to prevent jitter
+            if distance_to_cursor > MOVE_DISTANCE / 2: 
+                # Turn and move one step towards the cursor's position
+                sketch_turtle.setheading(sketch_turtle.towards(cursor_x, cursor_y))
+                sketch_turtle.forward(MOVE_DISTANCE)
+                moved = True
+            
+        # 3. Check for Win Condition
+        if moved:
+            check_win()
+
+        # 4. Manually update the screen once per tick
+        hud.tick() # Live stats, recomputed a few times per second
+        screen.update()
+
+def game_loop():
+    """The main game loop: runs a tick, then schedules the next one."""
+    update_game()
+    screen.ontimer(game_loop, GAME_TICK)
+
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    parser.add_argument("--seed", type=int, help="Seed for reproducible target positions")
+    add_async_arguments(parser)
+
+def main(args):
+    """Opens the window and runs the game."""
+    create_screen(seed=args.seed)
+
+    # Initial setup: Start the first game
+    setup_game()
+
+    # BIND THE CONTINUOUS MOUSE TRACKING EVENT (FIX)
+    # We use the underlying Tkinter canvas (.cv) to bind the <Motion> event
+    # for continuous tracking, which is not available directly on the turtle screen object.
+    screen.cv.bind('<Motion>', handle_mouse_motion)
+    screen.cv.bind('<Leave>', handle_mouse_leave)
+
+    # Set up only the discrete keyboard and mouse bindings
+
+    # Bind 'C' key for new game
+    screen.onkey(setup_game, "c")
+    screen.onkey(setup_game, "C")
+
+    # Bind mouse click only for restarting the game after goal
+    screen.onclick(handle_click)
+
+    # Start listening for events (IMPORTANT!)
+    screen.listen()
+
+    print("Game started with mouse following enabled.")
+    # Start the continuous game loop
+    game_loop()
+
+    # Keep the window open
+    if wants_asyncio(args):
+        from .async_runner import run_async # Imported here so the plain demo never loads asyncio
+        # Tk's mainloop keeps running the game loop; local services run inside it
+        run_async(args, screen, stats_text=stats_text)
+        return
+    turtle.done()
@@ -0,0 +1,757 @@
+import os
+import time
+import turtle
+
+from .canvas_mapper import CanvasMapper
+from .headless import RecorderImage, RecorderScreen, RecorderTurtle
+from .hud import Hud
+from .launcher import add_async_arguments, wants_asyncio
+from .paint_collab import DEFAULT_HOST, MSG_COMMAND, MSG_POINTS, CollabClient
+from .paint_history import StrokeCommand, StrokeHistory
+from .paint_journal import (OP_REDO, OP_UNDO, JournalWriter, decode_journal, encode_control,
+                            encode_fill, encode_stroke, load_journal)
+from .paint_raster import RasterLayer
+from .paint_strokes import StrokeDocument, StrokeSimplifier, catmull_rom
+
+# NOTE: The 'turtle' module is part of Python's standard library 
+# and does not require 'pip install'.
+# The raster layer (paint_raster.py) needs NumPy: pip install numpy
+
+# --- Configuration ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 700
+DOCUMENT_WIDTH = 20000 # The painting is larger than the window and scrolls
+DOCUMENT_HEIGHT = 20000
+SCROLL_STEP = 5 # Scroll units moved per arrow key press
+DEFAULT_PENSIZE = 5
+MIN_PENSIZE = 1
+MAX_PENSIZE = 20
+DEFAULT_ERASER_SIZE = 50 # New default constant
+MAX_ERASER_SIZE = 100 # New max constant
+FRAME_DELAY = 16 # Milliseconds between coalesced repaints (approx. 60 FPS)
+BACKGROUND_COLOR = "#111827"
+COLOR_PALETTE = ["red", "blue", "green", "orange", "purple"]
+SIMPLIFY_TOLERANCE = 1.0 # Pixels a dropped drag sample may deviate from the stored stroke
+CURVE_SUBDIVISIONS = 0 # Catmull-Rom segments per stored span when flattening (0 = straight)
+FILL_TOLERANCE = 32 # Max per-channel difference from the clicked color that the bucket fill spreads over
+FILL_CURSOR_SIZE = 8 # Diameter of the cursor oval in fill mode
+JOURNAL_FILE = "paint_journal.tpj" # Autosave journal, reloaded on the next start
+
+# --- Global State ---
+current_pensize = DEFAULT_PENSIZE
+current_eraser_size = DEFAULT_ERASER_SIZE # Initializing adjustable eraser size
+current_color_index = 0
+is_erasing = False
+is_filling = False # Bucket fill mode: clicks fill a region instead of drawing
+cursor_x = 0
+cursor_y = 0
+
+# Frame state: input events only record data here, render_frame() consumes it
+frame_scheduled = False
+pending_points = [] # Drag samples received since the last frame
+
+# Live stroke: drawn as vector items while the mouse is down, then flattened
+stroke_points = [] # (x, y) vertices kept for the stroke being drawn
+stroke_simplifier = StrokeSimplifier(SIMPLIFY_TOLERANCE) # Drops redundant drag samples
+stroke_color_index = 0
+stroke_color = BACKGROUND_COLOR
+stroke_width = DEFAULT_PENSIZE
+stroke_is_eraser = False # Eraser strokes remove segments instead of drawing
+
+# Document model: finished brush strokes (as segments) and fills, spatially indexed
+document = StrokeDocument()
+
+# Collaboration state (only used with --connect)
+collab_stroke_id = 0 # Id of the local stroke being drawn, sent with its messages
+stroke_points_sent = 0 # Vertices of the live stroke already sent to the relay
+remote_strokes = {} # (client_id, stroke_id) -> (line item, canvas coords) of others' live strokes
+
+# Window, canvas items and the objects tied to them, created by create_screen()
+screen = None
+mapper = None
+pen_turtle = None
+raster_layer = None
+history = None
+collab = None
+journal = None
+cursor_item = None
+tail_item = None
+hud = None
+
+
+def create_screen(connect=None, headless=False):
+    """
+    Opens the window and creates the turtles, canvas items, raster layer,
+    history and the journal (or, with `connect` as "HOST:PORT", the relay
+    connection). With `headless`, a recorder screen that needs no display
+    is used instead of a window (see headless.py).
+    """
+    global screen, mapper, pen_turtle, raster_layer, history
+    global collab, journal, cursor_item, tail_item, hud
+    screen = RecorderScreen(SCREEN_WIDTH, SCREEN_HEIGHT) if headless else turtle.Screen()
+    make_turtle = RecorderTurtle if headless else turtle.Turtle
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.bgcolor(BACKGROUND_COLOR) # Use constant
+    screen.title("Interactive Turtle Paint App")
+    screen.tracer(0) # Disable automatic updates for smoother drawing
+    screen.screensize(DOCUMENT_WIDTH, DOCUMENT_HEIGHT) # Scroll region, centered on the origin
+
+    # --- Initialize Coordinate Mapper ---
+    # Caches the canvas size and scroll offsets, so mouse events need no Tk queries
+    mapper = CanvasMapper(screen.cv, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    # --- Initialize Drawing Turtle (Hidden) ---
+    pen_turtle = make_turtle()
+    pen_turtle.shape("arrow")
+    pen_turtle.color(COLOR_PALETTE[current_color_index])
+    pen_turtle.pensize(current_pensize)
+    pen_turtle.speed(0)
+    pen_turtle.penup()
+    pen_turtle.hideturtle() # Drawing pen remains hidden
+
+    # --- Initialize Raster Layer (Finished Strokes) ---
+    # 256x256 tiles, allocated only where something is painted
+    raster_layer = RasterLayer(screen.cv, DOCUMENT_WIDTH, DOCUMENT_HEIGHT,
+                               [channel >> 8 for channel in screen.cv.winfo_rgb(BACKGROUND_COLOR)],
+                               image_factory=RecorderImage if headless else None)
+
+    # --- Initialize Undo/Redo History ---
+    # Checkpoints are raster snapshots; undo restores one and replays the rest
+    history = StrokeHistory(raster_layer.snapshot)
+
+    # --- Initialize Collaboration or Autosave Journal ---
+    # In collaborative mode the relay server holds the painting instead of the
+    # local journal; otherwise finished strokes and undo/redo steps are appended
+    # to the journal as they happen.
+    if connect:
+        collab_host, _, collab_port = connect.rpartition(":")
+        collab = CollabClient(collab_host or DEFAULT_HOST, int(collab_port))
+        journal = None
+    else:
+        collab = None
+        journal = JournalWriter(JOURNAL_FILE)
+
+    # --- Initialize Cursor Item (Visible Brush Indicator) ---
+    # A single canvas oval that is moved with coords() instead of being redrawn.
+    # Canvas coordinates share the turtle origin (center) but have y pointing down.
+    cursor_item = screen.cv.create_oval(0, 0, 0, 0, outline="white", width=2)
+
+    # --- Initialize Stroke Tail Item ---
+    # Joins the last kept vertex to the latest mouse sample while the simplifier
+    # is still deciding which samples to keep, so the live stroke never lags.
+    tail_item = screen.cv.create_line(0, 0, 0, 0, capstyle="round", state="hidden")
+
+    # --- Initialize Heads-Up Display (for Instructions) ---
+    # A canvas text item that follows the view when the document is scrolled
+    hud = Hud(screen.cv)
+    hud.add_text("status", 0, SCREEN_HEIGHT/2 - 40, font=("Inter", 14, "normal"))
+
+
+# --- Utility Functions ---
+
+def write_status():
+    """Shows the instruction text; setting the same text again changes nothing."""
+    hud.set("status", "Drag mouse to draw. Colors: 1-5. Size: +/-. Mode: E (Eraser/Brush), F (Fill). "
+                      "Undo/Redo: U/R. Scroll: arrows. Clear: C/Space.")
+
+def update_cursor_visuals():
+    """Moves and restyles the cursor oval to match the current position, mode and size."""
+    if is_erasing:
+        size = current_eraser_size # Use current_eraser_size variable
+        color = "white"
+    elif is_filling:
+        size = FILL_CURSOR_SIZE
+        color = COLOR_PALETTE[current_color_index]
+    else:
+        size = current_pensize
+        color = COLOR_PALETTE[current_color_index]
+
+    # The oval's diameter represents the brush size. The radius is size / 2.
+    radius = size / 2
+    screen.cv.coords(cursor_item, cursor_x - radius, -cursor_y - radius,
+                     cursor_x + radius, -cursor_y + radius)
+    screen.cv.itemconfig(cursor_item, outline=color)
+    # Keep the cursor above any stroke items created since the last frame
+    screen.cv.tag_raise(cursor_item)
+
+def request_frame():
+    """Schedules one repaint for the next frame. Repeated requests are coalesced."""
+    global frame_scheduled
+    if not frame_scheduled:
+        frame_scheduled = True
+        screen.ontimer(render_frame, FRAME_DELAY)
+
+def render_frame():
+    """Frame callback: draws queued drag samples, moves the cursor and updates once."""
+    global frame_scheduled
+    frame_scheduled = False
+    flush_pending_points()
+    if collab is not None:
+        send_live_points() # One message per frame, however many samples arrived
+        apply_remote_messages()
+    update_viewport()
+    raster_layer.present() # Upload dirty tiles that are on screen
+    update_cursor_visuals()
+    screen.update()
+
+def update_viewport():
+    """
+    Tells the raster layer which part of the document is currently visible
+    and keeps the HUD in place on screen.
+    """
+    left, top, right, bottom = mapper.visible_box()
+    hud.follow_view((left + right) / 2, (top + bottom) / 2)
+    # The scroll region is the document, so the clipped box is inside it
+    left, top, right, bottom = mapper.visible_box(clip=True)
+    raster_layer.viewport = (int(left) + DOCUMENT_WIDTH // 2, int(top) + DOCUMENT_HEIGHT // 2,
+                             int(right) + DOCUMENT_WIDTH // 2, int(bottom) + DOCUMENT_HEIGHT // 2)
+
+# --- Drawing Functions ---
+
+def start_draw(x, y):
+    """Called when the mouse button is pressed down (start of drag)."""
+    global stroke_color_index, stroke_color, stroke_width, stroke_is_eraser, stroke_points_sent
+    pen_turtle.penup()
+    stroke_points.clear()
+    stroke_points_sent = 0
+    
+    # Set pen size/color based on mode
+    stroke_is_eraser = is_erasing
+    stroke_color_index = current_color_index
+    if is_erasing:
+        # The eraser removes ink from the document; it draws nothing itself.
+        # Everything it removes is recorded so the stroke can be undone.
+        stroke_width = current_eraser_size # Use current_eraser_size variable
+        stroke_points.append((x, y))
+        document.begin_change()
+        erase_along([(x, y)])
+        return
+
+    stroke_color = COLOR_PALETTE[current_color_index]
+    stroke_width = current_pensize
+    pen_turtle.color(stroke_color)
+    pen_turtle.pensize(stroke_width)
+    pen_turtle.goto(x, y)
+    pen_turtle.pendown()
+    stroke_points.extend(stroke_simplifier.start(x, y))
+    screen.cv.itemconfig(tail_item, fill=stroke_color, width=stroke_width, state="normal")
+
+def draw(x, y):
+    """Called for each queued drag sample when a frame is rendered."""
+    if stroke_is_eraser:
+        erase_along([stroke_points[-1], (x, y)])
+        stroke_points.append((x, y))
+        return
+
+    # Only samples the simplifier keeps become stroke vertices
+    for vertex in stroke_simplifier.add(x, y):
+        pen_turtle.goto(vertex)
+        stroke_points.append(vertex)
+    last_x, last_y = stroke_points[-1]
+    screen.cv.coords(tail_item, last_x, -last_y, x, -y)
+    
+    # NOTE: screen.update() is called once per frame by render_frame(),
+    # no matter how many samples were drawn.
+
+def flush_pending_points():
+    """Draws every drag sample queued since the last frame."""
+    for x, y in pending_points:
+        draw(x, y)
+    pending_points.clear()
+
+def stop_draw(x, y):
+    """Called when the mouse button is released (end of drag)."""
+    # Draw samples still waiting for the next frame before lifting the pen
+    flush_pending_points()
+    if not stroke_is_eraser:
+        stroke_points.extend(stroke_simplifier.finish())
+        screen.cv.itemconfig(tail_item, state="hidden")
+        print(f"Stroke points: {stroke_simplifier.raw_count} captured, "
+              f"{stroke_simplifier.kept_count} stored")
+    pen_turtle.penup()
+    flatten_stroke()
+    request_frame()
+
+def flatten_stroke():
+    """
+    Rasterizes the finished stroke into the backing layer and deletes its
+    vector items, so the canvas only ever holds the live stroke as lines.
+    The stroke is recorded as a command in the undo history.
+    """
+    if stroke_is_eraser:
+        command = StrokeCommand(stroke_color_index, stroke_width, True, stroke_points)
+        command.change = document.end_change()
+        if command.change.added or command.change.removed or command.change.cuts:
+            history.push(command)
+            save_command(command)
+    elif len(stroke_points) > 1:
+        command = StrokeCommand(stroke_color_index, stroke_width, False, stroke_points)
+        apply_command(command)
+        history.push(command)
+        save_command(command)
+    update_viewport()
+    raster_layer.present()
+    stroke_points.clear()
+    pen_turtle.clear() # Removes the live stroke's line items
+
+def encode_command(command):
+    """Encodes a stroke command as a journal record."""
+    if command.is_fill:
+        return encode_fill(command.color_index, command.size, command.point_list())
+    return encode_stroke(command.color_index, command.size,
+                         command.is_eraser, command.point_list())
+
+def save_command(command):
+    """Appends a finished stroke to the autosave journal, or sends it to the relay."""
+    global collab_stroke_id
+    if collab is not None:
+        collab.send(MSG_COMMAND, collab_stroke_id, encode_command(command))
+        collab_stroke_id += 1
+    else:
+        journal.append(encode_command(command))
+
+def load_document():
+    """
+    Rebuilds the painting from the autosave journal, if there is one. A journal
+    holding undone strokes or undo/redo records is compacted afterwards.
+    """
+    if not os.path.exists(JOURNAL_FILE):
+        return
+    start_time = time.perf_counter()
+    strokes, record_count = load_journal(JOURNAL_FILE)
+    load_time = time.perf_counter() - start_time
+
+    commands = [StrokeCommand.from_packed(*stroke) for stroke in strokes]
+    for command in commands:
+        apply_command(command)
+    history.reset() # The loaded painting is the base state for undo
+    raster_layer.present()
+    if commands:
+        print(f"Loaded {len(commands)} strokes from {JOURNAL_FILE} in {load_time:.3f}s "
+              f"(rebuilt in {time.perf_counter() - start_time - load_time:.3f}s).")
+
+    if record_count > len(commands):
+        journal.rewrite(encode_command(command) for command in commands)
+
+# --- Collaboration ---
+
+def join_session():
+    """Connects to the relay server and replays the painting it holds."""
+    start_time = time.perf_counter()
+    records = collab.connect()
+    strokes, _ = decode_journal(records)
+    for stroke in strokes:
+        apply_command(StrokeCommand.from_packed(*stroke))
+    history.reset() # Other clients' strokes are not undoable here
+    raster_layer.present()
+    print(f"Joined as client {collab.client_id}: replayed {len(strokes)} strokes "
+          f"in {time.perf_counter() - start_time:.3f}s.")
+    poll_collab()
+
+def poll_collab():
+    """Timer callback: requests a frame whenever relay messages are waiting."""
+    if not collab.incoming.empty():
+        request_frame()
+    screen.ontimer(poll_collab, FRAME_DELAY)
+
+def send_live_points():
+    """Sends the vertices the live stroke gained this frame as one message."""
+    global stroke_points_sent
+    if stroke_is_eraser or len(stroke_points) < 2 or len(stroke_points) == stroke_points_sent:
+        return
+    # Repeat the last vertex already sent so the receiver can join the batches
+    batch = stroke_points[max(stroke_points_sent - 1, 0):]
+    collab.send(MSG_POINTS, collab_stroke_id,
+                encode_stroke(stroke_color_index, stroke_width, False, batch))
+    stroke_points_sent = len(stroke_points)
+
+def apply_remote_messages():
+    """
+    Merges everything received from the relay since the last frame. Live
+    strokes of other clients are drawn as line items; finished strokes are
+    applied to the document and raster in the relay's sequence order.
+    """
+    while not collab.incoming.empty():
+        kind, client_id, stroke_id, _, payload = collab.incoming.get()
+        strokes, _ = decode_journal(payload)
+        key = (client_id, stroke_id)
+        if kind == MSG_POINTS:
+            for color_index, size, _, _, points in strokes:
+                draw_remote_points(key, color_index, size, points)
+        elif kind == MSG_COMMAND:
+            remote = remote_strokes.pop(key, None)
+            if remote is not None:
+                screen.cv.delete(remote[0])
+            if client_id != collab.client_id: # Our own strokes are already applied
+                for stroke in strokes:
+                    apply_command(StrokeCommand.from_packed(*stroke))
+
+def draw_remote_points(key, color_index, size, points):
+    """Extends another client's live stroke line with a batch of points."""
+    item, coords = remote_strokes.get(key) or (
+        screen.cv.create_line(0, 0, 0, 0, fill=COLOR_PALETTE[color_index], width=size,
+                              capstyle="round", joinstyle="round"), [])
+    for x, y in zip(points[0::2], points[1::2]):
+        coords.extend((x, -y)) # Canvas y points down
+    screen.cv.coords(item, *coords)
+    remote_strokes[key] = (item, coords)
+
+def palette_rgb(color_index):
+    """Returns the (r, g, b) 0-255 values of a palette color."""
+    return tuple(channel >> 8 for channel in screen.cv.winfo_rgb(COLOR_PALETTE[color_index]))
+
+def apply_command(command):
+    """Applies a stroke command to the document and the raster layer."""
+    document.begin_change()
+    points = command.point_list()
+    if command.is_eraser:
+        changed = document.erase_path(points, command.size / 2)
+        if changed is not None:
+            redraw_region(changed)
+    elif command.is_fill:
+        x, y = points[0]
+        command.fill_patch = raster_layer.flood_fill(x, y, palette_rgb(command.color_index),
+                                                     command.size, document.take_order(),
+                                                     fill_box(command))
+        if command.fill_patch is not None:
+            document.add_region(command.fill_patch)
+    else:
+        curve = catmull_rom(points, CURVE_SUBDIVISIONS)
+        document.add_stroke(curve, palette_rgb(command.color_index), command.size)
+        raster_layer.draw_polyline(curve, palette_rgb(command.color_index), command.size)
+    command.change = document.end_change()
+
+def fill_box(command):
+    """
+    Returns the pixel box a fill command is computed in. A new fill (or one
+    from an older journal) records the current viewport as its box, so undo,
+    redo, reloads and other clients all fill exactly the same area.
+    """
+    points = command.point_list()
+    if len(points) == 1:
+        left, top, right, bottom = raster_layer.viewport
+        command.points.extend(raster_layer.to_turtle(left, top) + raster_layer.to_turtle(right, bottom))
+        return left, top, right, bottom
+    (left, top), (right, bottom) = (raster_layer.to_pixel(x, y) for x, y in points[1:])
+    return int(left), int(top), int(right), int(bottom)
+
+def render_command(command):
+    """Repaints an already-applied command on the raster layer only (undo replay)."""
+    if command.is_eraser:
+        redraw_region(command.change.bbox)
+    elif command.is_fill:
+        raster_layer.draw_fill(command.fill_patch)
+    else:
+        curve = catmull_rom(command.point_list(), CURVE_SUBDIVISIONS)
+        raster_layer.draw_polyline(curve, palette_rgb(command.color_index), command.size)
+
+def redraw_region(bbox):
+    """Clears a turtle-coordinate box on the raster and redraws the document inside it."""
+    box = raster_layer.to_pixel_box(bbox)
+    raster_layer.clear_region(box)
+    raster_layer.draw_items(document.items_in(bbox), box)
+
+def bucket_fill(x, y):
+    """
+    Fills the region around (x, y) with the current color. The region is found
+    by a scanline fill over the raster and shown with one image update.
+    """
+    update_viewport() # The fill is limited to the visible part of the document
+    command = StrokeCommand(current_color_index, FILL_TOLERANCE, False, [(x, y)], is_fill=True)
+    apply_command(command)
+    if command.fill_patch is None:
+        return # Clicked outside the document
+    history.push(command)
+    save_command(command)
+    request_frame()
+
+def erase_along(points):
+    """
+    Sweeps the eraser disk along `points`, deleting or splitting the document
+    segments it touches, then repaints only the affected region of the raster.
+    """
+    changed = document.erase_path(points, stroke_width / 2)
+    if changed is not None:
+        redraw_region(changed)
+
+
+# --- Control Functions (Keyboard) ---
+
+def clear_screen():
+    """Clears all drawings and resets the turtle's position."""
+    if collab is not None:
+        print("Clearing is not available in collaborative mode.")
+        return
+    pen_turtle.clear()
+    document.clear()
+    raster_layer.clear()
+    raster_layer.present()
+    history.reset() # Clearing cannot be undone; start a fresh history
+    journal.truncate()
+    pen_turtle.penup()
+    pen_turtle.goto(0, 0)
+    pen_turtle.pendown()
+    request_frame() # Make the canvas clear visible on the next frame
+
+def undo():
+    """
+    Undoes the last stroke: reverts its document change, restores the nearest
+    raster checkpoint and replays only the strokes recorded after it.
+    """
+    if stroke_points:
+        return # Not while a stroke is being drawn
+    if collab is not None:
+        print("Undo is not available in collaborative mode.")
+        return
+    step = history.undo()
+    if step is None:
+        print("Nothing to undo.")
+        return
+    command, snapshot, replay = step
+    journal.append(encode_control(OP_UNDO))
+    document.revert(command.change)
+    raster_layer.restore(snapshot)
+    for replayed in replay:
+        render_command(replayed)
+    request_frame()
+    print(f"Undo (replayed {len(replay)} strokes).")
+
+def redo():
+    """Re-applies the most recently undone stroke."""
+    if stroke_points:
+        return # Not while a stroke is being drawn
+    if collab is not None:
+        print("Redo is not available in collaborative mode.")
+        return
+    command = history.redo()
+    if command is None:
+        print("Nothing to redo.")
+        return
+    journal.append(encode_control(OP_REDO))
+    apply_command(command)
+    history.redone(command)
+    request_frame()
+    print("Redo.")
+
+def toggle_eraser():
+    """Toggles between drawing and erasing mode."""
+    global is_erasing, is_filling
+    is_erasing = not is_erasing
+    is_filling = False
+    
+    # Update cursor visual to reflect the new mode
+    request_frame()
+    
+    mode = "Eraser" if is_erasing else "Brush"
+    print(f"Mode toggled to: {mode}")
+
+def toggle_fill():
+    """Toggles between the bucket fill tool and the brush."""
+    global is_erasing, is_filling
+    is_filling = not is_filling
+    is_erasing = False
+
+    # Update cursor visual to reflect the new mode
+    request_frame()
+
+    mode = "Fill" if is_filling else "Brush"
+    print(f"Mode toggled to: {mode}")
+
+def change_color(color_index):
+    """Changes the pen color based on the index provided."""
+    global current_color_index, is_erasing
+    if 0 <= color_index < len(COLOR_PALETTE):
+        # 1. Turn off eraser mode to switch back to painting
+        was_erasing = is_erasing
+        is_erasing = False 
+        
+        # 2. Update color index
+        current_color_index = color_index
+        new_color = COLOR_PALETTE[current_color_index]
+        
+        # 3. Update cursor visual (always update now that mode might have changed)
+        request_frame()
+        
+        # 4. Print message
+        if was_erasing:
+            print(f"Switched from Eraser to Brush. Color set to: {new_color}")
+        else:
+            print(f"Color set to: {new_color}")
+
+
+def increase_size():
+    """Increases the pen size or eraser size, up to the respective maximum."""
+    global current_pensize, current_eraser_size
+    if is_erasing:
+        # Increase eraser size by 5 (for quicker adjustment since it's a larger tool)
+        if current_eraser_size < MAX_ERASER_SIZE:
+            current_eraser_size += 5
+            request_frame()
+            print(f"Eraser size increased to: {current_eraser_size}")
+    else:
+        # Increase pen size by 1
+        if current_pensize < MAX_PENSIZE:
+            current_pensize += 1
+            request_frame()
+            print(f"Pen size increased to: {current_pensize}")
+
+def decrease_size():
+    """Decreases the pen size or eraser size, down to the minimum."""
+    global current_pensize, current_eraser_size
+    if is_erasing:
+        # Decrease eraser size by 5
+        if current_eraser_size > MIN_PENSIZE + 4: # Prevent shrinking too close to 1
+            current_eraser_size -= 5
+            request_frame()
+            print(f"Eraser size decreased to: {current_eraser_size}")
+    else:
+        # Decrease pen size by 1
+        if current_pensize > MIN_PENSIZE:
+            current_pensize -= 1
+            request_frame()
+            print(f"Pen size decreased to: {current_pensize}")
+
+# --- Tkinter Event Wrapper Functions ---
+
+def handle_mouse_coords(event):
+    """Converts Tkinter pixel coords to Turtle coords (0,0 center)."""
+    # Tkinter (0,0) is the top-left of the window. The mapper adds the cached
+    # scroll offset and flips y, without asking Tk for the window geometry.
+    return mapper.to_turtle(event.x, event.y)
+
+def handle_mouse_down_tk(event):
+    """Tkinter wrapper for <Button-1> (mouse down). Starts drawing, or fills in fill mode."""
+    x, y = handle_mouse_coords(event)
+    if is_filling:
+        bucket_fill(x, y)
+    else:
+        start_draw(x, y)
+
+def handle_mouse_drag_tk(event):
+    """Tkinter wrapper for <B1-Motion> (mouse drag). Queues the sample for the next frame."""
+    global cursor_x, cursor_y
+    x, y = handle_mouse_coords(event)
+    cursor_x, cursor_y = x, y # Update cursor position
+    if stroke_points: # A stroke is in progress (not a fill click)
+        pending_points.append((x, y)) # Drawn by render_frame(), not here
+    request_frame()
+
+def handle_mouse_up_tk(event):
+    """Tkinter wrapper for <ButtonRelease-1> (mouse up). Stops drawing."""
+    if stroke_points:
+        stop_draw(None, None)
+
+def scroll_view(dx, dy):
+    """Scrolls the document view by SCROLL_STEP units (arrow keys)."""
+    mapper.scroll(dx * SCROLL_STEP, dy * SCROLL_STEP)
+    request_frame() # Tiles that scrolled into view are uploaded on the next frame
+
+def handle_xscroll(*args):
+    """Scrollbar command wrapper: scrolls horizontally, then repaints."""
+    mapper.xview(*args)
+    request_frame()
+
+def handle_yscroll(*args):
+    """Scrollbar command wrapper: scrolls vertically, then repaints."""
+    mapper.yview(*args)
+    request_frame()
+
+def handle_mouse_motion_tk(event):
+    """Tkinter wrapper for <Motion> (mouse movement without click). Moves cursor."""
+    global cursor_x, cursor_y
+    x, y = handle_mouse_coords(event)
+    cursor_x, cursor_y = x, y # Only record the latest position
+    request_frame() # The cursor oval is moved once per frame
+
+
+# --- Command Line ---
+
+def add_arguments(parser):
+    """Adds this demo's options to the launcher's argument parser."""
+    # python -m turtle_demos paint --connect 127.0.0.1:8765 joins a relay
+    # started with: python -m turtle_demos.paint_collab serve
+    parser.add_argument("--connect", metavar="HOST:PORT",
+                        help="Paint together with others through a relay server")
+    add_async_arguments(parser, telemetry=False)
+
+def main(args):
+    """Opens the paint window and runs it."""
+    create_screen(args.connect)
+
+    # --- Event Bindings ---
+
+    # Bind mouse motion (CURSOR FOLLOW)
+    screen.cv.bind('<Motion>', handle_mouse_motion_tk)
+    # Bind mouse down (start draw)
+    screen.cv.bind('<Button-1>', handle_mouse_down_tk) 
+    # Bind drag/motion while button 1 is pressed (continuous drawing)
+    screen.cv.bind('<B1-Motion>', handle_mouse_drag_tk)
+    # Bind mouse button release (stop draw)
+    screen.cv.bind('<ButtonRelease-1>', handle_mouse_up_tk) 
+    # Repaint after the scrollbars move the view
+    screen.cv.hscroll.configure(command=handle_xscroll)
+    screen.cv.vscroll.configure(command=handle_yscroll)
+
+
+    # Keyboard Bindings:
+    screen.onkey(clear_screen, "c")
+    screen.onkey(clear_screen, "C")
+    screen.onkey(clear_screen, "space")
+
+    # Bucket Fill Toggle
+    screen.onkey(toggle_fill, "f")
+    screen.onkey(toggle_fill, "F")
+
+    # Undo/Redo
+    screen.onkey(undo, "u")
+    screen.onkey(undo, "U")
+    screen.onkey(redo, "r")
+    screen.onkey(redo, "R")
+    screen.cv.bind("<Control-z>", lambda event: undo())
+    screen.cv.bind("<Control-y>", lambda event: redo())
+
+    # Eraser Toggle
+    screen.onkey(toggle_eraser, "e")
+    screen.onkey(toggle_eraser, "E")
+
+    # Size controls
+    screen.onkey(increase_size, "+")
+    screen.onkey(increase_size, "equal") # For keyboards where '+' is SHIFT + '='
+    screen.onkey(decrease_size, "-")
+    screen.onkey(decrease_size, "underscore") # For keyboards where '-' is used
+
+    # Scrolling
+    screen.onkey(lambda: scroll_view(-1, 0), "Left")
+    screen.onkey(lambda: scroll_view(1, 0), "Right")
+    screen.onkey(lambda: scroll_view(0, -1), "Up")
+    screen.onkey(lambda: scroll_view(0, 1), "Down")
+
+    # Color selection using numbers 1-5
+    screen.onkey(lambda: change_color(0), "1")
+    screen.onkey(lambda: change_color(1), "2")
+    screen.onkey(lambda: change_color(2), "3")
+    screen.onkey(lambda: change_color(3), "4")
+    screen.onkey(lambda: change_color(4), "5")
+
+
+    # Start listening for events (CRITICAL)
+    screen.listen()
+
+    # Join the shared painting, or restore the previous session's painting, if any.
+    # Old fills without a recorded area are replayed in the visible part.
+    update_viewport()
+    if collab is not None:
+        join_session()
+    else:
+        load_document()
+
+    # Draw the static instruction text once, then the first frame
+    write_status()
+    render_frame()
+
+    # Keep the window open
+    if wants_asyncio(args):
+        from .async_runner import run_async # Only needed with --asyncio
+        run_async(args, screen)
+        return
+    turtle.done()
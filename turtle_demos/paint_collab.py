@@ -0,0 +1,422 @@
+import argparse
+import asyncio
+import queue
+import random
+import struct
+import threading
+import time
+import zlib
+
+from .paint_journal import encode_stroke
+
+# NOTE: The server and client only use Python's standard library (asyncio).
+# Stroke records use the journal format from paint_journal.py, which needs
+# NumPy: pip install numpy
+
+
+# --- Configuration ---
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_MESSAGE_SIZE = 1 << 20 # Larger messages close the connection
+MAX_CLIENT_BUFFER = 4 << 20 # Unsent bytes after which a slow client is dropped
+COMPACT_SIZE = 256 << 10 # Finished records gathered before they are compressed into a snapshot block
+MAX_DOCUMENT_SIZE = 256 << 20 # Stored (compressed) painting size after which new strokes are refused
+CONNECT_TIMEOUT = 5.0 # Seconds to wait for the server's welcome
+
+
+# --- Wire Format ---
+# Every message is a 4-byte big-endian length followed by the message itself:
+#
+#   kind       1 byte  MSG_WELCOME, MSG_SNAPSHOT, MSG_POINTS or MSG_COMMAND
+#   client_id  2 bytes sender (set by the server; 0 when a client sends)
+#   stroke_id  2 bytes sender's stroke counter, wrapping at 65536
+#   seq        4 bytes server sequence number (0 when a client sends)
+#   payload    the rest
+#
+# MSG_WELCOME  server -> client on connect. client_id is the id assigned to
+#              the new client and the payload is the number of MSG_SNAPSHOT
+#              messages that follow (4 bytes).
+# MSG_SNAPSHOT server -> client after the welcome: one zlib-compressed block
+#              of finished records. Together the blocks hold every finished
+#              record so far, so a late joiner can rebuild the painting; each
+#              block stays below MAX_MESSAGE_SIZE however large the painting.
+# MSG_POINTS   the vertices a client added to its live stroke during one
+#              frame, as one journal stroke record.
+# MSG_COMMAND  a finished stroke, eraser stroke or fill as a journal record.
+#
+# The server numbers every message it relays, so all clients receive (and
+# merge) finished strokes in the same order.
+
+HEADER = struct.Struct("!IBHHI")
+LENGTH = struct.Struct("!I")
+COUNT = struct.Struct("!I")
+MSG_WELCOME = 1
+MSG_POINTS = 2
+MSG_COMMAND = 3
+MSG_SNAPSHOT = 4
+
+
+def pack_message(kind, client_id, stroke_id, seq, payload):
+    """Returns one framed message as bytes."""
+    return HEADER.pack(HEADER.size - LENGTH.size + len(payload),
+                       kind, client_id, stroke_id, seq) + payload
+
+def unpack_message(body):
+    """Splits a message body (without its length) into (kind, client_id, stroke_id, seq, payload)."""
+    kind, client_id, stroke_id, seq = struct.unpack_from("!BHHI", body)
+    return kind, client_id, stroke_id, seq, body[HEADER.size - LENGTH.size:]
+
+async def read_message(reader):
+    """
+    Reads one message body from a stream.
+
+    Returns:
+        bytes: The message without its length, or None when the connection
+        was closed (or sent an oversized message).
+    """
+    try:
+        length, = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+        if length > MAX_MESSAGE_SIZE or length < HEADER.size - LENGTH.size:
+            return None
+        return await reader.readexactly(length)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+# --- Relay Server ---
+
+class RelayServer:
+    """
+    Relays strokes between paint clients.
+
+    The server never rasterizes anything. It keeps the records of finished
+    strokes (the same bytes the paint journal stores) so late joiners can
+    replay them, plus the point batches of strokes still in progress.
+
+    The records are kept as a snapshot plus a tail: every COMPACT_SIZE bytes
+    of new records (and whenever a client joins) the tail is compressed into
+    one more snapshot block. A joining client is sent the blocks one message
+    at a time, waiting for each to drain, while the messages relayed in the
+    meantime are queued for it. The stored painting is capped at
+    MAX_DOCUMENT_SIZE; a client finishing a stroke beyond it is disconnected.
+    """
+
+    def __init__(self):
+        self.clients = {} # client_id -> StreamWriter
+        self.blocks = [] # Snapshot: zlib-compressed blocks of finished records, in sequence order
+        self.tail = bytearray() # Finished records not compressed yet
+        self.stored_size = 0 # Bytes of all blocks
+        self.live = {} # client_id -> MSG_POINTS messages of its unfinished stroke
+        self.joining = {} # client_id -> messages relayed while its snapshot is being sent
+        self.seq = 0
+        self.next_client_id = 1
+
+    def compact(self):
+        """
+        Compresses the tail of finished records into new snapshot blocks of
+        at most COMPACT_SIZE bytes each. A record may span two blocks, as
+        the client joins them before decoding.
+        """
+        for start in range(0, len(self.tail), COMPACT_SIZE):
+            block = zlib.compress(self.tail[start:start + COMPACT_SIZE])
+            self.blocks.append(block)
+            self.stored_size += len(block)
+        self.tail.clear()
+
+    async def handle_client(self, reader, writer):
+        """Connection callback: welcomes a client, then relays its messages until it leaves."""
+        client_id = self.next_client_id
+        self.next_client_id = self.next_client_id % 0xFFFF + 1
+        self.compact()
+        blocks = list(self.blocks) # Later blocks only hold messages queued below
+        live = [message for messages in self.live.values() for message in messages]
+        writer.write(pack_message(MSG_WELCOME, client_id, 0, self.seq, COUNT.pack(len(blocks))))
+        queued = self.joining[client_id] = []
+        self.clients[client_id] = writer
+        try:
+            for block in blocks:
+                writer.write(pack_message(MSG_SNAPSHOT, 0, 0, 0, block))
+                await writer.drain()
+            writer.writelines(live)
+            writer.writelines(queued)
+            del self.joining[client_id]
+            print(f"Client {client_id} joined ({len(self.clients)} connected).")
+            while True:
+                body = await read_message(reader)
+                if body is None:
+                    break
+                self.relay(client_id, body)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(client_id, None)
+            self.live.pop(client_id, None)
+            self.joining.pop(client_id, None)
+            writer.close()
+            print(f"Client {client_id} left ({len(self.clients)} connected).")
+
+    def relay(self, client_id, body):
+        """Stamps a client's message with its id and the next sequence number and broadcasts it."""
+        kind, _, stroke_id, _, payload = unpack_message(body)
+        if kind not in (MSG_POINTS, MSG_COMMAND):
+            return
+        if kind == MSG_COMMAND and self.stored_size + len(self.tail) + len(payload) > MAX_DOCUMENT_SIZE:
+            print(f"The painting is full; disconnecting client {client_id}.")
+            self.clients.pop(client_id).close()
+            return
+        self.seq += 1
+        message = pack_message(kind, client_id, stroke_id, self.seq, payload)
+        if kind == MSG_POINTS:
+            self.live.setdefault(client_id, []).append(message)
+        else:
+            self.live.pop(client_id, None)
+            self.tail += payload
+            if len(self.tail) >= COMPACT_SIZE:
+                self.compact()
+
+        for other_id, other in list(self.clients.items()):
+            if kind == MSG_POINTS and other_id == client_id:
+                continue # The sender already shows its own live stroke
+            if other_id in self.joining:
+                self.joining[other_id].append(message) # Sent once its snapshot is
+                continue
+            if other.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                print(f"Client {other_id} is too slow; disconnecting it.")
+                self.clients.pop(other_id)
+                other.close()
+                continue
+            other.write(message) # A finished stroke is echoed to its sender as an acknowledgment
+
+async def run_server(host, port):
+    """Runs a relay server until interrupted."""
+    relay = RelayServer()
+    server = await asyncio.start_server(relay.handle_client, host, port)
+    print(f"Paint relay listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+# --- Client ---
+
+async def join(host, port):
+    """
+    Connects to a relay server and waits for its welcome and snapshot.
+
+    Returns:
+        tuple: (reader, writer, client_id, seq, records) where `records` are
+        the finished records to replay and `seq` is the server's sequence
+        number when they were sent.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    body = await asyncio.wait_for(read_message(reader), CONNECT_TIMEOUT)
+    if body is None:
+        raise ConnectionError("The relay server closed the connection")
+    kind, client_id, _, seq, payload = unpack_message(body)
+    if kind != MSG_WELCOME:
+        raise ConnectionError("Unexpected first message from the relay server")
+    block_count, = COUNT.unpack(payload)
+    blocks = []
+    for _ in range(block_count):
+        body = await asyncio.wait_for(read_message(reader), CONNECT_TIMEOUT)
+        if body is None:
+            raise ConnectionError("The relay server closed the connection during the snapshot")
+        kind, _, _, _, block = unpack_message(body)
+        if kind != MSG_SNAPSHOT:
+            raise ConnectionError("Unexpected message in the relay server's snapshot")
+        blocks.append(zlib.decompress(block))
+    return reader, writer, client_id, seq, b"".join(blocks)
+
+class CollabClient:
+    """
+    A relay connection for the (single-threaded) Tk paint app.
+
+    The connection runs on an asyncio loop in a background thread. Received
+    messages are put on `incoming`, which the app drains once per frame, and
+    send() may be called from the Tk thread.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.incoming = queue.SimpleQueue() # (kind, client_id, stroke_id, seq, payload)
+        self.client_id = 0
+        self.last_seq = 0
+        self.loop = asyncio.new_event_loop()
+        self.writer = None
+
+    def connect(self):
+        """
+        Connects, blocking until the server's welcome arrives.
+
+        Returns:
+            bytes: The finished records to replay.
+        """
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(join(self.host, self.port), self.loop)
+        reader, self.writer, self.client_id, self.last_seq, records = future.result(CONNECT_TIMEOUT * 2)
+        asyncio.run_coroutine_threadsafe(self._receive(reader), self.loop)
+        return records
+
+    async def _receive(self, reader):
+        while True:
+            body = await read_message(reader)
+            if body is None:
+                print("Disconnected from the relay server.")
+                return
+            message = unpack_message(body)
+            self.last_seq = max(self.last_seq, message[3])
+            self.incoming.put(message)
+
+    def send(self, kind, stroke_id, payload):
+        """Queues a message for the server; safe to call from any thread."""
+        message = pack_message(kind, 0, stroke_id % 0x10000, 0, payload)
+        self.loop.call_soon_threadsafe(self.writer.write, message)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.writer.close)
+
+
+# --- Load Generator ---
+
+class SimulatedClient:
+    """A load generator client: draws random strokes and times what it receives."""
+
+    def __init__(self, stats, frame_delay, stroke_frames, points_per_frame):
+        self.stats = stats
+        self.frame_delay = frame_delay
+        self.stroke_frames = stroke_frames
+        self.points_per_frame = points_per_frame
+        self.client_id = 0
+        self.sent_at = [] # perf_counter() of every message sent, in order
+        self.received_from = {} # sender id -> number of its messages received
+
+    async def run(self, host, port, duration, ready):
+        reader, writer, self.client_id, _, _ = await join(host, port)
+        self.stats.clients[self.client_id] = self
+        ready.release()
+        receiving = asyncio.ensure_future(self.receive(reader))
+        await self.stats.start.wait()
+        stop_time = time.perf_counter() + duration
+        stroke_id = 0
+        x, y = random.uniform(-300, 300), random.uniform(-300, 300)
+        while time.perf_counter() < stop_time:
+            stroke_id += 1
+            points = []
+            for _ in range(self.stroke_frames):
+                batch = []
+                for _ in range(self.points_per_frame):
+                    x += random.uniform(-4, 4)
+                    y += random.uniform(-4, 4)
+                    batch.append((x, y))
+                points.extend(batch)
+                self.send(writer, MSG_POINTS, stroke_id, encode_stroke(0, 5, False, batch))
+                await asyncio.sleep(self.frame_delay)
+            self.send(writer, MSG_COMMAND, stroke_id, encode_stroke(0, 5, False, points))
+        await asyncio.sleep(1.0) # Let the last messages arrive
+        receiving.cancel()
+        writer.close()
+
+    def send(self, writer, kind, stroke_id, payload):
+        message = pack_message(kind, 0, stroke_id % 0x10000, 0, payload)
+        self.sent_at.append(time.perf_counter())
+        self.stats.bytes_sent += len(message)
+        writer.write(message)
+
+    async def receive(self, reader):
+        last_seq = 0
+        while True:
+            body = await read_message(reader)
+            if body is None:
+                return
+            now = time.perf_counter()
+            kind, sender_id, _, seq, _ = unpack_message(body)
+            if seq <= last_seq:
+                self.stats.out_of_order += 1
+            last_seq = seq
+            if sender_id == self.client_id:
+                # Our own finished strokes come back as acknowledgments; their
+                # position in our send order is not tracked, so skip them
+                continue
+            # The server keeps each sender's messages in order, so the n-th
+            # message received from a sender is the n-th one it sent
+            index = self.received_from.get(sender_id, 0)
+            self.received_from[sender_id] = index + 1
+            sender = self.stats.clients.get(sender_id)
+            if sender is not None and index < len(sender.sent_at):
+                self.stats.latencies.append(now - sender.sent_at[index])
+            if kind == MSG_COMMAND:
+                self.stats.strokes_received += 1
+
+class LoadStats:
+    def __init__(self):
+        self.clients = {} # client_id -> SimulatedClient
+        self.latencies = [] # Seconds from send to receipt, per delivered message
+        self.strokes_received = 0
+        self.out_of_order = 0
+        self.bytes_sent = 0
+        self.start = asyncio.Event()
+
+async def run_load(host, port, client_count, duration, frame_delay, stroke_frames, points_per_frame):
+    """Runs simulated clients against a relay server and prints latency statistics."""
+    stats = LoadStats()
+    ready = asyncio.Semaphore(0)
+    tasks = [asyncio.ensure_future(SimulatedClient(stats, frame_delay, stroke_frames, points_per_frame)
+                                   .run(host, port, duration, ready))
+             for _ in range(client_count)]
+    for _ in range(client_count):
+        await ready.acquire()
+    stats.start.set() # All clients are connected; start drawing together
+    await asyncio.gather(*tasks)
+
+    latencies = sorted(stats.latencies)
+    if not latencies:
+        print("No messages were delivered.")
+        return
+    def percentile(fraction):
+        return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] * 1000
+    sent = sum(len(client.sent_at) for client in stats.clients.values())
+    print(f"{client_count} clients, {duration:.0f}s: {sent} messages sent "
+          f"({sent / duration:.0f}/s, {stats.bytes_sent / duration / 1024:.1f} KiB/s), "
+          f"{len(latencies)} delivered, {stats.strokes_received} strokes received")
+    print(f"Latency ms: p50 {percentile(0.5):.2f}, p95 {percentile(0.95):.2f}, "
+          f"p99 {percentile(0.99):.2f}, max {latencies[-1] * 1000:.2f}")
+    print(f"Out-of-order messages: {stats.out_of_order}")
+
+async def run_local_load(host, port, *load_args):
+    """Starts a relay server in this process, then runs the load generator against it."""
+    relay = RelayServer()
+    server = await asyncio.start_server(relay.handle_client, host, port)
+    async with server:
+        await run_load(host, port, *load_args)
+
+
+# --- Command Line ---
+
+def main():
+    parser = argparse.ArgumentParser(description="Relay server and load generator for collaborative paint.")
+    parser.add_argument("mode", choices=["serve", "load"],
+                        help="serve: run the relay; load: run simulated clients")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=20, help="Simulated clients (load mode)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of drawing (load mode)")
+    parser.add_argument("--frame-delay", type=float, default=0.016, help="Seconds between point batches")
+    parser.add_argument("--stroke-frames", type=int, default=30, help="Point batches per stroke")
+    parser.add_argument("--points", type=int, default=4, help="Points per batch")
+    parser.add_argument("--local", action="store_true",
+                        help="Load mode: start a relay in the same process instead of connecting to one")
+    args = parser.parse_args()
+
+    try:
+        if args.mode == "serve":
+            asyncio.run(run_server(args.host, args.port))
+        else:
+            load_args = (args.clients, args.duration, args.frame_delay, args.stroke_frames, args.points)
+            runner = run_local_load if args.local else run_load
+            asyncio.run(runner(args.host, args.port, *load_args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+from array import array
+
+# NOTE: This module only uses Python's standard library.
+
+
+# --- Configuration ---
+CHECKPOINT_INTERVAL = 20 # Commands between raster checkpoints
+HISTORY_BYTE_BUDGET = 64 * 1024 * 1024 # Memory cap for commands plus checkpoints
+
+
+# --- Stroke Commands ---
+
+class StrokeCommand:
+    """
+    One finished stroke, as needed to replay it: palette color index, pen (or
+    eraser) size, erase flag and the stroke's points packed as float32 x, y.
+
+    A bucket fill is a command too, with `is_fill` set, its seed as the first
+    point, the corners of the area it was computed in as the other two, and
+    the color tolerance as its size.
+    """
+
+    __slots__ = ("color_index", "size", "is_eraser", "is_fill", "points", "change", "fill_patch")
+
+    def __init__(self, color_index, size, is_eraser, points, is_fill=False):
+        self.color_index = color_index
+        self.size = size
+        self.is_eraser = is_eraser
+        self.is_fill = is_fill
+        self.points = array("f", [value for point in points for value in point])
+        self.change = None # DocumentChange recorded when the command was applied
+        self.fill_patch = None # For fills: the region as first painted
+
+    @classmethod
+    def from_packed(cls, color_index, size, is_eraser, is_fill, points):
+        """Creates a command from points already packed in an array('f')."""
+        command = cls(color_index, size, is_eraser, (), is_fill)
+        command.points = points
+        return command
+
+    def point_list(self):
+        """Returns the points as a list of (x, y) tuples."""
+        values = self.points
+        return list(zip(values[0::2], values[1::2]))
+
+    def nbytes(self):
+        """Rough memory footprint, used for history budgeting."""
+        size = 96 + self.points.itemsize * len(self.points)
+        if self.change is not None:
+            size += self.change.nbytes()
+        if self.fill_patch is not None:
+            size += self.fill_patch.nbytes
+        return size
+
+
+# --- Undo/Redo History ---
+
+class StrokeHistory:
+    """
+    An undo/redo stack of StrokeCommands with periodic checkpoints.
+
+    A checkpoint is a snapshot taken after every `checkpoint_interval`
+    commands. Undoing a command restores the nearest checkpoint at or before
+    the new end of history and replays only the commands after it, so undo
+    cost is bounded by the interval instead of the history length.
+
+    When commands and checkpoints together exceed `byte_budget`, the oldest
+    checkpoint and the commands before the next one are discarded.
+    """
+
+    def __init__(self, take_checkpoint, checkpoint_interval=CHECKPOINT_INTERVAL,
+                 byte_budget=HISTORY_BYTE_BUDGET):
+        """
+        Args:
+            take_checkpoint (callable): Returns a snapshot of the current
+                state. Snapshots must have an `nbytes` attribute (e.g. NumPy
+                arrays).
+            checkpoint_interval (int): Commands between checkpoints.
+            byte_budget (int): Maximum bytes kept for the whole history.
+        """
+        self.take_checkpoint = take_checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.byte_budget = byte_budget
+        self.reset()
+
+    def reset(self):
+        """Forgets all history; the current state becomes the base checkpoint."""
+        self.commands = [] # Applied commands, oldest first
+        self.redo_commands = [] # Undone commands, most recently undone last
+        self.checkpoints = [(0, self.take_checkpoint())] # (command count, snapshot)
+        self.nbytes = self.checkpoints[0][1].nbytes
+
+    def can_undo(self):
+        return bool(self.commands)
+
+    def can_redo(self):
+        return bool(self.redo_commands)
+
+    def push(self, command):
+        """Records a newly applied command. A new command discards the redo stack."""
+        for undone in self.redo_commands:
+            self.nbytes -= undone.nbytes()
+        self.redo_commands.clear()
+        self._append(command)
+
+    def _append(self, command):
+        self.commands.append(command)
+        self.nbytes += command.nbytes()
+        if len(self.commands) % self.checkpoint_interval == 0:
+            snapshot = self.take_checkpoint()
+            self.checkpoints.append((len(self.commands), snapshot))
+            self.nbytes += snapshot.nbytes
+        self._evict()
+
+    def undo(self):
+        """
+        Pops the last command onto the redo stack.
+
+        Returns:
+            tuple: (command, snapshot, replay) where `snapshot` is the
+            checkpoint to restore and `replay` the commands to re-apply after
+            restoring it, or None if there is nothing to undo.
+        """
+        if not self.commands:
+            return None
+        command = self.commands.pop()
+        self.redo_commands.append(command)
+        # Checkpoints taken after the new end of history are no longer valid
+        while self.checkpoints[-1][0] > len(self.commands):
+            self.nbytes -= self.checkpoints.pop()[1].nbytes
+        position, snapshot = self.checkpoints[-1]
+        return command, snapshot, self.commands[position:]
+
+    def redo(self):
+        """
+        Pops the most recently undone command. The caller re-applies it and
+        then passes it to `redone()`.
+
+        Returns:
+            StrokeCommand: The command, or None if there is nothing to redo.
+        """
+        if not self.redo_commands:
+            return None
+        command = self.redo_commands.pop()
+        self.nbytes -= command.nbytes()
+        return command
+
+    def redone(self, command):
+        """Records a re-applied command without discarding the redo stack."""
+        self._append(command)
+
+    def _evict(self):
+        """Drops the oldest checkpoint and its commands while over budget."""
+        while self.nbytes > self.byte_budget and len(self.checkpoints) > 1:
+            self.nbytes -= self.checkpoints.pop(0)[1].nbytes
+            position = self.checkpoints[0][0]
+            for command in self.commands[:position]:
+                self.nbytes -= command.nbytes()
+            del self.commands[:position]
+            self.checkpoints = [(count - position, snapshot) for count, snapshot in self.checkpoints]
@@ -0,0 +1,308 @@
+import mmap
+import os
+from array import array
+
+import numpy as np
+
+# NOTE: Unlike 'turtle' and 'tkinter', NumPy is NOT part of Python's standard
+# library. Install it with: pip install numpy
+
+
+# --- File Format ---
+# A journal is the magic bytes followed by a stream of unsigned LEB128 varints
+# (7 bits per byte, high bit set on every byte but the last). Because the whole
+# body is varints, a loader can decode all of it at once with NumPy.
+#
+# Stroke record:
+#   header   bit 0 = erase flag, bits 1-3 = palette index, bits 4-6 = size
+#            (size 0 means the real size follows as its own varint). The
+#            header is below 128, so it always takes exactly one byte.
+#   [size]   only when the header's size field is 0
+#   count    number of points
+#   points   x, y of the first point, then dx, dy to each next point, all in
+#            1/COORD_SCALE pixel units and zigzag-encoded (0,-1,1,-2 -> 0,1,2,3)
+#
+# Control record: a header with palette index 7 (CONTROL_PALETTE_INDEX); the
+# size field holds the operation (OP_UNDO, OP_REDO, OP_FILL or OP_FILL_BOX).
+# A fill is followed by its palette index, tolerance and the zigzag-encoded
+# x, y of the seed point. OP_FILL_BOX adds the area the fill was computed in,
+# as the (xmin, ymax) and (xmax, ymin) corners, so a replay covers exactly the
+# same pixels whatever part of the document is visible at the time. All of a
+# fill's points are absolute, in the same units as stroke points.
+
+MAGIC = b"TPJ1"
+COORD_SCALE = 4 # Points are stored in quarter pixels
+CONTROL_PALETTE_INDEX = 7
+MAX_INLINE_SIZE = 7
+OP_UNDO = 1
+OP_REDO = 2
+OP_FILL = 3 # Seed point only (older journals)
+OP_FILL_BOX = 4
+
+
+# --- Encoding ---
+
+def _append_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+def encode_stroke(color_index, size, is_eraser, points):
+    """
+    Encodes one stroke record.
+
+    Args:
+        color_index (int): Palette index, 0-6.
+        size (int): Pen or eraser size in pixels.
+        is_eraser (bool): True for eraser strokes.
+        points (list): (x, y) points in turtle coordinates.
+
+    Returns:
+        bytearray: The encoded record.
+    """
+    inline_size = size if 0 < size <= MAX_INLINE_SIZE else 0
+    out = bytearray([int(is_eraser) | (color_index << 1) | (inline_size << 4)])
+    if inline_size == 0:
+        _append_varint(out, size)
+    _append_varint(out, len(points))
+    last_x = last_y = 0
+    for x, y in points:
+        qx, qy = round(x * COORD_SCALE), round(y * COORD_SCALE)
+        _append_varint(out, _zigzag(qx - last_x))
+        _append_varint(out, _zigzag(qy - last_y))
+        last_x, last_y = qx, qy
+    return out
+
+def encode_control(operation):
+    """Encodes a control record (OP_UNDO or OP_REDO)."""
+    return bytearray([(CONTROL_PALETTE_INDEX << 1) | (operation << 4)])
+
+def encode_fill(color_index, tolerance, points):
+    """
+    Encodes a bucket fill.
+
+    Args:
+        points (list): The seed point, optionally followed by the (xmin, ymax)
+            and (xmax, ymin) corners of the area the fill was computed in,
+            all in turtle coordinates.
+    """
+    out = encode_control(OP_FILL_BOX if len(points) == 3 else OP_FILL)
+    _append_varint(out, color_index)
+    _append_varint(out, tolerance)
+    for x, y in points:
+        _append_varint(out, _zigzag(round(x * COORD_SCALE)))
+        _append_varint(out, _zigzag(round(y * COORD_SCALE)))
+    return out
+
+
+# --- Streaming Writer ---
+
+class JournalWriter:
+    """
+    Appends records to a journal file as strokes finish, so saving costs
+    O(new stroke) no matter how large the document is.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+            self.file.flush()
+
+    def append(self, record):
+        self.file.write(record)
+        self.file.flush()
+
+    def truncate(self):
+        """Empties the journal (e.g. after the canvas is cleared)."""
+        self.file.seek(0)
+        self.file.truncate()
+        self.file.write(MAGIC)
+        self.file.flush()
+
+    def rewrite(self, records):
+        """Replaces the whole journal with `records`, atomically."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(MAGIC)
+            for record in records:
+                temp_file.write(record)
+        self.file.close()
+        os.replace(temp_path, self.path)
+        self.file = open(self.path, "ab")
+
+    def close(self):
+        self.file.close()
+
+
+# --- Memory-Mapped Loader ---
+
+def decode_varints(data):
+    """
+    Decodes every varint in a uint8 array at once.
+
+    Returns:
+        numpy.ndarray: The values as int64. A truncated varint at the end
+        (an interrupted write) is ignored.
+    """
+    ends = np.flatnonzero(data < 0x80) # The last byte of every varint
+    if len(ends) == 0:
+        return np.zeros(0, dtype=np.int64)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    payload = (data[:ends[-1] + 1] & 0x7F).astype(np.int64)
+    values = payload[starts].copy()
+    for k in range(1, int(lengths.max())):
+        longer = lengths > k
+        values[longer] |= payload[starts[longer] + k] << (7 * k)
+    return values
+
+def load_journal(path):
+    """
+    Loads a journal through a memory map and replays its undo/redo records.
+    A partially written last record (an interrupted write) is cut off the
+    file, so the records appended next start on a record boundary.
+
+    Returns:
+        tuple: (strokes, record_count) as returned by decode_journal(). An
+        empty journal gives ([], 0).
+    """
+    with open(path, "rb") as journal_file:
+        size = os.fstat(journal_file.fileno()).st_size
+        if size <= len(MAGIC):
+            return [], 0
+        with mmap.mmap(journal_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a paint journal")
+            data = np.frombuffer(mapped, dtype=np.uint8, offset=len(MAGIC))
+            values = decode_varints(data)
+            strokes, record_count, complete = _replay_records(values)
+            end = len(data)
+            if complete < len(values) or data[-1] >= 0x80:
+                # The last complete record ends with its last varint
+                end = int(np.flatnonzero(data < 0x80)[complete - 1]) + 1 if complete else 0
+            del data # Release the buffer before the map is closed
+    if len(MAGIC) + end < size:
+        with open(path, "r+b") as journal_file:
+            journal_file.truncate(len(MAGIC) + end)
+        print(f"Removed an incomplete record from the end of {path}.")
+    return strokes, record_count
+
+def decode_journal(data):
+    """
+    Decodes journal records held in memory (without the magic bytes), e.g.
+    records received over the network.
+
+    Args:
+        data (bytes): Concatenated records.
+
+    Returns:
+        tuple: (strokes, record_count) where `strokes` lists the strokes still
+        applied, oldest first, as (color_index, size, is_eraser, is_fill,
+        points) with `points` an array('f') of packed x, y values (for a
+        fill: its seed point and area corners, see encode_fill(), with the
+        tolerance as size), and
+        `record_count` is the number of records read. A partially written
+        last record is ignored.
+    """
+    if not data:
+        return [], 0
+    return _replay_records(decode_varints(np.frombuffer(data, dtype=np.uint8)))[:2]
+
+def _replay_records(values):
+    """
+    Walks decoded varints as records.
+
+    Returns:
+        tuple: (strokes, record_count) as in decode_journal(), plus the
+        number of values taken by complete records.
+    """
+    # Walk the records with plain ints; only headers and counts are read
+    # here, the points of every record are converted in one pass below
+    value_list = values.tolist()
+    records = [] # (color_index, size, is_eraser, is_fill, first point value, count)
+    undone = []
+    record_count = 0
+    position = 0
+    complete = 0
+    total = len(value_list)
+    while position < total:
+        complete = position
+        header = value_list[position]
+        color_index = (header >> 1) & 0x7
+        size = header >> 4
+        if color_index == CONTROL_PALETTE_INDEX:
+            if size == OP_UNDO and records:
+                undone.append(records.pop())
+            elif size == OP_REDO and undone:
+                records.append(undone.pop())
+            elif size == OP_FILL or size == OP_FILL_BOX:
+                count = 1 if size == OP_FILL else 3
+                if position + 3 + 2 * count > total:
+                    break # Interrupted write
+                records.append((value_list[position + 1], value_list[position + 2],
+                                False, True, position + 3, count))
+                undone.clear()
+                position += 2 + 2 * count
+            position += 1
+            record_count += 1
+            continue
+
+        position += 1
+        if size == 0:
+            if position >= total:
+                break
+            size = value_list[position]
+            position += 1
+        if position >= total:
+            break
+        count = value_list[position]
+        position += 1
+        if position + 2 * count > total:
+            break # Interrupted write
+        records.append((color_index, size, bool(header & 1), False, position, count))
+        undone.clear()
+        position += 2 * count
+        record_count += 1
+    else:
+        complete = position
+
+    if not records:
+        return [], record_count, complete
+
+    # Undo zigzag, then take running sums of every other value (x with x,
+    # y with y) once for the whole stream. A record's absolute coordinates
+    # are those sums minus the sums just before its first point; a record
+    # always starts with a header and a count, so those two values exist.
+    signed = (values >> 1) ^ -(values & 1)
+    running = np.empty_like(signed)
+    running[0::2] = np.cumsum(signed[0::2])
+    running[1::2] = np.cumsum(signed[1::2])
+
+    firsts = np.array([record[4] for record in records], dtype=np.int64)
+    lengths = 2 * np.array([record[5] for record in records], dtype=np.int64)
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    within = np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], lengths)
+    starts = np.repeat(firsts, lengths)
+    coords = running[starts + within] - running[starts - 2 + (within & 1)]
+    # A fill's points are absolute, not deltas from the values before them
+    fill_values = np.repeat(np.array([record[3] for record in records]), lengths)
+    coords[fill_values] = signed[(starts + within)[fill_values]]
+    coords = (coords / COORD_SCALE).astype(np.float32)
+
+    raw = memoryview(coords).cast("B")
+    item = coords.itemsize
+    strokes = []
+    for (color_index, size, is_eraser, is_fill, _, _), begin, end in zip(records, offsets[:-1].tolist(), offsets[1:].tolist()):
+        points = array("f")
+        points.frombytes(raw[begin * item:end * item])
+        strokes.append((color_index, size, is_eraser, is_fill, points))
+    return strokes, record_count, complete
@@ -0,0 +1,480 @@
+import bisect
+import tkinter as tk
+
+import numpy as np
+
+# NOTE: Unlike 'turtle' and 'tkinter', NumPy is NOT part of Python's standard
+# library. Install it with: pip install numpy
+
+
+# --- Configuration ---
+TILE_SIZE = 256 # Side of one raster tile, in pixels
+
+
+# --- Tiled Raster Layer ---
+# Finished strokes are flattened into RGB bitmap tiles, each shown as one
+# canvas image item. Only the live stroke stays as vector (line) items, so the
+# number of canvas items no longer grows with the length of a painting session.
+# Tiles are allocated the first time something is painted on them, so memory
+# follows the painted area rather than the document size, and only dirty tiles
+# inside the visible viewport are uploaded to Tk.
+
+class RasterLayer:
+    """
+    A large document bitmap stored as lazily allocated NumPy tiles.
+
+    Pixel (0, 0) is the top-left corner of the document, which is centered on
+    the turtle origin. Unallocated tiles are implicitly the background color.
+    """
+
+    def __init__(self, canvas, width, height, background, tile_size=TILE_SIZE,
+                 image_factory=None):
+        """
+        Args:
+            canvas: The Tk canvas (e.g. screen.cv) to show the layer on.
+            width (int): Document width in pixels.
+            height (int): Document height in pixels.
+            background (tuple): (r, g, b) fill color, 0-255 per channel.
+            tile_size (int): Side of one tile in pixels.
+            image_factory (callable): Creates a tile image, called like
+                tkinter.PhotoImage(master=..., width=..., height=...).
+                Defaults to tkinter.PhotoImage.
+        """
+        self.canvas = canvas
+        self.image_factory = image_factory or tk.PhotoImage
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.background = np.array(background, dtype=np.uint8)
+        self.tiles = {} # (column, row) -> tile_size x tile_size x 3 uint8 array
+        self.shared = set() # Tiles also referenced by a snapshot (copied on write)
+        self.dirty = {} # (column, row) -> (left, top, right, bottom) in tile pixels
+        self.images = {} # (column, row) -> (PhotoImage, canvas item)
+        self.viewport = (0, 0, width, height) # Visible pixel box, set by the app
+
+    # --- Coordinates ---
+
+    def to_pixel(self, x, y):
+        """Converts turtle coordinates (0,0 center, y up) to pixel coordinates."""
+        return x + self.width // 2, self.height // 2 - y
+
+    def to_turtle(self, column, row):
+        """Converts pixel coordinates back to turtle coordinates."""
+        return column - self.width // 2, self.height // 2 - row
+
+    def to_pixel_box(self, bbox):
+        """
+        Converts a turtle-coordinate box (xmin, ymin, xmax, ymax) to the pixel
+        box (left, top, right, bottom) covering it, clamped to the document.
+        """
+        xmin, ymin, xmax, ymax = bbox
+        left, top = self.to_pixel(xmin, ymax)
+        right, bottom = self.to_pixel(xmax, ymin)
+        return (max(int(left), 0), max(int(top), 0),
+                min(int(right) + 2, self.width), min(int(bottom) + 2, self.height))
+
+    def _tiles_in(self, box):
+        """
+        Yields (key, tile_left, tile_top, left, top, right, bottom) for every
+        tile overlapping the pixel box, with the overlap in document pixels.
+        """
+        left, top, right, bottom = box
+        size = self.tile_size
+        for row in range(max(top, 0) // size, (min(bottom, self.height) - 1) // size + 1):
+            for column in range(max(left, 0) // size, (min(right, self.width) - 1) // size + 1):
+                tile_left, tile_top = column * size, row * size
+                yield ((column, row), tile_left, tile_top,
+                       max(left, tile_left), max(top, tile_top),
+                       min(right, tile_left + size), min(bottom, tile_top + size))
+
+    # --- Tile Storage ---
+
+    def _writable_tile(self, key):
+        """Returns a tile for writing, allocating it or un-sharing it as needed."""
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = np.empty((self.tile_size, self.tile_size, 3), dtype=np.uint8)
+            tile[:] = self.background
+            self.tiles[key] = tile
+        elif key in self.shared:
+            tile = tile.copy()
+            self.tiles[key] = tile
+            self.shared.discard(key)
+        return tile
+
+    def mark_dirty(self, left, top, right, bottom):
+        """Marks a document pixel box to be uploaded by the next present()."""
+        for key, tile_left, tile_top, l, t, r, b in self._tiles_in((left, top, right, bottom)):
+            box = (l - tile_left, t - tile_top, r - tile_left, b - tile_top)
+            old = self.dirty.get(key)
+            if old is not None:
+                box = (min(old[0], box[0]), min(old[1], box[1]), max(old[2], box[2]), max(old[3], box[3]))
+            self.dirty[key] = box
+
+    def read_region(self, box):
+        """Returns a copy of a pixel box as one array (e.g. for a bucket fill)."""
+        left, top, right, bottom = box
+        region = np.empty((bottom - top, right - left, 3), dtype=np.uint8)
+        region[:] = self.background
+        for key, _, _, l, t, r, b in self._tiles_in(box):
+            tile = self.tiles.get(key)
+            if tile is not None:
+                tile_left, tile_top = key[0] * self.tile_size, key[1] * self.tile_size
+                region[t - top:b - top, l - left:r - left] = \
+                    tile[t - tile_top:b - tile_top, l - tile_left:r - tile_left]
+        return region
+
+    def snapshot(self):
+        """
+        Returns a copy-on-write snapshot of the tiles, e.g. for an undo
+        checkpoint. Taking it is O(tiles); pixels are only copied when a tile
+        is next written.
+        """
+        snapshot = TileSnapshot(self.tiles)
+        # Tiles still shared with an older snapshot cost this one nothing
+        written = len(self.tiles) - len(self.shared & self.tiles.keys())
+        snapshot.nbytes = 64 * len(self.tiles) + written * self.tile_size * self.tile_size * 3
+        self.shared = set(self.tiles)
+        return snapshot
+
+    def restore(self, snapshot):
+        """Replaces the tiles with a snapshot taken by snapshot()."""
+        changed = set(self.tiles) | set(snapshot)
+        self.tiles = dict(snapshot)
+        self.shared = set(self.tiles)
+        for column, row in changed:
+            self.mark_dirty(column * self.tile_size, row * self.tile_size,
+                            (column + 1) * self.tile_size, (row + 1) * self.tile_size)
+
+    def clear(self):
+        """Drops every tile; the whole document becomes background."""
+        for column, row in self.tiles:
+            self.mark_dirty(column * self.tile_size, row * self.tile_size,
+                            (column + 1) * self.tile_size, (row + 1) * self.tile_size)
+        self.tiles = {}
+        self.shared = set()
+
+    def clear_region(self, box):
+        """Fills the pixel box (left, top, right, bottom) with the background color."""
+        for key, tile_left, tile_top, l, t, r, b in self._tiles_in(box):
+            if key in self.tiles:
+                tile = self._writable_tile(key)
+                tile[t - tile_top:b - tile_top, l - tile_left:r - tile_left] = self.background
+                self.mark_dirty(l, t, r, b)
+
+    # --- Drawing ---
+
+    def draw_items(self, items, box):
+        """
+        Redraws document items, clipped to the pixel box, in the given order.
+
+        Args:
+            items (list): (x0, y0, x1, y1, color, width, ...) segment tuples
+                and FillPatch objects.
+            box (tuple): (left, top, right, bottom) pixel clip box.
+        """
+        for item in items:
+            if isinstance(item, FillPatch):
+                self.draw_fill(item, box)
+                continue
+            x0, y0, x1, y1, color, width, _ = item
+            px0, py0 = self.to_pixel(x0, y0)
+            px1, py1 = self.to_pixel(x1, y1)
+            self._stamp_segment(px0, py0, px1, py1, max(width / 2, 0.5),
+                                np.array(color, dtype=np.uint8), box)
+
+    def draw_polyline(self, points, color, width):
+        """
+        Rasterizes a polyline with round caps and joins, like a Tk line item.
+
+        Args:
+            points (list): (x, y) vertices in turtle coordinates.
+            color (tuple): (r, g, b) stroke color, 0-255 per channel.
+            width (float): Line width in pixels.
+        """
+        radius = max(width / 2, 0.5)
+        rgb = np.array(color, dtype=np.uint8)
+        pixel_points = [self.to_pixel(x, y) for x, y in points]
+        if len(pixel_points) == 1:
+            pixel_points.append(pixel_points[0]) # A single point is a dot
+        for (x0, y0), (x1, y1) in zip(pixel_points, pixel_points[1:]):
+            self._stamp_segment(x0, y0, x1, y1, radius, rgb)
+
+    def _stamp_segment(self, x0, y0, x1, y1, radius, rgb, clip=None):
+        """
+        Sets every pixel within `radius` of the segment (x0,y0)-(x1,y1),
+        optionally only inside the pixel box `clip`. Only tiles the line
+        actually passes through are visited (and allocated).
+        """
+        clip_left, clip_top, clip_right, clip_bottom = clip or (0, 0, self.width, self.height)
+        box = (max(int(min(x0, x1) - radius), clip_left),
+               max(int(min(y0, y1) - radius), clip_top),
+               min(int(max(x0, x1) + radius) + 2, clip_right),
+               min(int(max(y0, y1) + radius) + 2, clip_bottom))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return # Entirely off the document
+
+        # Tiles farther from the line than the radius plus half their diagonal are skipped
+        reach = radius + self.tile_size * 0.7072
+        for key, tile_left, tile_top, left, top, right, bottom in self._tiles_in(box):
+            half = self.tile_size / 2
+            if point_segment_distance(tile_left + half, tile_top + half, x0, y0, x1, y1) > reach:
+                continue
+            ys, xs = np.ogrid[top:bottom, left:right]
+            inside = segment_mask(xs, ys, x0, y0, x1, y1, radius)
+            if not inside.any():
+                continue
+            tile = self._writable_tile(key)
+            tile[top - tile_top:bottom - tile_top, left - tile_left:right - tile_left][inside] = rgb
+            self.mark_dirty(left, top, right, bottom)
+
+    def draw_fill(self, patch, clip=None):
+        """Paints a fill patch's pixels, optionally only inside the pixel box `clip`."""
+        patch_left, patch_top = self.to_pixel(patch.x, patch.y)
+        patch_height, patch_width = patch.mask.shape
+        box = (patch_left, patch_top, patch_left + patch_width, patch_top + patch_height)
+        if clip is not None:
+            box = (max(box[0], clip[0]), max(box[1], clip[1]), min(box[2], clip[2]), min(box[3], clip[3]))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return
+        rgb = np.array(patch.color, dtype=np.uint8)
+        for key, tile_left, tile_top, left, top, right, bottom in self._tiles_in(box):
+            mask = patch.mask[top - patch_top:bottom - patch_top, left - patch_left:right - patch_left]
+            if not mask.any():
+                continue
+            tile = self._writable_tile(key)
+            tile[top - tile_top:bottom - tile_top, left - tile_left:right - tile_left][mask] = rgb
+            self.mark_dirty(left, top, right, bottom)
+
+    def flood_fill(self, x, y, color, tolerance, order, box=None):
+        """
+        Computes the region a bucket fill at turtle point (x, y) would cover
+        within a pixel box (by default the visible viewport), paints it, and
+        returns it as a FillPatch (None if the point is outside the box).
+
+        A fill replayed with the box it was first computed in covers the same
+        pixels, whatever part of the document is visible at the time.
+        """
+        column, row = (round(value) for value in self.to_pixel(x, y))
+        box_left, box_top, box_right, box_bottom = box or self.viewport
+        if not (box_left <= column < box_right and box_top <= row < box_bottom):
+            return None
+        region = self.read_region((box_left, box_top, box_right, box_bottom))
+        mask, left, top = scanline_fill_mask(region, column - box_left, row - box_top, tolerance)
+        left += box_left
+        top += box_top
+        patch_x, patch_y = self.to_turtle(left, top)
+        patch = FillPatch(patch_x, patch_y, mask, tuple(color), order)
+        self.draw_fill(patch)
+        return patch
+
+    # --- Display ---
+
+    def present(self):
+        """
+        Uploads the dirty parts of tiles inside the viewport, one binary PPM
+        block per tile. Dirty tiles outside it wait until they are scrolled
+        into view; tiles that were dropped lose their image item.
+        """
+        size = self.tile_size
+        view_left, view_top, view_right, view_bottom = self.viewport
+        visible = [key for key in self.dirty
+                   if view_left < (key[0] + 1) * size and key[0] * size < view_right
+                   and view_top < (key[1] + 1) * size and key[1] * size < view_bottom]
+        for key in visible:
+            left, top, right, bottom = self.dirty.pop(key)
+            tile = self.tiles.get(key)
+            if tile is None:
+                image = self.images.pop(key, None)
+                if image is not None:
+                    self.canvas.delete(image[1])
+                continue
+            if key not in self.images:
+                photo = self.image_factory(master=self.canvas, width=size, height=size)
+                # Canvas coordinates share the turtle origin, with y pointing down
+                item = self.canvas.create_image(key[0] * size - self.width // 2,
+                                                key[1] * size - self.height // 2,
+                                                image=photo, anchor="nw")
+                self.canvas.tag_lower(item) # Always behind strokes, cursor and text
+                self.images[key] = (photo, item)
+                left, top, right, bottom = 0, 0, size, size # A new image starts blank
+            photo = self.images[key][0]
+            region = tile[top:bottom, left:right]
+            header = b"P6 %d %d 255\n" % (right - left, bottom - top)
+            photo.tk.call(photo.name, "put", header + region.tobytes(),
+                          "-format", "ppm", "-to", left, top)
+
+
+class TileSnapshot(dict):
+    """A checkpoint of RasterLayer tiles; `nbytes` is its memory estimate."""
+
+    nbytes = 0
+
+
+def point_segment_distance(px, py, x0, y0, x1, y1):
+    """Distance from point (px, py) to the segment (x0,y0)-(x1,y1)."""
+    dx, dy = x1 - x0, y1 - y0
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else min(max(((px - x0) * dx + (py - y0) * dy) / length_sq, 0.0), 1.0)
+    return ((px - x0 - t * dx) ** 2 + (py - y0 - t * dy) ** 2) ** 0.5
+
+def segment_mask(xs, ys, x0, y0, x1, y1, radius):
+    """
+    Boolean mask of the pixels (given as broadcastable coordinate arrays) that
+    lie within `radius` of the segment (x0,y0)-(x1,y1).
+    """
+    dx, dy = x1 - x0, y1 - y0
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        t = 0.0
+    else:
+        # Parameter of the closest point on the segment, clamped to its ends
+        t = np.clip(((xs - x0) * dx + (ys - y0) * dy) / length_sq, 0.0, 1.0)
+    return (xs - x0 - t * dx) ** 2 + (ys - y0 - t * dy) ** 2 <= radius * radius
+
+
+# --- Bucket Fill ---
+
+def scanline_fill_mask(pixels, column, row, tolerance):
+    """
+    Span-based flood fill. Every row of the image is split into runs of
+    pixels matching the seed color (within `tolerance` per channel) using
+    vectorized NumPy, then the connected runs are collected starting from
+    the run under the seed, visiting each run once. Work is proportional to
+    the number of runs, not the number of pixels.
+
+    Returns:
+        tuple: (mask, left, top) where `mask` is a boolean array cropped to
+        the filled region and (left, top) its pixel position.
+    """
+    height, width, _ = pixels.shape
+    seed = pixels[row, column].astype(np.int16)
+    matches = (np.abs(pixels.astype(np.int16) - seed) <= tolerance).all(axis=2)
+
+    # Runs of matching pixels, in row-major order: starts are inclusive, ends exclusive
+    edges = np.zeros((height, width + 2), dtype=np.int8)
+    edges[:, 1:-1] = matches
+    steps = np.diff(edges, axis=1)
+    run_rows, run_starts = np.nonzero(steps == 1)
+    run_ends = np.nonzero(steps == -1)[1]
+    row_offsets = np.searchsorted(run_rows, np.arange(height + 1)).tolist()
+    starts = run_starts.tolist()
+    ends = run_ends.tolist()
+    rows = run_rows.tolist()
+
+    first = bisect.bisect_right(starts, column, row_offsets[row], row_offsets[row + 1]) - 1
+    filled = np.zeros(len(starts), dtype=bool)
+    filled[first] = True
+    stack = [first]
+    while stack:
+        run = stack.pop()
+        start, end, run_row = starts[run], ends[run], rows[run]
+        for neighbor_row in (run_row - 1, run_row + 1):
+            if not 0 <= neighbor_row < height:
+                continue
+            low, high = row_offsets[neighbor_row], row_offsets[neighbor_row + 1]
+            # Runs in the neighbor row that share a column with this one
+            first_touching = bisect.bisect_right(ends, start, low, high)
+            last_touching = bisect.bisect_left(starts, end, low, high)
+            for neighbor in range(first_touching, last_touching):
+                if not filled[neighbor]:
+                    filled[neighbor] = True
+                    stack.append(neighbor)
+
+    # Paint the collected runs with one cumulative sum over +1/-1 markers
+    fill_rows = run_rows[filled]
+    fill_starts = run_starts[filled]
+    fill_ends = run_ends[filled]
+    top, bottom = int(fill_rows.min()), int(fill_rows.max()) + 1
+    left, right = int(fill_starts.min()), int(fill_ends.max())
+    markers = np.zeros((bottom - top, right - left + 1), dtype=np.int32)
+    np.add.at(markers, (fill_rows - top, fill_starts - left), 1)
+    np.add.at(markers, (fill_rows - top, fill_ends - left), -1)
+    mask = np.cumsum(markers, axis=1)[:, :-1] > 0
+    return mask, left, top
+
+
+class FillPatch:
+    """
+    A filled region as a document item: a boolean mask whose top-left pixel
+    sits at turtle point (x, y), painted in one color at a given paint order.
+    `count` is the number of pixels still set in the mask.
+    """
+
+    __slots__ = ("x", "y", "mask", "color", "order", "count")
+
+    def __init__(self, x, y, mask, color, order):
+        self.x = x
+        self.y = y
+        self.mask = mask
+        self.color = color
+        self.order = order
+        self.count = int(np.count_nonzero(mask))
+
+    @property
+    def nbytes(self):
+        return self.mask.nbytes + 64
+
+    def bbox(self):
+        height, width = self.mask.shape
+        return self.x - 0.5, self.y - height + 0.5, self.x + width - 0.5, self.y + 0.5
+
+    def _window(self, xmin, ymin, xmax, ymax):
+        """Mask (top, bottom, left, right) rows and columns of the pixels touching a turtle box."""
+        height, width = self.mask.shape
+        return (max(int(np.floor(self.y - ymax)), 0), min(int(np.ceil(self.y - ymin)) + 1, height),
+                max(int(np.floor(xmin - self.x)), 0), min(int(np.ceil(xmax - self.x)) + 1, width))
+
+    def is_empty(self):
+        return self.count == 0
+
+    def has_pixels_in(self, bbox):
+        """True if any pixel near the turtle box (xmin, ymin, xmax, ymax) is still set."""
+        top, bottom, left, right = self._window(*bbox)
+        return top < bottom and left < right and bool(self.mask[top:bottom, left:right].any())
+
+    def erase_disk(self, cx, cy, radius):
+        """
+        Cuts the disk at (cx, cy) out of the patch, in place. Only the disk's
+        window of the mask is read and written.
+
+        Returns:
+            tuple: (cut, bbox) with the MaskCut that restore() takes to undo
+            it and the bounding box of the erased pixels, or None if the disk
+            does not touch the patch.
+        """
+        top, bottom, left, right = self._window(cx - radius, cy - radius, cx + radius, cy + radius)
+        if left >= right or top >= bottom:
+            return None
+        rows, columns = np.ogrid[top:bottom, left:right]
+        inside = (self.x + columns - cx) ** 2 + (self.y - rows - cy) ** 2 <= radius * radius
+        window = self.mask[top:bottom, left:right]
+        cleared = window & inside
+        if not cleared.any():
+            return None
+
+        window &= ~inside # A view, so this writes the mask itself
+        self.count -= int(np.count_nonzero(cleared))
+        removed_bbox = (self.x + left - 0.5, self.y - bottom + 0.5, self.x + right - 0.5, self.y - top + 0.5)
+        return MaskCut(top, left, cleared), removed_bbox
+
+    def restore(self, cut):
+        """Puts back the pixels an erase_disk() call cleared."""
+        height, width = cut.cleared.shape
+        self.mask[cut.top:cut.top + height, cut.left:cut.left + width] |= cut.cleared
+        self.count += int(np.count_nonzero(cut.cleared))
+
+
+class MaskCut:
+    """The pixels one FillPatch.erase_disk() call cleared, kept for undo."""
+
+    __slots__ = ("top", "left", "cleared")
+
+    def __init__(self, top, left, cleared):
+        self.top = top
+        self.left = left
+        self.cleared = cleared
+
+    @property
+    def nbytes(self):
+        return self.cleared.nbytes + 64
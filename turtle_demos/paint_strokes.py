@@ -0,0 +1,421 @@
+import math
+
+# NOTE: This module only uses Python's standard library.
+
+
+# --- Configuration ---
+GRID_CELL_SIZE = 32 # Side of one spatial index cell, in turtle units (pixels)
+MIN_SEGMENT_LENGTH = 0.5 # Pieces shorter than this are dropped when splitting
+SIMPLIFY_TOLERANCE = 1.0 # Max distance (pixels) a dropped sample may lie off the kept line
+MAX_PENDING_SAMPLES = 64 # Bounds the per-sample work of the simplifier
+
+
+# --- Spatial Index ---
+
+class SegmentGrid:
+    """
+    A uniform grid mapping cells to the ids of segments whose bounding box
+    overlaps them. Lookups only visit the cells under the query box, so their
+    cost depends on the local stroke density, not on the document size.
+    """
+
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # (column, row) -> set of segment ids
+
+    def _cell_keys(self, bbox):
+        """Yields the (column, row) keys of every cell overlapping `bbox`."""
+        xmin, ymin, xmax, ymax = bbox
+        size = self.cell_size
+        for column in range(math.floor(xmin / size), math.floor(xmax / size) + 1):
+            for row in range(math.floor(ymin / size), math.floor(ymax / size) + 1):
+                yield column, row
+
+    def insert(self, segment_id, bbox):
+        for key in self._cell_keys(bbox):
+            self.cells.setdefault(key, set()).add(segment_id)
+
+    def remove(self, segment_id, bbox, still_covers=None):
+        """
+        Removes a segment from the cells overlapping `bbox`.
+
+        Args:
+            still_covers (callable): Optional test taking a cell's (xmin, ymin,
+                xmax, ymax) box; cells for which it returns True keep listing
+                the segment (e.g. when only part of an item was erased).
+        """
+        size = self.cell_size
+        for key in self._cell_keys(bbox):
+            cell = self.cells.get(key)
+            if cell is None or segment_id not in cell:
+                continue
+            column, row = key
+            if still_covers is not None and still_covers((column * size, row * size,
+                                                          (column + 1) * size, (row + 1) * size)):
+                continue
+            cell.discard(segment_id)
+            if not cell:
+                del self.cells[key]
+
+    def query(self, bbox):
+        """Returns the ids of all segments whose cells overlap `bbox`."""
+        found = set()
+        for key in self._cell_keys(bbox):
+            cell = self.cells.get(key)
+            if cell:
+                found.update(cell)
+        return found
+
+    def clear(self):
+        self.cells.clear()
+
+
+# --- Capture-Time Simplification ---
+
+class StrokeSimplifier:
+    """
+    Streaming polyline simplification for mouse samples.
+
+    Samples are buffered while they all stay within `tolerance` of the line
+    from the last kept vertex to the newest sample. When one would stray
+    further, the previous sample becomes a kept vertex. Runs of nearly
+    collinear one-pixel moves therefore collapse into a single segment,
+    and the result never deviates from the raw path by more than `tolerance`.
+    """
+
+    def __init__(self, tolerance=SIMPLIFY_TOLERANCE, max_pending=MAX_PENDING_SAMPLES):
+        self.tolerance = tolerance
+        self.max_pending = max_pending
+        self.anchor = None # Last kept vertex
+        self.pending = [] # Samples since the anchor, newest last
+        self.raw_count = 0
+        self.kept_count = 0
+
+    def start(self, x, y):
+        """Begins a stroke. Returns the vertices to keep (the first sample)."""
+        self.anchor = (x, y)
+        self.pending = []
+        self.raw_count = 1
+        self.kept_count = 1
+        return [self.anchor]
+
+    def add(self, x, y):
+        """Feeds one sample. Returns the vertices it commits (zero or one)."""
+        self.raw_count += 1
+        if self.pending and (len(self.pending) >= self.max_pending
+                             or not self._fits((x, y))):
+            return self._commit([(x, y)])
+        self.pending.append((x, y))
+        return []
+
+    def finish(self):
+        """Ends the stroke. Returns the final vertex, if one is still pending."""
+        if not self.pending:
+            return []
+        return self._commit([])
+
+    def _commit(self, new_pending):
+        """Keeps the newest pending sample as a vertex and restarts from it."""
+        self.anchor = self.pending[-1]
+        self.pending = new_pending
+        self.kept_count += 1
+        return [self.anchor]
+
+    def _fits(self, end):
+        """True if every pending sample is within tolerance of anchor -> end."""
+        ax, ay = self.anchor
+        dx, dy = end[0] - ax, end[1] - ay
+        length = math.hypot(dx, dy)
+        for px, py in self.pending:
+            if length == 0:
+                distance = math.hypot(px - ax, py - ay)
+            else:
+                # Perpendicular distance, or distance to the nearest end
+                t = ((px - ax) * dx + (py - ay) * dy) / (length * length)
+                if t < 0:
+                    distance = math.hypot(px - ax, py - ay)
+                elif t > 1:
+                    distance = math.hypot(px - end[0], py - end[1])
+                else:
+                    distance = abs((px - ax) * dy - (py - ay) * dx) / length
+            if distance > self.tolerance:
+                return False
+        return True
+
+
+def catmull_rom(points, subdivisions):
+    """
+    Fits a uniform Catmull-Rom spline through `points`.
+
+    Args:
+        points (list): (x, y) control points; the curve passes through each.
+        subdivisions (int): Line segments generated per span. 0 or 1 returns
+            the points unchanged.
+
+    Returns:
+        list: The smoothed polyline as (x, y) points.
+    """
+    if subdivisions <= 1 or len(points) < 3:
+        return list(points)
+    padded = [points[0]] + list(points) + [points[-1]]
+    curve = [points[0]]
+    for i in range(1, len(padded) - 2):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = padded[i - 1:i + 3]
+        for step in range(1, subdivisions + 1):
+            t = step / subdivisions
+            t2, t3 = t * t, t * t * t
+            curve.append((
+                0.5 * (2 * x1 + (x2 - x0) * t + (2 * x0 - 5 * x1 + 4 * x2 - x3) * t2 + (3 * x1 - x0 - 3 * x2 + x3) * t3),
+                0.5 * (2 * y1 + (y2 - y0) * t + (2 * y0 - 5 * y1 + 4 * y2 - y3) * t2 + (3 * y1 - y0 - 3 * y2 + y3) * t3),
+            ))
+    return curve
+
+
+# --- Stroke Document ---
+# Items are either segments, stored as plain tuples
+# (x0, y0, x1, y1, color, width, order), or region items such as fill
+# patches: objects with `order`, `nbytes`, `bbox()`, `erase_disk()`,
+# `restore()`, `is_empty()` and `has_pixels_in()` (see FillPatch).
+
+def item_bbox(item):
+    """Bounding box of an item's ink; for segments, including half the line width."""
+    if not isinstance(item, tuple):
+        return item.bbox()
+    x0, y0, x1, y1, _, width, _ = item
+    half = width / 2
+    return min(x0, x1) - half, min(y0, y1) - half, max(x0, x1) + half, max(y0, y1) + half
+
+def item_order(item):
+    return item[6] if isinstance(item, tuple) else item.order
+
+
+class DocumentChange:
+    """
+    What one operation did to a StrokeDocument, recorded so it can be reverted
+    in time proportional to the operation rather than to the document.
+    """
+
+    __slots__ = ("added", "removed", "cuts", "bbox")
+
+    def __init__(self):
+        self.added = set() # Ids of items the operation created
+        self.removed = {} # item id -> item the operation deleted
+        self.cuts = [] # (item id, cut, bbox) for region items erased in place, in order
+        self.bbox = None # Bounding box of all ink added or removed
+
+    def nbytes(self):
+        """Rough memory footprint, used for history budgeting."""
+        size = 64 * len(self.added)
+        for item in self.removed.values():
+            size += 160 if isinstance(item, tuple) else item.nbytes
+        for _, cut, _ in self.cuts:
+            size += cut.nbytes
+        return size
+
+
+class StrokeDocument:
+    """
+    The painting as a set of line segments, each remembering the color, width
+    and paint order of the stroke it came from, plus region items such as
+    fill patches. Erasing removes or splits the items themselves instead of
+    painting over them.
+    """
+
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.items = {} # item id -> segment tuple or region item
+        self.grid = SegmentGrid(cell_size)
+        self.next_id = 0
+        self.next_order = 0
+        self.change = None # DocumentChange being recorded, if any
+
+    def __len__(self):
+        return len(self.items)
+
+    def _add_item(self, item):
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = item
+        bbox = item_bbox(item)
+        self.grid.insert(item_id, bbox)
+        if self.change is not None:
+            self.change.added.add(item_id)
+            self.change.bbox = union_bbox(self.change.bbox, bbox)
+
+    def _remove_item(self, item_id):
+        item = self.items.pop(item_id)
+        bbox = item_bbox(item)
+        self.grid.remove(item_id, bbox)
+        if self.change is not None:
+            if item_id in self.change.added:
+                self.change.added.discard(item_id) # Created and deleted by one operation
+            else:
+                self.change.removed[item_id] = item
+            self.change.bbox = union_bbox(self.change.bbox, bbox)
+        return item
+
+    def begin_change(self):
+        """Starts recording a DocumentChange for the following operations."""
+        self.change = DocumentChange()
+
+    def end_change(self):
+        """Stops recording and returns the DocumentChange."""
+        change, self.change = self.change, None
+        return change
+
+    def revert(self, change):
+        """
+        Undoes a recorded change. It must be the most recent change still
+        applied, so its added items exist and its removed ones do not.
+        """
+        for item_id, cut, bbox in reversed(change.cuts):
+            item = change.removed.get(item_id) or self.items.get(item_id)
+            if item is not None:
+                item.restore(cut)
+                if item_id in self.items:
+                    self.grid.insert(item_id, bbox)
+        for item_id in change.added:
+            item = self.items.pop(item_id)
+            self.grid.remove(item_id, item_bbox(item))
+        for item_id, item in change.removed.items():
+            # Restored under the original id, so paint order is unchanged
+            self.items[item_id] = item
+            self.grid.insert(item_id, item_bbox(item))
+
+    def take_order(self):
+        """Returns the paint order for a new stroke or region item."""
+        order = self.next_order
+        self.next_order += 1
+        return order
+
+    def add_stroke(self, points, color, width):
+        """
+        Adds a brush stroke as one segment per pair of consecutive points.
+
+        Args:
+            points (list): (x, y) samples in turtle coordinates.
+            color (tuple): (r, g, b) stroke color, 0-255 per channel.
+            width (float): Line width in pixels.
+        """
+        order = self.take_order()
+        if len(points) == 1:
+            points = [points[0], points[0]] # A single sample is a dot
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            self._add_item((x0, y0, x1, y1, color, width, order))
+
+    def add_region(self, item):
+        """Adds a region item (e.g. a fill patch); give it an order from take_order()."""
+        self._add_item(item)
+
+    def erase_disk(self, cx, cy, radius):
+        """
+        Removes the ink inside the disk at (cx, cy). Segments crossing its edge
+        are split so the pieces outside the disk survive; region items have
+        the disk cut out in place (see _cut_region()).
+
+        Returns:
+            tuple: Bounding box (xmin, ymin, xmax, ymax) of the removed ink,
+            or None if nothing was touched.
+        """
+        changed = None
+        for item_id in self.grid.query((cx - radius, cy - radius, cx + radius, cy + radius)):
+            item = self.items[item_id]
+            if not isinstance(item, tuple):
+                changed = union_bbox(changed, self._cut_region(item_id, item, cx, cy, radius))
+                continue
+
+            x0, y0, x1, y1, color, width, order = item
+            # Cutting the centerline at radius + width/2 keeps the round cap
+            # of each remaining piece outside the erased disk
+            cut = radius + width / 2
+            dx, dy = x1 - x0, y1 - y0
+            fx, fy = x0 - cx, y0 - cy
+            a = dx * dx + dy * dy
+            c = fx * fx + fy * fy - cut * cut
+            if a == 0:
+                if c > 0:
+                    continue # A dot outside the disk
+                pieces = []
+            else:
+                b = 2 * (dx * fx + dy * fy)
+                discriminant = b * b - 4 * a * c
+                if discriminant <= 0:
+                    continue # The line misses (or only grazes) the disk
+                root = math.sqrt(discriminant)
+                t_enter = (-b - root) / (2 * a)
+                t_exit = (-b + root) / (2 * a)
+                if t_exit <= 0 or t_enter >= 1:
+                    continue # The crossing lies beyond the segment's ends
+                pieces = []
+                if t_enter > 0:
+                    pieces.append((x0, y0, x0 + t_enter * dx, y0 + t_enter * dy))
+                if t_exit < 1:
+                    pieces.append((x0 + t_exit * dx, y0 + t_exit * dy, x1, y1))
+
+            self._remove_item(item_id)
+            for px0, py0, px1, py1 in pieces:
+                if math.hypot(px1 - px0, py1 - py0) >= MIN_SEGMENT_LENGTH:
+                    self._add_item((px0, py0, px1, py1, color, width, order))
+            changed = union_bbox(changed, item_bbox(item))
+        return changed
+
+    def _cut_region(self, item_id, item, cx, cy, radius):
+        """
+        Erases a disk from a region item in place, so the cost follows the
+        disk's area rather than the item's. The cut is recorded for revert();
+        grid cells under it that no longer hold any of the item's pixels stop
+        listing it, and an item with nothing left is removed.
+
+        Returns:
+            tuple: Bounding box of the removed pixels, or None.
+        """
+        result = item.erase_disk(cx, cy, radius)
+        if result is None:
+            return None
+        cut, removed_bbox = result
+        if self.change is not None:
+            self.change.cuts.append((item_id, cut, removed_bbox))
+            self.change.bbox = union_bbox(self.change.bbox, removed_bbox)
+        if item.is_empty():
+            self._remove_item(item_id)
+        else:
+            self.grid.remove(item_id, removed_bbox, still_covers=item.has_pixels_in)
+        return removed_bbox
+
+    def erase_path(self, points, radius):
+        """
+        Erases along a polyline by sweeping the eraser disk over it, with
+        steps of half the radius so fast drags leave no gaps.
+
+        Returns:
+            tuple: Bounding box of the removed ink, or None.
+        """
+        changed = None
+        step = max(radius / 2, 1)
+        if len(points) == 1:
+            points = [points[0], points[0]]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            steps = max(1, math.ceil(math.hypot(x1 - x0, y1 - y0) / step))
+            for i in range(steps + 1):
+                t = i / steps
+                changed = union_bbox(changed, self.erase_disk(x0 + t * (x1 - x0), y0 + t * (y1 - y0), radius))
+        return changed
+
+    def items_in(self, bbox):
+        """Returns the items whose ink may overlap `bbox`, in paint order."""
+        found = [(self.items[item_id], item_id) for item_id in self.grid.query(bbox)]
+        found.sort(key=lambda entry: (item_order(entry[0]), entry[1]))
+        return [item for item, _ in found]
+
+    def clear(self):
+        self.items.clear()
+        self.grid.clear()
+
+
+def union_bbox(first, second):
+    """Smallest box containing both boxes; either may be None."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
@@ -0,0 +1,210 @@
+import numpy as np
+
+from .backends import DEFAULT_LAYER
+from .headless import COLOR_NAMES
+
+# NOTE: Unlike 'turtle' and 'tkinter', NumPy is NOT part of Python's standard
+# library. Install it with: pip install numpy
+
+
+# --- Colors ---
+
+def parse_color(color):
+    """
+    Converts "#rrggbb", one of the color names in headless.COLOR_NAMES or an
+    (r, g, b) tuple of 0-255 values into a uint8 array.
+    """
+    if isinstance(color, str):
+        color = COLOR_NAMES.get(color, color)
+        color = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+    return np.array(color, dtype=np.uint8)
+
+
+# --- NumPy Raster Backend ---
+
+class RasterBackend:
+    """
+    A software rasterizer: draws into NumPy images without any window.
+
+    Each layer is a full-size RGB image plus a mask of the pixels drawn on
+    it; present() composites the layers, in the order they were first used,
+    over the background into `frame`, redoing only the pixel box that was
+    drawn on since the previous present(). Lines and polygons are rasterized a
+    whole primitive at a time with array operations, not pixel by pixel.
+    Text needs a font rasterizer, so text() only counts the calls.
+    """
+
+    def __init__(self, width, height, background="#ffffff"):
+        self.width = width
+        self.height = height
+        self.background = parse_color(background)
+        self.layers = {} # name -> (pixels, mask)
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+        self.frame[:] = self.background
+        self.frames = 0
+        self.skipped_text = 0
+        self.dirty = None # (left, top, right, bottom) pixel box changed since present()
+
+    def _layer(self, name):
+        if name not in self.layers:
+            self.layers[name] = (np.zeros((self.height, self.width, 3), dtype=np.uint8),
+                                 np.zeros((self.height, self.width), dtype=bool))
+        return self.layers[name]
+
+    def _to_pixels(self, points):
+        """Turtle points -> float (column, row) arrays, with pixel centers at whole numbers."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return points[:, 0] + self.width / 2, self.height / 2 - points[:, 1]
+
+    def _set(self, layer, rows, columns, color):
+        """Sets pixels to one color, or to an (n, 3) array of colors, one per pixel."""
+        inside = (rows >= 0) & (rows < self.height) & (columns >= 0) & (columns < self.width)
+        pixels, mask = self._layer(layer)
+        rows, columns = rows[inside], columns[inside]
+        if len(rows) == 0:
+            return
+        if isinstance(color, np.ndarray) and color.ndim == 2:
+            pixels[rows, columns] = color[inside]
+        else:
+            pixels[rows, columns] = parse_color(color)
+        mask[rows, columns] = True
+        self.mark_dirty(int(columns.min()), int(rows.min()), int(columns.max()) + 1, int(rows.max()) + 1)
+
+    def mark_dirty(self, left, top, right, bottom):
+        """Adds a pixel box to the region present() has to composite again."""
+        if self.dirty is not None:
+            left, top = min(left, self.dirty[0]), min(top, self.dirty[1])
+            right, bottom = max(right, self.dirty[2]), max(bottom, self.dirty[3])
+        self.dirty = (left, top, right, bottom)
+
+    def _rasterize_lines(self, starts_x, starts_y, ends_x, ends_y, width):
+        """
+        Pixels covered by a batch of lines given in pixel coordinates.
+
+        Returns:
+            tuple: (rows, columns, line) arrays, `line` being the index of the
+            line each pixel belongs to.
+        """
+        # Sample every line at least once per pixel, all lines at once
+        dx, dy = ends_x - starts_x, ends_y - starts_y
+        steps = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) + 1
+        line = np.repeat(np.arange(len(dx)), steps)
+        first = np.cumsum(steps) - steps
+        t = (np.arange(len(line)) - first[line]) / np.maximum(steps[line] - 1, 1)
+        sample_x = np.rint(starts_x[line] + t * dx[line]).astype(np.int64)
+        sample_y = np.rint(starts_y[line] + t * dy[line]).astype(np.int64)
+
+        # Thick lines: stamp a disk of the pen's radius at every sample
+        radius = max(width / 2, 0.5)
+        reach = int(np.ceil(radius - 0.5))
+        offset_y, offset_x = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+        disk = offset_x ** 2 + offset_y ** 2 <= max(radius * radius, 0.25)
+        offset_x, offset_y = offset_x[disk], offset_y[disk]
+        return ((sample_y[:, None] + offset_y).ravel(), (sample_x[:, None] + offset_x).ravel(),
+                np.repeat(line, len(offset_x)))
+
+    def polyline(self, points, color, width=1, layer=DEFAULT_LAYER):
+        columns, rows = self._to_pixels(points)
+        if len(columns) < 2:
+            return
+        rows, columns, _ = self._rasterize_lines(columns[:-1], rows[:-1], columns[1:], rows[1:], width)
+        self._set(layer, rows, columns, color)
+
+    def segments(self, lines, buckets, palette, width=1, layer=DEFAULT_LAYER):
+        """
+        Rasterizes every line in one pass, then colors the pixels through a
+        lookup table: palette color of the bucket of the line they belong to.
+        """
+        lines = np.asarray(lines, dtype=np.float64).reshape(-1, 4)
+        if len(lines) == 0:
+            return
+        starts_x, starts_y = self._to_pixels(lines[:, :2])
+        ends_x, ends_y = self._to_pixels(lines[:, 2:])
+        rows, columns, line = self._rasterize_lines(starts_x, starts_y, ends_x, ends_y, width)
+        lookup = np.array([parse_color(color) for color in palette])
+        self._set(layer, rows, columns, lookup[np.asarray(buckets)[line]])
+
+    def polygon(self, points, fill, outline="", layer=DEFAULT_LAYER):
+        """Fills the polygon with the even-odd rule, one scanline crossing list for all rows."""
+        columns, rows = self._to_pixels(points)
+        if len(columns) < 3:
+            return
+        x0, y0 = columns, rows
+        x1, y1 = np.roll(columns, -1), np.roll(rows, -1)
+        # Pixel-center rows each edge crosses: first_row <= row < end_row
+        first_row = np.clip(np.ceil(np.minimum(y0, y1) - 0.5), 0, self.height).astype(np.int64)
+        end_row = np.clip(np.ceil(np.maximum(y0, y1) - 0.5), 0, self.height).astype(np.int64)
+        counts = end_row - first_row
+        if counts.sum() > 0:
+            edge = np.repeat(np.arange(len(x0)), counts)
+            row = first_row[edge] + (np.arange(len(edge)) - (np.cumsum(counts) - counts)[edge])
+            t = (row + 0.5 - y0[edge]) / (y1[edge] - y0[edge])
+            cross = x0[edge] + t * (x1[edge] - x0[edge])
+
+            # Sorted by row then x, crossings pair up into spans
+            order = np.lexsort((cross, row))
+            row, cross = row[order], cross[order]
+            span_rows = row[0::2]
+            span_starts = np.clip(np.ceil(cross[0::2] - 0.5), 0, self.width).astype(np.int64)
+            span_ends = np.clip(np.ceil(cross[1::2] - 0.5), 0, self.width).astype(np.int64)
+
+            # Paint the spans with one cumulative sum over +1/-1 markers
+            markers = np.zeros((self.height, self.width + 1), dtype=np.int32)
+            np.add.at(markers, (span_rows, span_starts), 1)
+            np.add.at(markers, (span_rows, span_ends), -1)
+            span_y, span_x = np.nonzero(np.cumsum(markers, axis=1)[:, :-1] > 0)
+            self._set(layer, span_y, span_x, fill)
+        if outline:
+            self.polyline(list(points) + [points[0]], outline, 1, layer)
+
+    def text(self, x, y, text, color, font=None, layer=DEFAULT_LAYER):
+        self.skipped_text += 1
+
+    def blit(self, pixels, x, y, layer=DEFAULT_LAYER):
+        height, width = pixels.shape[:2]
+        left = int(round(x + self.width / 2))
+        top = int(round(self.height / 2 - y))
+        # Clip the image to the raster
+        src_left, src_top = max(-left, 0), max(-top, 0)
+        dst_right, dst_bottom = min(left + width, self.width), min(top + height, self.height)
+        left, top = max(left, 0), max(top, 0)
+        if left >= dst_right or top >= dst_bottom:
+            return
+        layer_pixels, mask = self._layer(layer)
+        layer_pixels[top:dst_bottom, left:dst_right] = pixels[src_top:src_top + dst_bottom - top,
+                                                              src_left:src_left + dst_right - left, :3]
+        mask[top:dst_bottom, left:dst_right] = True
+        self.mark_dirty(left, top, dst_right, dst_bottom)
+
+    def clear(self, layer=None):
+        if layer is None:
+            self.layers.clear()
+        else:
+            self.layers.pop(layer, None)
+        self.mark_dirty(0, 0, self.width, self.height)
+
+    def present(self):
+        """
+        Composites the changed part of the frame.
+
+        Returns:
+            tuple: The (left, top, right, bottom) pixel box that changed, or
+            None if nothing was drawn since the previous call.
+        """
+        box, self.dirty = self.dirty, None
+        self.frames += 1
+        if box is None:
+            return None
+        left, top, right, bottom = box
+        frame = self.frame[top:bottom, left:right]
+        frame[:] = self.background
+        for pixels, mask in self.layers.values():
+            mask = mask[top:bottom, left:right]
+            frame[mask] = pixels[top:bottom, left:right][mask]
+        return box
+
+    def save(self, path):
+        """Writes the last presented frame as a binary PPM image."""
+        with open(path, "wb") as file:
+            file.write(b"P6 %d %d 255\n" % (self.width, self.height))
+            file.write(self.frame.tobytes())
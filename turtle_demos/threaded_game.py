@@ -0,0 +1,223 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from .vector_env import BACKWARD, FORWARD, LEFT, RIGHT, VectorEnv
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+#
+# Runs the reach-the-target game's simulation in a worker thread, away from
+# Tk: the worker steps the game rules (vector_env.py) at its own fixed rate
+# and publishes immutable snapshots, Tk only draws the latest snapshot from an
+# ontimer() loop, and input events reach the worker through a queue. A slow
+# simulation then makes the game run slower, but never delays input handling
+# or redraws:
+#   python -m turtle_demos keyhold --threaded --sim-load 80
+
+
+# --- Configuration ---
+FRAME_MS = 16 # Delay between redraws (about 60 FPS), independent of the simulation rate
+
+# One published state of the game; tuples are immutable, so readers can keep them
+Snapshot = namedtuple("Snapshot", "tick game x y heading target_x target_y moving_to_click wins step_ms")
+
+
+# --- Snapshot Handoff ---
+
+class SnapshotBuffer:
+    """
+    A double buffer for snapshots from one writer thread. publish() fills the
+    back slot and then flips `front`; both are single reference assignments,
+    which are atomic in CPython, so neither side locks or waits and a reader
+    always gets a complete snapshot.
+    """
+
+    def __init__(self, snapshot):
+        self.slots = [snapshot, snapshot]
+        self.front = 0
+
+    def publish(self, snapshot):
+        back = 1 - self.front
+        self.slots[back] = snapshot
+        self.front = back
+
+    def latest(self):
+        return self.slots[self.front]
+
+class SimulationThread(threading.Thread):
+    """
+    Calls step(events) every `tick` seconds in a daemon thread, with the
+    events sent since the previous call, and publishes what it returns.
+    When a step takes longer than `tick`, the next one starts right away
+    and the schedule restarts from there, so an overloaded simulation runs
+    slower instead of building a backlog.
+    """
+
+    def __init__(self, step, initial, tick):
+        super().__init__(daemon=True)
+        self.step = step
+        self.tick = tick
+        self.events = queue.SimpleQueue()
+        self.snapshots = SnapshotBuffer(initial)
+        self.stopped = threading.Event()
+        self.overruns = 0 # Steps that took longer than `tick`
+
+    def send(self, *event):
+        """Queues an input event for the next step; safe to call from Tk callbacks."""
+        self.events.put(event)
+
+    def run(self):
+        deadline = time.perf_counter()
+        while not self.stopped.is_set():
+            events = []
+            while not self.events.empty():
+                events.append(self.events.get())
+            self.snapshots.publish(self.step(events))
+            deadline += self.tick
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                self.stopped.wait(delay)
+            else:
+                self.overruns += 1
+                deadline = time.perf_counter()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+# --- Game Simulation ---
+
+class GameSimulation:
+    """
+    One reach-the-target game as a VectorEnv of size 1. Events are
+    ("press", key bit), ("release", key bit), ("click", x, y) and ("reset",).
+    A reached target starts a new game at once.
+    """
+
+    def __init__(self, seed=None, load_ms=0):
+        """
+        Args:
+            seed (int): Seed for the target positions.
+            load_ms (float): Extra busy work per step, to try out an
+                overloaded simulation.
+        """
+        self.env = VectorEnv(1, seed=seed)
+        self.keys = 0 # Key bits currently held
+        self.tick = 0
+        self.game = 0 # Games started, counting restarts and reached targets
+        self.load_ms = load_ms
+
+    def step(self, events):
+        started = time.perf_counter()
+        for event in events:
+            if event[0] == "press":
+                self.keys |= event[1]
+            elif event[0] == "release":
+                self.keys &= ~event[1]
+            elif event[0] == "click":
+                self.env.click([0], event[1], event[2])
+                self.keys = 0 # As in handle_click(): the walk takes over from the keys
+            elif event[0] == "reset":
+                self.env.reset()
+                self.game += 1
+        _, _, dones = self.env.step(self.keys)
+        self.game += int(dones[0])
+        self.tick += 1
+        while (time.perf_counter() - started) * 1000 < self.load_ms:
+            pass
+        return self.snapshot((time.perf_counter() - started) * 1000)
+
+    def snapshot(self, step_ms=0.0):
+        env = self.env
+        return Snapshot(self.tick, self.game, float(env.x[0]), float(env.y[0]), float(env.heading[0]),
+                        float(env.target_x[0]), float(env.target_y[0]), bool(env.moving_to_click[0]),
+                        int(env.wins[0]), step_ms)
+
+
+# --- Rendering ---
+
+class SnapshotRenderer:
+    """Draws the latest snapshot with a game module's turtles and HUD (see keyhold.py)."""
+
+    def __init__(self, game, thread):
+        self.game = game
+        self.thread = thread
+        self.shown = None # Snapshot currently on screen
+        self.frame_ms = 0.0 # Time the last frame took
+        self.max_frame_ms = 0.0
+
+    def render(self):
+        started = time.perf_counter()
+        snapshot = self.thread.snapshots.latest()
+        if snapshot is not self.shown:
+            self.draw(snapshot)
+            self.shown = snapshot
+        self.game.hud.tick()
+        self.game.screen.update()
+        self.frame_ms = (time.perf_counter() - started) * 1000
+        self.max_frame_ms = max(self.max_frame_ms, self.frame_ms)
+
+    def draw(self, snapshot):
+        game = self.game
+        player = game.sketch_turtle
+        previous = self.shown
+        if previous is None or snapshot.game != previous.game:
+            # A new game: start the path again and show the new target
+            game.score = snapshot.wins
+            player.penup()
+            player.clear()
+            player.goto(snapshot.x, snapshot.y)
+            player.pendown()
+            game.target_turtle.goto(snapshot.target_x, snapshot.target_y)
+            game.hud.reset_clock()
+        elif snapshot.moving_to_click != previous.moving_to_click:
+            # The pen is up while walking to a click, as in the game
+            player.penup() if snapshot.moving_to_click else player.pendown()
+        player.setheading(snapshot.heading)
+        player.goto(snapshot.x, snapshot.y)
+
+    def loop(self):
+        self.render()
+        self.game.screen.ontimer(self.loop, FRAME_MS)
+
+
+# --- Running a Game ---
+
+def start(game, seed=None, load_ms=0, clicks_walk=True, headless=False):
+    """
+    Opens the game's window with the simulation in a worker thread and binds
+    the input to it.
+
+    Args:
+        game: keyhold or mouseclick (any module with their screen, turtles,
+            hud and GAME_TICK).
+        clicks_walk (bool): Clicks walk to the clicked point (mouseclick);
+            otherwise they restart the game (keyhold).
+        headless (bool): Use the game's recorder screen (see headless.py).
+
+    Returns:
+        tuple: (SimulationThread, SnapshotRenderer), already running.
+    """
+    game.create_screen(headless=headless, seed=seed)
+    game.setup_game()
+    simulation = GameSimulation(seed, load_ms)
+    thread = SimulationThread(simulation.step, simulation.snapshot(), game.GAME_TICK / 1000)
+    renderer = SnapshotRenderer(game, thread)
+
+    screen = game.screen
+    for key, bit in (("Up", FORWARD), ("Down", BACKWARD), ("Left", LEFT), ("Right", RIGHT)):
+        screen.onkeypress(lambda bit=bit: thread.send("press", bit), key)
+        screen.onkeyrelease(lambda bit=bit: thread.send("release", bit), key)
+    screen.onkey(lambda: thread.send("reset"), "c")
+    screen.onkey(lambda: thread.send("reset"), "C")
+    if clicks_walk:
+        screen.onclick(lambda x, y: thread.send("click", x, y))
+    else:
+        screen.onclick(lambda x, y: thread.send("reset"))
+    screen.listen()
+
+    thread.start()
+    renderer.loop()
+    return thread, renderer
@@ -0,0 +1,205 @@
+import argparse
+import time
+
+import numpy as np
+
+from .keyhold import MOVE_DISTANCE, SCREEN_HEIGHT, SCREEN_WIDTH, SPAWN_KEEP_OUT, TURN_ANGLE, WIN_DISTANCE
+
+# NOTE: NumPy is NOT part of Python's standard library (pip install numpy).
+#
+# The reach-the-target game of 5.Turtle_key_hold.py and 6.Turtle_mouse_click.py
+# for many games at once, without windows: one step() runs one game_loop()
+# tick of every game with NumPy, for agents and tuning sweeps.
+#   python -m turtle_demos.vector_env --games 10000 --steps 1000 --policy seek
+
+
+# --- Actions ---
+# Keys held during a step, as bits of an integer per game
+FORWARD = 1
+BACKWARD = 2
+LEFT = 4
+RIGHT = 8
+
+TARGET_MARGIN = 50 # Targets spawn at least this far inside the screen edges, as in setup_game()
+
+
+# --- Batch Environment ---
+
+class VectorEnv:
+    """
+    `count` independent games in arrays. A game starts with the player at
+    (0, 0) heading 90 degrees and a target outside SPAWN_KEEP_OUT of it;
+    reaching the target ends it with a reward of 1, and it starts again at
+    once with a new target (auto-reset).
+
+    Attributes (arrays with one entry per game):
+        x, y, heading: The player, heading in degrees like turtle.heading().
+        target_x, target_y: The target.
+        click_x, click_y, moving_to_click: The point a click is walking to.
+        episode_steps: Steps since the game's last reset.
+        wins: Targets reached so far.
+    """
+
+    def __init__(self, count, seed=None):
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.heading = np.zeros(count)
+        self.target_x = np.zeros(count)
+        self.target_y = np.zeros(count)
+        self.click_x = np.zeros(count)
+        self.click_y = np.zeros(count)
+        self.moving_to_click = np.zeros(count, dtype=bool)
+        self.episode_steps = np.zeros(count, dtype=np.int64)
+        self.wins = np.zeros(count, dtype=np.int64)
+        self.total_steps = 0 # Game steps run by step(), summed over games
+        self.step_seconds = 0.0 # Time spent in step()
+        self.reset()
+
+    # --- Resetting ---
+
+    def reset(self, games=None):
+        """
+        Starts new games, like setup_game(): all of them, or those selected
+        by `games` (a boolean mask or an index array).
+
+        Returns:
+            numpy.ndarray: The observation, see observe().
+        """
+        if games is None:
+            games = np.arange(self.count)
+        elif np.asarray(games).dtype == bool:
+            games = np.flatnonzero(games)
+        self.x[games] = 0.0
+        self.y[games] = 0.0
+        self.heading[games] = 90.0
+        self.moving_to_click[games] = False
+        self.episode_steps[games] = 0
+        self.target_x[games], self.target_y[games] = self.spawn_targets(len(games))
+        return self.observe()
+
+    def spawn_targets(self, n):
+        """Uniform positions inside the margins and outside the keep-out circle around the start."""
+        half_width = SCREEN_WIDTH / 2 - TARGET_MARGIN
+        half_height = SCREEN_HEIGHT / 2 - TARGET_MARGIN
+        xs = self.rng.uniform(-half_width, half_width, n)
+        ys = self.rng.uniform(-half_height, half_height, n)
+        redo = np.flatnonzero(xs * xs + ys * ys < SPAWN_KEEP_OUT ** 2)
+        while len(redo):
+            xs[redo] = self.rng.uniform(-half_width, half_width, len(redo))
+            ys[redo] = self.rng.uniform(-half_height, half_height, len(redo))
+            redo = redo[xs[redo] ** 2 + ys[redo] ** 2 < SPAWN_KEEP_OUT ** 2]
+        return xs, ys
+
+    # --- Stepping ---
+
+    def click(self, games, xs, ys):
+        """
+        Clicks in some games, like handle_click() during a game: they walk
+        to (xs, ys) and ignore the keys until they arrive.
+        """
+        self.click_x[games] = xs
+        self.click_y[games] = ys
+        self.moving_to_click[games] = True
+
+    def step(self, keys, clicks=None):
+        """
+        Runs one game_loop() tick of every game.
+
+        Args:
+            keys: Integer array of FORWARD | BACKWARD | LEFT | RIGHT bits
+                held in every game (or one integer for all games).
+            clicks: Optional (count, 2) array of click points; rows with NaN
+                are games without a click this step.
+
+        Returns:
+            tuple: (observation, rewards, dones). A done game has already
+            been reset, so its observation is the new game's first.
+        """
+        started = time.perf_counter()
+        keys = np.broadcast_to(np.asarray(keys, dtype=np.int64), (self.count,))
+        if clicks is not None:
+            clicked = np.flatnonzero(~np.isnan(clicks[:, 0]))
+            self.click(clicked, clicks[clicked, 0], clicks[clicked, 1])
+
+        walking = self.moving_to_click
+        # 1. Walking to a click (takes priority over the keys)
+        dx = self.click_x - self.x
+        dy = self.click_y - self.y
+        arrived = walking & (np.hypot(dx, dy) <= MOVE_DISTANCE)
+        stepping = walking & ~arrived
+        self.heading = np.where(stepping, np.degrees(np.arctan2(dy, dx)) % 360, self.heading)
+        self.x = np.where(arrived, self.click_x, self.x)
+        self.y = np.where(arrived, self.click_y, self.y)
+        self.moving_to_click = stepping
+
+        # 2. Held keys: forward and backward, then turns (which do not count as moves)
+        keyboard = ~walking
+        forward = keyboard & (keys & FORWARD != 0)
+        backward = keyboard & (keys & BACKWARD != 0)
+        distance = MOVE_DISTANCE * (stepping.astype(np.int64) + forward - backward)
+        radians = np.radians(self.heading)
+        self.x = self.x + distance * np.cos(radians)
+        self.y = self.y + distance * np.sin(radians)
+        turn = TURN_ANGLE * ((keyboard & (keys & LEFT != 0)).astype(np.int64) - (keyboard & (keys & RIGHT != 0)))
+        self.heading = (self.heading + turn) % 360
+
+        # 3. Wins, checked only for games that moved, as in check_win()
+        moved = walking | forward | backward
+        dones = moved & (np.hypot(self.target_x - self.x, self.target_y - self.y) < WIN_DISTANCE)
+        self.wins += dones
+        self.episode_steps += 1
+        if dones.any():
+            self.reset(dones)
+        self.total_steps += self.count
+        self.step_seconds += time.perf_counter() - started
+        return self.observe(), dones.astype(np.float64), dones
+
+    def observe(self):
+        """Returns a (count, 5) array of x, y, heading, target_x, target_y."""
+        return np.column_stack([self.x, self.y, self.heading, self.target_x, self.target_y])
+
+    def steps_per_second(self):
+        """Game steps per second of step() time, over all games."""
+        return self.total_steps / max(self.step_seconds, 1e-12)
+
+
+# --- Example Policies ---
+
+def random_keys(env, rng):
+    """Random held keys for every game."""
+    return rng.integers(0, 16, env.count)
+
+def seek_keys(env, rng=None):
+    """Turns toward the target and holds Forward when roughly facing it."""
+    bearing = np.degrees(np.arctan2(env.target_y - env.y, env.target_x - env.x))
+    error = (bearing - env.heading + 180) % 360 - 180 # -180 to 180, positive: target on the left
+    keys = np.where(error > TURN_ANGLE / 2, LEFT, np.where(error < -TURN_ANGLE / 2, RIGHT, 0))
+    return keys | np.where(np.abs(error) < 45, FORWARD, 0)
+
+POLICIES = {"random": random_keys, "seek": seek_keys}
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m turtle_demos.vector_env",
+                                     description="Step many headless reach-the-target games at once.")
+    parser.add_argument("--games", type=int, default=10000, help="Games stepped together")
+    parser.add_argument("--steps", type=int, default=1000, help="Steps of every game")
+    parser.add_argument("--policy", choices=list(POLICIES), default="seek")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    env = VectorEnv(args.games, seed=args.seed)
+    policy = POLICIES[args.policy]
+    rng = np.random.default_rng(args.seed + 1)
+    for _ in range(args.steps):
+        env.step(policy(env, rng))
+    print(f"{env.total_steps} game steps, {int(env.wins.sum())} wins, "
+          f"{env.steps_per_second():,.0f} steps/s ({env.step_seconds:.2f}s in step()).")
+
+
+if __name__ == "__main__":
+    main()